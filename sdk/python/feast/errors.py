@@ -369,6 +369,13 @@ class AwsAPIGatewayDoesNotExist(Exception):
         )
 
 
+class DynamoDBUnprocessedKeysError(Exception):
+    def __init__(self, table_name: str, num_keys: int, attempts: int):
+        super().__init__(
+            f"DynamoDB left {num_keys} keys of table {table_name} unprocessed after {attempts} BatchGetItem calls."
+        )
+
+
 class IncompatibleRegistryStoreClass(Exception):
     def __init__(self, actual_class: str, expected_class: str):
         super().__init__(
@@ -39,8 +39,13 @@ def get_app(store: "feast.FeatureStore"):
     async def get_body(request: Request):
         return await request.body()
 
+    @app.on_event("shutdown")
+    async def shutdown():
+        # The asynchronous online store clients are bound to the event loop of the server.
+        await store.close_async()
+
     @app.post("/get-online-features")
-    def get_online_features(body=Depends(get_body)):
+    async def get_online_features(body=Depends(get_body)):
         try:
             # Validate and parse the request data into GetOnlineFeaturesRequest Protobuf object
             request_proto = GetOnlineFeaturesRequest()
@@ -61,12 +66,13 @@ def get_app(store: "feast.FeatureStore"):
             if any(batch_size != num_entities for batch_size in batch_sizes):
                 raise HTTPException(status_code=500, detail="Uneven number of columns")
 
-            response_proto = store._get_online_features(
+            response = await store._get_online_features_async(
                 features=features,
                 entity_values=request_proto.entities,
                 full_feature_names=full_feature_names,
                 native_entity_values=False,
-            ).proto
+            )
+            response_proto = response.proto
 
             # Convert the Protobuf object to JSON and return it
             return MessageToDict(  # type: ignore
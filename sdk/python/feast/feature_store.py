@@ -11,20 +11,27 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import asyncio
+import contextvars
 import copy
 import itertools
 import time
 from multiprocess import Process, Queue
 import os
 import warnings
-from collections import Counter, defaultdict
+from collections import Counter, OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from pathlib import Path
 from itertools import groupby
+from threading import Lock
 from typing import (
     Any,
     Callable,
     Dict,
+    FrozenSet,
+    Hashable,
     Iterable,
     List,
     Mapping,
@@ -32,10 +39,12 @@ from typing import (
     Sequence,
     Set,
     Tuple,
+    TypeVar,
     Union,
     cast,
 )
 
+import numpy as np
 import pandas as pd
 import pyarrow as pa
 from colorama import Fore, Style
@@ -84,7 +93,12 @@ from feast.infra.registry.base_registry import BaseRegistry
 from feast.infra.registry.registry import Registry
 from feast.infra.registry.sql import SqlRegistry
 from feast.on_demand_feature_view import OnDemandFeatureView
-from feast.online_response import OnlineResponse
+from feast.online_response import (
+    EVENT_TIMESTAMP_TYPE,
+    ArrowOnlineResponse,
+    OnlineResponse,
+    proto_values_to_arrow,
+)
 from feast.protos.feast.serving.ServingService_pb2 import (
     FieldStatus,
     GetOnlineFeaturesResponse,
@@ -180,6 +194,15 @@ class FeatureStore:
 
         self._provider = get_provider(self.config)
 
+        self._online_retrieval_plans: "OrderedDict[Hashable, _OnlineRetrievalPlan]" = (
+            OrderedDict()
+        )
+        self._online_retrieval_plans_version: Optional[Hashable] = None
+        self._online_retrieval_plans_lock = Lock()
+        self._online_read_executor: Optional[ThreadPoolExecutor] = None
+        self._online_read_executor_size = 0
+        self._online_read_executor_lock = Lock()
+
     @log_exceptions
     def version(self) -> str:
         """Returns the version of the current Feast SDK/CLI."""
@@ -213,6 +236,7 @@ class FeatureStore:
         refresh_registry() will become the only way to update the cached registry. If the TTL is set to a value
         greater than 0, then once the cache becomes stale (more time than the TTL has passed), a new cache will be
         downloaded synchronously, which may increase latencies if the triggering method is get_online_features().
+        Setting the registry cache_mode to "thread" refreshes the cache in the background instead.
         """
         registry_config = self.config.registry
         registry = Registry(
@@ -221,6 +245,9 @@ class FeatureStore:
         registry.refresh(self.config.project)
 
         self._registry = registry
+        with self._online_retrieval_plans_lock:
+            self._online_retrieval_plans.clear()
+            self._online_retrieval_plans_version = None
 
     @log_exceptions_and_usage
     def list_entities(self, allow_cache: bool = False) -> List[Entity]:
@@ -297,6 +324,7 @@ class FeatureStore:
             self.project, allow_cache=allow_cache
         ):
             if hide_dummy_entity and fv.entities[0] == DUMMY_ENTITY_NAME:
+                fv = _copy_feature_view(fv)
                 fv.entities = []
                 fv.entity_columns = []
             feature_views.append(fv)
@@ -312,6 +340,7 @@ class FeatureStore:
             self.project, allow_cache=allow_cache
         ):
             if hide_dummy_entity and sfv.entities[0] == DUMMY_ENTITY_NAME:
+                sfv = _copy_feature_view(sfv)
                 sfv.entities = []
                 sfv.entity_columns = []
             stream_feature_views.append(sfv)
@@ -423,6 +452,7 @@ class FeatureStore:
             name, self.project, allow_cache=allow_registry_cache
         )
         if hide_dummy_entity and feature_view.entities[0] == DUMMY_ENTITY_NAME:
+            feature_view = _copy_feature_view(feature_view)
             feature_view.entities = []
         return feature_view
 
@@ -457,6 +487,7 @@ class FeatureStore:
             name, self.project, allow_cache=allow_registry_cache
         )
         if hide_dummy_entity and stream_feature_view.entities[0] == DUMMY_ENTITY_NAME:
+            stream_feature_view = _copy_feature_view(stream_feature_view)
             stream_feature_view.entities = []
         return stream_feature_view
 
@@ -1330,7 +1361,7 @@ class FeatureStore:
             len(feature_views_to_materialize),
             self.config.online_store.type,
         )
-        # TODO paging large loads
+        materializations = []
         for feature_view in feature_views_to_materialize:
             start_date = feature_view.most_recent_end_time
             if start_date is None:
@@ -1349,35 +1380,106 @@ class FeatureStore:
                         "the start date will be set to 1 year before the current time."
                     )
                     start_date = datetime.utcnow() - timedelta(weeks=52)
-            provider = self._get_provider()
             print(
                 f"{Style.BRIGHT + Fore.GREEN}{feature_view.name}{Style.RESET_ALL}"
                 f" from {Style.BRIGHT + Fore.GREEN}{start_date.replace(microsecond=0).astimezone()}{Style.RESET_ALL}"
                 f" to {Style.BRIGHT + Fore.GREEN}{end_date.replace(microsecond=0).astimezone()}{Style.RESET_ALL}:"
             )
+            materializations.append(
+                (
+                    feature_view,
+                    utils.make_tzaware(start_date),
+                    utils.make_tzaware(end_date),
+                )
+            )
+
+        def tqdm_builder(length):
+            return tqdm(total=length, ncols=100)
+
+        provider = self._get_provider()
+        if not self.config.materialization_chunk_size:
+            self._materialize_feature_views(provider, materializations, tqdm_builder)
+            return
+
+        for feature_view, start_date, end_date in materializations:
+            self._materialize_in_chunks(
+                provider, feature_view, start_date, end_date, tqdm_builder
+            )
 
-            def tqdm_builder(length):
-                return tqdm(total=length, ncols=100)
+    def _materialize_feature_views(
+        self,
+        provider: Provider,
+        materializations: List[Tuple[FeatureView, datetime, datetime]],
+        tqdm_builder: Callable[[int], tqdm],
+    ) -> None:
+        """
+        Materializes several feature views in a single call to the provider, which may run them concurrently,
+        then records each feature view that was written in the registry.
+        """
+        errors = provider.materialize_feature_views(
+            self.config, materializations, self._registry, self.project, tqdm_builder
+        )
+        for (feature_view, start_date, end_date), error in zip(
+            materializations, errors
+        ):
+            if error is None:
+                self._registry.apply_materialization(
+                    feature_view, self.project, start_date, end_date
+                )
+        for error in errors:
+            if error is not None:
+                raise error
+
+    def _materialize_in_chunks(
+        self,
+        provider: Provider,
+        feature_view: FeatureView,
+        start_date: datetime,
+        end_date: datetime,
+        tqdm_builder: Callable[[int], tqdm],
+    ) -> None:
+        """
+        Materializes a feature view over consecutive chunks of `materialization_chunk_size`, recording each
+        chunk in the registry as soon as it and all the chunks before it have been written.
 
-            start_date = utils.make_tzaware(start_date)
-            end_date = utils.make_tzaware(end_date)
+        Chunks run concurrently when `materialization_chunk_concurrency` is greater than 1, but are still
+        checkpointed in order, so that an interrupted run resumes after the last contiguous chunk written.
+        """
+        chunks = _materialization_chunks(
+            start_date, end_date, self.config.materialization_chunk_size
+        )
 
+        def materialize_chunk(chunk: Tuple[datetime, datetime]) -> None:
             provider.materialize_single_feature_view(
                 config=self.config,
                 feature_view=feature_view,
-                start_date=start_date,
-                end_date=end_date,
+                start_date=chunk[0],
+                end_date=chunk[1],
                 registry=self._registry,
                 project=self.project,
                 tqdm_builder=tqdm_builder,
             )
 
-            self._registry.apply_materialization(
-                feature_view,
-                self.project,
-                start_date,
-                end_date,
-            )
+        concurrency = min(self.config.materialization_chunk_concurrency, len(chunks))
+        if concurrency <= 1:
+            for chunk in chunks:
+                materialize_chunk(chunk)
+                self._registry.apply_materialization(
+                    feature_view, self.project, chunk[0], chunk[1]
+                )
+            return
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            futures = [executor.submit(materialize_chunk, chunk) for chunk in chunks]
+            try:
+                for chunk, future in zip(chunks, futures):
+                    future.result()
+                    self._registry.apply_materialization(
+                        feature_view, self.project, chunk[0], chunk[1]
+                    )
+            finally:
+                for future in futures:
+                    future.cancel()
 
     @log_exceptions_and_usage
     def materialize(
@@ -1427,32 +1529,22 @@ class FeatureStore:
             self.config.online_store.type,
         )
         # TODO paging large loads
+        start_date = utils.make_tzaware(start_date)
+        end_date = utils.make_tzaware(end_date)
         for feature_view in feature_views_to_materialize:
-            provider = self._get_provider()
             print(f"{Style.BRIGHT + Fore.GREEN}{feature_view.name}{Style.RESET_ALL}:")
 
-            def tqdm_builder(length):
-                return tqdm(total=length, ncols=100)
-
-            start_date = utils.make_tzaware(start_date)
-            end_date = utils.make_tzaware(end_date)
+        def tqdm_builder(length):
+            return tqdm(total=length, ncols=100)
 
-            provider.materialize_single_feature_view(
-                config=self.config,
-                feature_view=feature_view,
-                start_date=start_date,
-                end_date=end_date,
-                registry=self._registry,
-                project=self.project,
-                tqdm_builder=tqdm_builder,
-            )
-
-            self._registry.apply_materialization(
-                feature_view,
-                self.project,
-                start_date,
-                end_date,
-            )
+        self._materialize_feature_views(
+            self._get_provider(),
+            [
+                (feature_view, start_date, end_date)
+                for feature_view in feature_views_to_materialize
+            ],
+            tqdm_builder,
+        )
 
     @log_exceptions_and_usage
     def push(
@@ -1575,7 +1667,8 @@ class FeatureStore:
         features: Union[List[str], FeatureService],
         entity_rows: List[Dict[str, Any]],
         full_feature_names: bool = False,
-    ) -> OnlineResponse:
+        output: str = "proto",
+    ) -> Union[OnlineResponse, ArrowOnlineResponse]:
         """
         Retrieves the latest online feature data.
 
@@ -1595,9 +1688,13 @@ class FeatureStore:
             full_feature_names: If True, feature names will be prefixed with the corresponding feature view name,
                 changing them from the format "feature" to "feature_view__feature" (e.g. "daily_transactions"
                 changes to "customer_fv__daily_transactions").
+            output: The format of the response. With "proto" (the default), an OnlineResponse backed by Protobuf
+                values is returned. With "arrow", an ArrowOnlineResponse backed by Arrow columns is returned, which
+                is built from the online store data without creating a Protobuf value per feature value, and can be
+                converted with `to_arrow`, `to_numpy` or `to_df`.
 
         Returns:
-            OnlineResponse containing the feature data in records.
+            OnlineResponse or ArrowOnlineResponse containing the feature data in records.
 
         Raises:
             Exception: No entity with the specified name exists.
@@ -1617,21 +1714,77 @@ class FeatureStore:
             ... )
             >>> online_response_dict = online_response.to_dict()
         """
-        columnar: Dict[str, List[Any]] = {k: [] for k in entity_rows[0].keys()}
-        for entity_row in entity_rows:
-            for key, value in entity_row.items():
-                try:
-                    columnar[key].append(value)
-                except KeyError as e:
-                    raise ValueError("All entity_rows must have the same keys.") from e
-
         return self._get_online_features(
             features=features,
-            entity_values=columnar,
+            entity_values=_entity_rows_to_columnar(entity_rows),
+            full_feature_names=full_feature_names,
+            native_entity_values=True,
+            output=output,
+        )
+
+    async def get_online_features_async(
+        self,
+        features: Union[List[str], FeatureService],
+        entity_rows: List[Dict[str, Any]],
+        full_feature_names: bool = False,
+        output: str = "proto",
+    ) -> Union[OnlineResponse, ArrowOnlineResponse]:
+        """
+        Retrieves the latest online feature data asynchronously.
+
+        This is the asynchronous counterpart of `get_online_features`, and takes the same arguments. The feature
+        views involved are read from the online store concurrently, without blocking the event loop when the online
+        store implements `online_read_async` natively.
+
+        Args:
+            features: The list of features that should be retrieved from the online store. These features can be
+                specified either as a list of string feature references or as a feature service. String feature
+                references must have format "feature_view:feature", e.g. "customer_fv:daily_transactions".
+            entity_rows: A list of dictionaries where each key-value is an entity-name, entity-value pair.
+            full_feature_names: If True, feature names will be prefixed with the corresponding feature view name,
+                changing them from the format "feature" to "feature_view__feature" (e.g. "daily_transactions"
+                changes to "customer_fv__daily_transactions").
+            output: The format of the response, either "proto" (the default) or "arrow".
+
+        Returns:
+            OnlineResponse or ArrowOnlineResponse containing the feature data in records.
+
+        Raises:
+            Exception: No entity with the specified name exists.
+        """
+        return await self._get_online_features_async(
+            features=features,
+            entity_values=_entity_rows_to_columnar(entity_rows),
             full_feature_names=full_feature_names,
             native_entity_values=True,
+            output=output,
         )
 
+    def close(self) -> None:
+        """
+        Shuts down the thread pool reading feature views concurrently, once the reads in progress are done,
+        and releases the resources kept by the provider across materializations, such as worker processes.
+
+        The pool is created again if `get_online_features` is called afterwards.
+        """
+        with self._online_read_executor_lock:
+            executor, self._online_read_executor = self._online_read_executor, None
+        if executor is not None:
+            executor.shutdown()
+        self._get_provider().close()
+
+    async def close_async(self) -> None:
+        """
+        Closes the asynchronous online store clients opened in the running event loop, and shuts down the thread
+        pool reading feature views concurrently like `close`.
+
+        Online stores which read natively with `get_online_features_async` open a client per event loop, since
+        asynchronous clients can't be shared across loops. This should be awaited before the loop is closed, e.g.
+        at the end of the coroutine passed to `asyncio.run`.
+        """
+        await self._get_provider().close_async()
+        self.close()
+
     def _get_online_features(
         self,
         features: Union[List[str], FeatureService],
@@ -1640,41 +1793,125 @@ class FeatureStore:
         ],
         full_feature_names: bool = False,
         native_entity_values: bool = True,
-    ):
+        output: str = "proto",
+    ) -> Union[OnlineResponse, ArrowOnlineResponse]:
+        request = self._prepare_online_request(
+            features, entity_values, full_feature_names, native_entity_values, output
+        )
+
+        provider = self._get_provider()
+        executor = (
+            self._get_online_read_executor() if len(request.table_reads) > 1 else None
+        )
+        if executor is None:
+            # Online stores may read all the feature views in a single round trip.
+            read_rows = provider.online_read_many(
+                config=self.config,
+                reads=[
+                    (
+                        table_read.table,
+                        _entity_key_protos(table_read.entity_rows),
+                        table_read.requested_features,
+                    )
+                    for table_read in request.table_reads
+                ],
+            )
+        else:
+            # Read the feature views concurrently, each in a copy of the current context so that
+            # usage tracking and tracing spans are attributed to this request.
+            futures = [
+                executor.submit(
+                    contextvars.copy_context().run,
+                    self._online_read,
+                    table_read.entity_rows,
+                    provider,
+                    table_read.requested_features,
+                    table_read.table,
+                )
+                for table_read in request.table_reads
+            ]
+            read_rows = [future.result() for future in futures]
+        return self._complete_online_request(request, read_rows)
+
+    def _get_online_read_executor(self) -> Optional[ThreadPoolExecutor]:
+        """Returns the thread pool reading feature views concurrently, or None if reads are sequential."""
+        concurrency = self.config.online_read_concurrency
+        if concurrency <= 1:
+            return None
+        with self._online_read_executor_lock:
+            executor = self._online_read_executor
+            if executor is None or self._online_read_executor_size != concurrency:
+                if executor is not None:
+                    # The reads already submitted to the previous pool still complete.
+                    executor.shutdown(wait=False)
+                self._online_read_executor = ThreadPoolExecutor(
+                    max_workers=concurrency, thread_name_prefix="feast-online-read"
+                )
+                self._online_read_executor_size = concurrency
+            return self._online_read_executor
+
+    async def _get_online_features_async(
+        self,
+        features: Union[List[str], FeatureService],
+        entity_values: Mapping[
+            str, Union[Sequence[Any], Sequence[Value], RepeatedValue]
+        ],
+        full_feature_names: bool = False,
+        native_entity_values: bool = True,
+        output: str = "proto",
+    ) -> Union[OnlineResponse, ArrowOnlineResponse]:
+        request = self._prepare_online_request(
+            features, entity_values, full_feature_names, native_entity_values, output
+        )
+
+        provider = self._get_provider()
+        read_rows = await asyncio.gather(
+            *[
+                self._online_read_async(
+                    table_read.entity_rows,
+                    provider,
+                    table_read.requested_features,
+                    table_read.table,
+                )
+                for table_read in request.table_reads
+            ]
+        )
+        return self._complete_online_request(request, read_rows)
+
+    def _prepare_online_request(
+        self,
+        features: Union[List[str], FeatureService],
+        entity_values: Mapping[
+            str, Union[Sequence[Any], Sequence[Value], RepeatedValue]
+        ],
+        full_feature_names: bool,
+        native_entity_values: bool,
+        output: str,
+    ) -> "_OnlineRequest":
+        """Does everything needed to answer an online request, up to reading from the OnlineStore.
+
+        The result holds the unique entities to read for every feature view, along with the response
+        that `_complete_online_request` populates once they have been read.
+        """
+        if output not in ("proto", "arrow"):
+            raise ValueError(
+                f"Unsupported output format '{output}', expected 'proto' or 'arrow'."
+            )
+
         # Extract Sequence from RepeatedValue Protobuf.
         entity_value_lists: Dict[str, Union[List[Any], List[Value]]] = {
             k: list(v) if isinstance(v, Sequence) else list(v.val)
             for k, v in entity_values.items()
         }
 
-        _feature_refs = self._get_features(features, allow_cache=True)
-        (
-            requested_feature_views,
-            requested_request_feature_views,
-            requested_on_demand_feature_views,
-        ) = self._get_feature_views_to_use(
-            features=features, allow_cache=True, hide_dummy_entity=False
-        )
-
-        if requested_request_feature_views:
-            warnings.warn(
-                "Request feature view is deprecated. "
-                "Please use request data source instead",
-                DeprecationWarning,
-            )
-
-        (
-            entity_name_to_join_key_map,
-            entity_type_map,
-            join_keys_set,
-        ) = self._get_entity_maps(requested_feature_views)
+        plan = self._get_online_retrieval_plan(features, full_feature_names)
 
         entity_proto_values: Dict[str, List[Value]]
         if native_entity_values:
             # Convert values to Protobuf once.
             entity_proto_values = {
                 k: python_values_to_proto_values(
-                    v, entity_type_map.get(k, ValueType.UNKNOWN)
+                    v, plan.entity_type_map.get(k, ValueType.UNKNOWN)
                 )
                 for k, v in entity_value_lists.items()
             }
@@ -1682,56 +1919,38 @@ class FeatureStore:
             entity_proto_values = entity_value_lists
 
         num_rows = _validate_entity_values(entity_proto_values)
-        _validate_feature_refs(_feature_refs, full_feature_names)
-        (
-            grouped_refs,
-            grouped_odfv_refs,
-            grouped_request_fv_refs,
-            _,
-        ) = _group_feature_refs(
-            _feature_refs,
-            requested_feature_views,
-            requested_request_feature_views,
-            requested_on_demand_feature_views,
-        )
-        set_usage_attribute("odfv", bool(grouped_odfv_refs))
-        set_usage_attribute("request_fv", bool(grouped_request_fv_refs))
+        set_usage_attribute("odfv", bool(plan.grouped_odfv_refs))
+        set_usage_attribute("request_fv", bool(plan.grouped_request_fv_refs))
 
         # All requested features should be present in the result.
-        requested_result_row_names = {
-            feat_ref.replace(":", "__") for feat_ref in _feature_refs
-        }
-        if not full_feature_names:
-            requested_result_row_names = {
-                name.rpartition("__")[-1] for name in requested_result_row_names
-            }
-
-        feature_views = list(view for view, _ in grouped_refs)
-
-        needed_request_data, needed_request_fv_features = self.get_needed_request_data(
-            grouped_odfv_refs, grouped_request_fv_refs
-        )
+        requested_result_row_names = set(plan.requested_result_row_names)
 
         join_key_values: Dict[str, List[Value]] = {}
+        # Native join key values are cheaper to deduplicate than their Protobuf counterparts.
+        join_key_native_values: Optional[Dict[str, List[Any]]] = (
+            {} if native_entity_values else None
+        )
         request_data_features: Dict[str, List[Value]] = {}
         # Entity rows may be either entities or request data.
         for join_key_or_entity_name, values in entity_proto_values.items():
             # Found request data
             if (
-                join_key_or_entity_name in needed_request_data
-                or join_key_or_entity_name in needed_request_fv_features
+                join_key_or_entity_name in plan.needed_request_data
+                or join_key_or_entity_name in plan.needed_request_fv_features
             ):
-                if join_key_or_entity_name in needed_request_fv_features:
+                if join_key_or_entity_name in plan.needed_request_fv_features:
                     # If the data was requested as a feature then
                     # make sure it appears in the result.
                     requested_result_row_names.add(join_key_or_entity_name)
                 request_data_features[join_key_or_entity_name] = values
             else:
-                if join_key_or_entity_name in join_keys_set:
+                if join_key_or_entity_name in plan.join_keys_set:
                     join_key = join_key_or_entity_name
                 else:
                     try:
-                        join_key = entity_name_to_join_key_map[join_key_or_entity_name]
+                        join_key = plan.entity_name_to_join_key_map[
+                            join_key_or_entity_name
+                        ]
                     except KeyError:
                         raise EntityNotFoundException(
                             join_key_or_entity_name, self.project
@@ -1744,69 +1963,243 @@ class FeatureStore:
                 # All join keys should be returned in the result.
                 requested_result_row_names.add(join_key)
                 join_key_values[join_key] = values
+                if join_key_native_values is not None:
+                    join_key_native_values[join_key] = entity_value_lists[
+                        join_key_or_entity_name
+                    ]
 
         self.ensure_request_data_values_exist(
-            needed_request_data, needed_request_fv_features, request_data_features
+            plan.needed_request_data,
+            plan.needed_request_fv_features,
+            request_data_features,
         )
 
-        # Populate online features response proto with join keys and request data features
-        online_features_response = GetOnlineFeaturesResponse(results=[])
-        self._populate_result_rows_from_columnar(
-            online_features_response=online_features_response,
-            data=dict(**join_key_values, **request_data_features),
+        # On demand transformations operate on the Protobuf response, so Arrow columns can only
+        # be built directly from the online store when there are none.
+        arrow_columns = (
+            _ArrowOnlineColumns(num_rows)
+            if output == "arrow" and not plan.grouped_odfv_refs
+            else None
         )
+        input_columns = dict(**join_key_values, **request_data_features)
+        online_features_response = GetOnlineFeaturesResponse(results=[])
+        if arrow_columns is not None:
+            for name, values in input_columns.items():
+                arrow_columns.add_input_column(
+                    name,
+                    proto_values_to_arrow(
+                        values, plan.entity_type_map.get(name, ValueType.UNKNOWN)
+                    ),
+                )
+        else:
+            # Populate online features response proto with join keys and request data features
+            self._populate_result_rows_from_columnar(
+                online_features_response=online_features_response,
+                data=input_columns,
+            )
 
         # Add the Entityless case after populating result rows to avoid having to remove
         # it later.
-        entityless_case = DUMMY_ENTITY_NAME in [
-            entity_name
-            for feature_view in feature_views
-            for entity_name in feature_view.entities
-        ]
-        if entityless_case:
+        if plan.entityless_case:
             join_key_values[DUMMY_ENTITY_ID] = python_values_to_proto_values(
                 [DUMMY_ENTITY_VAL] * num_rows, DUMMY_ENTITY.value_type
             )
+            if join_key_native_values is not None:
+                join_key_native_values[DUMMY_ENTITY_ID] = [DUMMY_ENTITY_VAL] * num_rows
 
-        provider = self._get_provider()
-        for table, requested_features in grouped_refs:
+        table_reads = []
+        for table, requested_features in plan.grouped_refs:
             # Get the correct set of entity values with the correct join keys.
             table_entity_values, idxs = self._get_unique_entities(
                 table,
                 join_key_values,
-                entity_name_to_join_key_map,
+                plan.entity_name_to_join_key_map,
+                join_key_native_values,
+            )
+            table_reads.append(
+                _OnlineTableRead(table, requested_features, table_entity_values, idxs)
             )
 
-            # Fetch feature data for the minimum set of Entities.
-            feature_data = self._read_from_online_store(
-                table_entity_values,
-                provider,
-                requested_features,
-                table,
+        return _OnlineRequest(
+            plan=plan,
+            full_feature_names=full_feature_names,
+            output=output,
+            requested_result_row_names=requested_result_row_names,
+            online_features_response=online_features_response,
+            arrow_columns=arrow_columns,
+            table_reads=table_reads,
+        )
+
+    def _complete_online_request(
+        self,
+        request: "_OnlineRequest",
+        read_rows: Sequence[
+            List[Tuple[Optional[datetime], Optional[Dict[str, Value]]]]
+        ],
+    ) -> Union[OnlineResponse, ArrowOnlineResponse]:
+        """Populates the response of an online request with the data read for each of its feature views.
+
+        `read_rows` holds the rows read from the OnlineStore for each of `request.table_reads`, in order.
+        """
+        plan = request.plan
+        online_features_response = request.online_features_response
+        for table_read, table_rows in zip(request.table_reads, read_rows):
+            if request.arrow_columns is not None:
+                request.arrow_columns.add_feature_columns(
+                    table_rows,
+                    table_read.indexes,
+                    request.full_feature_names,
+                    table_read.requested_features,
+                    table_read.table,
+                )
+                continue
+
+            feature_data = self._read_rows_to_protos(
+                table_rows, table_read.requested_features
             )
 
             # Populate the result_rows with the Features from the OnlineStore inplace.
             self._populate_response_from_feature_data(
                 feature_data,
-                idxs,
+                table_read.indexes,
                 online_features_response,
-                full_feature_names,
-                requested_features,
-                table,
+                request.full_feature_names,
+                table_read.requested_features,
+                table_read.table,
             )
 
-        if grouped_odfv_refs:
+        if plan.grouped_odfv_refs:
             self._augment_response_with_on_demand_transforms(
                 online_features_response,
-                _feature_refs,
-                requested_on_demand_feature_views,
-                full_feature_names,
+                plan.feature_refs,
+                plan.requested_on_demand_feature_views,
+                request.full_feature_names,
             )
 
+        if request.arrow_columns is not None:
+            return request.arrow_columns.to_response(request.requested_result_row_names)
+
         self._drop_unneeded_columns(
-            online_features_response, requested_result_row_names
+            online_features_response, request.requested_result_row_names
+        )
+        online_response = OnlineResponse(online_features_response)
+        if request.output == "arrow":
+            return ArrowOnlineResponse.from_proto(online_response.proto)
+        return online_response
+
+    def _get_online_retrieval_plan(
+        self,
+        features: Union[List[str], FeatureService],
+        full_feature_names: bool,
+    ) -> "_OnlineRetrievalPlan":
+        """Returns the retrieval plan for the given features, compiling it if it is not cached.
+
+        Plans are memoized in a bounded LRU cache. The cache is keyed by the features and
+        `full_feature_names`, and is cleared whenever the registry cache version changes.
+        """
+        cache_size = self.config.online_retrieval_plan_cache_size
+        registry_version = (
+            self._registry.get_cache_version(self.project) if cache_size > 0 else None
+        )
+        if registry_version is None:
+            return self._compile_online_retrieval_plan(features, full_feature_names)
+
+        key = _online_retrieval_plan_key(features, full_feature_names)
+        with self._online_retrieval_plans_lock:
+            if self._online_retrieval_plans_version != registry_version:
+                self._online_retrieval_plans.clear()
+                self._online_retrieval_plans_version = registry_version
+            plan = self._online_retrieval_plans.get(key)
+            if plan is not None:
+                self._online_retrieval_plans.move_to_end(key)
+                return plan
+
+        plan = self._compile_online_retrieval_plan(features, full_feature_names)
+
+        with self._online_retrieval_plans_lock:
+            if self._online_retrieval_plans_version == registry_version:
+                self._online_retrieval_plans[key] = plan
+                while len(self._online_retrieval_plans) > cache_size:
+                    self._online_retrieval_plans.popitem(last=False)
+        return plan
+
+    def _compile_online_retrieval_plan(
+        self,
+        features: Union[List[str], FeatureService],
+        full_feature_names: bool,
+    ) -> "_OnlineRetrievalPlan":
+        """Resolves the registry objects needed to serve the given features.
+
+        Everything computed here depends only on the registry state and the requested
+        features, never on the entity values, so the result can be reused across requests.
+        """
+        _feature_refs = self._get_features(features, allow_cache=True)
+        (
+            requested_feature_views,
+            requested_request_feature_views,
+            requested_on_demand_feature_views,
+        ) = self._get_feature_views_to_use(
+            features=features, allow_cache=True, hide_dummy_entity=False
+        )
+
+        if requested_request_feature_views:
+            warnings.warn(
+                "Request feature view is deprecated. "
+                "Please use request data source instead",
+                DeprecationWarning,
+            )
+
+        (
+            entity_name_to_join_key_map,
+            entity_type_map,
+            join_keys_set,
+        ) = self._get_entity_maps(requested_feature_views)
+
+        _validate_feature_refs(_feature_refs, full_feature_names)
+        (
+            grouped_refs,
+            grouped_odfv_refs,
+            grouped_request_fv_refs,
+            _,
+        ) = _group_feature_refs(
+            _feature_refs,
+            requested_feature_views,
+            requested_request_feature_views,
+            requested_on_demand_feature_views,
+        )
+
+        requested_result_row_names = {
+            feat_ref.replace(":", "__") for feat_ref in _feature_refs
+        }
+        if not full_feature_names:
+            requested_result_row_names = {
+                name.rpartition("__")[-1] for name in requested_result_row_names
+            }
+
+        needed_request_data, needed_request_fv_features = self.get_needed_request_data(
+            grouped_odfv_refs, grouped_request_fv_refs
+        )
+
+        entityless_case = DUMMY_ENTITY_NAME in [
+            entity_name
+            for feature_view, _ in grouped_refs
+            for entity_name in feature_view.entities
+        ]
+
+        return _OnlineRetrievalPlan(
+            feature_refs=_feature_refs,
+            requested_on_demand_feature_views=requested_on_demand_feature_views,
+            entity_name_to_join_key_map=entity_name_to_join_key_map,
+            entity_type_map=entity_type_map,
+            join_keys_set=join_keys_set,
+            grouped_refs=grouped_refs,
+            grouped_odfv_refs=grouped_odfv_refs,
+            grouped_request_fv_refs=grouped_request_fv_refs,
+            requested_result_row_names=frozenset(requested_result_row_names),
+            needed_request_data=needed_request_data,
+            needed_request_fv_features=needed_request_fv_features,
+            entityless_case=entityless_case,
         )
-        return OnlineResponse(online_features_response)
 
     @staticmethod
     def _get_columnar_entity_values(
@@ -1942,12 +2335,17 @@ class FeatureStore:
         table: FeatureView,
         join_key_values: Dict[str, List[Value]],
         entity_name_to_join_key_map: Dict[str, str],
-    ) -> Tuple[Tuple[Dict[str, Value], ...], Tuple[List[int], ...]]:
-        """Return the set of unique composite Entities for a Feature View and the indexes at which they appear.
+        join_key_native_values: Optional[Dict[str, List[Any]]] = None,
+    ) -> Tuple[Tuple[Dict[str, Value], ...], np.ndarray]:
+        """Return the set of unique composite Entities for a Feature View and the index of the unique
+        Entity that each row refers to.
 
         This method allows us to query the OnlineStore for data we need only once
         rather than requesting and processing data for the same combination of
-        Entities multiple times.
+        Entities multiple times. Unique Entities are returned in the order of their first occurrence.
+
+        If the native values of the join keys are given, they are used to identify duplicates;
+        otherwise the serialized Protobuf values are compared.
         """
         # Get the correct set of entity values with the correct join keys.
         table_entity_values = self._get_table_entity_values(
@@ -1955,37 +2353,33 @@ class FeatureStore:
             entity_name_to_join_key_map,
             join_key_values,
         )
-
-        # Convert back to rowise.
-        keys = table_entity_values.keys()
-        # Sort the rowise data to allow for grouping but keep original index. This lambda is
-        # sufficient as Entity types cannot be complex (ie. lists).
-        rowise = list(enumerate(zip(*table_entity_values.values())))
-        rowise.sort(
-            key=lambda row: tuple(getattr(x, x.WhichOneof("val")) for x in row[1])
-        )
-
-        # Identify unique entities and the indexes at which they occur.
-        unique_entities: Tuple[Dict[str, Value], ...]
-        indexes: Tuple[List[int], ...]
-        unique_entities, indexes = tuple(
-            zip(
-                *[
-                    (dict(zip(keys, k)), [_[0] for _ in g])
-                    for k, g in itertools.groupby(rowise, key=lambda x: x[1])
-                ]
+        if join_key_native_values is not None:
+            columns = list(
+                self._get_table_entity_values(
+                    table, entity_name_to_join_key_map, join_key_native_values
+                ).values()
             )
-        )
-        return unique_entities, indexes
+        else:
+            columns = [
+                [value.SerializeToString() for value in values]
+                for values in table_entity_values.values()
+            ]
 
-    def _read_from_online_store(
-        self,
-        entity_rows: Iterable[Mapping[str, Value]],
-        provider: Provider,
+        first_indexes, inverse = _factorize_rows(columns)
+        keys = list(table_entity_values.keys())
+        unique_columns = [
+            apply_list_mapping(values, first_indexes)
+            for values in table_entity_values.values()
+        ]
+        unique_entities = tuple(dict(zip(keys, row)) for row in zip(*unique_columns))
+        return unique_entities, inverse
+
+    @staticmethod
+    def _read_rows_to_protos(
+        read_rows: List[Tuple[Optional[datetime], Optional[Dict[str, Value]]]],
         requested_features: List[str],
-        table: FeatureView,
     ) -> List[Tuple[List[Timestamp], List["FieldStatus.ValueType"], List[Value]]]:
-        """Read and process data from the OnlineStore for a given FeatureView.
+        """Process the data read from the OnlineStore for a given FeatureView.
 
         This method guarantees that the order of the data in each element of the
         List returned is the same as the order of `requested_features`.
@@ -1994,20 +2388,6 @@ class FeatureStore:
         combination of Entities in `entity_rows` in the same order as they
         are provided.
         """
-        # Instantiate one EntityKeyProto per Entity.
-        entity_key_protos = [
-            EntityKeyProto(join_keys=row.keys(), entity_values=row.values())
-            for row in entity_rows
-        ]
-
-        # Fetch data for Entities.
-        read_rows = provider.online_read(
-            config=self.config,
-            table=table,
-            entity_keys=entity_key_protos,
-            requested_features=requested_features,
-        )
-
         # Each row is a set of features for a given entity key. We only need to convert
         # the data to Protobuf once.
         null_value = Value()
@@ -2036,6 +2416,36 @@ class FeatureStore:
             read_row_protos.append((event_timestamps, statuses, values))
         return read_row_protos
 
+    def _online_read(
+        self,
+        entity_rows: Iterable[Mapping[str, Value]],
+        provider: Provider,
+        requested_features: List[str],
+        table: FeatureView,
+    ) -> List[Tuple[Optional[datetime], Optional[Dict[str, Value]]]]:
+        """Read the raw data for a given FeatureView from the OnlineStore, in the order of `entity_rows`."""
+        return provider.online_read(
+            config=self.config,
+            table=table,
+            entity_keys=_entity_key_protos(entity_rows),
+            requested_features=requested_features,
+        )
+
+    async def _online_read_async(
+        self,
+        entity_rows: Iterable[Mapping[str, Value]],
+        provider: Provider,
+        requested_features: List[str],
+        table: FeatureView,
+    ) -> List[Tuple[Optional[datetime], Optional[Dict[str, Value]]]]:
+        """Asynchronous counterpart of `_online_read`."""
+        return await provider.online_read_async(
+            config=self.config,
+            table=table,
+            entity_keys=_entity_key_protos(entity_rows),
+            requested_features=requested_features,
+        )
+
     @staticmethod
     def _populate_response_from_feature_data(
         feature_data: Iterable[
@@ -2043,7 +2453,7 @@ class FeatureStore:
                 Iterable[Timestamp], Iterable["FieldStatus.ValueType"], Iterable[Value]
             ]
         ],
-        indexes: Iterable[List[int]],
+        indexes: np.ndarray,
         online_features_response: GetOnlineFeaturesResponse,
         full_feature_names: bool,
         requested_features: Iterable[str],
@@ -2051,14 +2461,14 @@ class FeatureStore:
     ):
         """Populate the GetOnlineFeaturesResponse with feature data.
 
-        This method assumes that `_read_from_online_store` returns data for each
+        This method assumes that `_read_rows_to_protos` returns data for each
         combination of Entities in `entity_rows` in the same order as they
         are provided.
 
         Args:
             feature_data: A list of data in Protobuf form which was retrieved from the OnlineStore.
-            indexes: A list of indexes which should be the same length as `feature_data`. Each list
-                of indexes corresponds to a set of result rows in `online_features_response`.
+            indexes: For every result row in `online_features_response`, the index of the element of
+                `feature_data` that holds its data.
             online_features_response: The object to populate.
             full_feature_names: A boolean that provides the option to add the feature view prefixes to the feature names,
                 changing them from the format "feature" to "feature_view__feature" (e.g., "daily_transactions" changes to
@@ -2581,6 +2991,183 @@ class FeatureStore:
         return ref
 
 
+@dataclass(frozen=True)
+class _OnlineRetrievalPlan:
+    """
+    The registry-dependent part of an online retrieval, compiled once per distinct set of
+    requested features and reused until the registry cache is refreshed.
+
+    Plans are shared between concurrent requests, so neither the plan nor the feature views
+    it references may be modified while serving a request.
+    """
+
+    feature_refs: List[str]
+    requested_on_demand_feature_views: List[OnDemandFeatureView]
+    entity_name_to_join_key_map: Dict[str, str]
+    entity_type_map: Dict[str, ValueType]
+    join_keys_set: Set[str]
+    grouped_refs: List[Tuple[FeatureView, List[str]]]
+    grouped_odfv_refs: List[Tuple[OnDemandFeatureView, List[str]]]
+    grouped_request_fv_refs: List[Tuple[RequestFeatureView, List[str]]]
+    requested_result_row_names: FrozenSet[str]
+    needed_request_data: Set[str]
+    needed_request_fv_features: Set[str]
+    entityless_case: bool
+
+
+@dataclass
+class _OnlineTableRead:
+    """The unique entities to read from the online store for one feature view of an online request."""
+
+    table: FeatureView
+    requested_features: List[str]
+    entity_rows: Tuple[Dict[str, Value], ...]
+    # For every row of the request, the index of the entity row that holds its data.
+    indexes: np.ndarray
+
+
+@dataclass
+class _OnlineRequest:
+    """An online request whose features are ready to be read from the online store."""
+
+    plan: _OnlineRetrievalPlan
+    full_feature_names: bool
+    output: str
+    requested_result_row_names: Set[str]
+    online_features_response: GetOnlineFeaturesResponse
+    arrow_columns: Optional["_ArrowOnlineColumns"]
+    table_reads: List[_OnlineTableRead]
+
+
+class _ArrowOnlineColumns:
+    """
+    Collects the Arrow columns of an online response, as the counterpart of populating a
+    GetOnlineFeaturesResponse when online features are retrieved with `output="arrow"`.
+    """
+
+    def __init__(self, num_rows: int):
+        self.num_rows = num_rows
+        self.values: Dict[str, pa.Array] = {}
+        self.statuses: Dict[str, pa.Array] = {}
+        self.event_timestamps: Dict[str, pa.Array] = {}
+
+    def add_input_column(self, name: str, values: pa.Array):
+        """Adds a join key or request data column, whose values are always present."""
+        self.values[name] = values
+        self.statuses[name] = pa.array(
+            np.full(self.num_rows, FieldStatus.PRESENT, dtype=np.int32)
+        )
+        self.event_timestamps[name] = pa.nulls(self.num_rows, type=EVENT_TIMESTAMP_TYPE)
+
+    def add_feature_columns(
+        self,
+        read_rows: List[Tuple[Optional[datetime], Optional[Dict[str, Value]]]],
+        indexes: np.ndarray,
+        full_feature_names: bool,
+        requested_features: List[str],
+        table: FeatureView,
+    ):
+        """
+        Adds the features read from the online store for the unique entities of a feature view.
+
+        Values are only converted once per unique entity, and are then gathered for every entity row
+        using `indexes`.
+        """
+        take_indices = pa.array(indexes)
+        event_timestamps = pa.array(
+            [row_ts for row_ts, _ in read_rows], type=EVENT_TIMESTAMP_TYPE
+        ).take(take_indices)
+        feature_types = {
+            feature.name: feature.dtype.to_value_type()
+            for feature in table.projection.features
+        }
+        for feature_name in requested_features:
+            values = [
+                None if feature_data is None else feature_data.get(feature_name)
+                for _, feature_data in read_rows
+            ]
+            statuses = np.array(
+                [
+                    FieldStatus.NOT_FOUND if value is None else FieldStatus.PRESENT
+                    for value in values
+                ],
+                dtype=np.int32,
+            )
+            name = (
+                f"{table.projection.name_to_use()}__{feature_name}"
+                if full_feature_names
+                else feature_name
+            )
+            self.values[name] = proto_values_to_arrow(
+                values, feature_types.get(feature_name, ValueType.UNKNOWN)
+            ).take(take_indices)
+            self.statuses[name] = pa.array(statuses).take(take_indices)
+            self.event_timestamps[name] = event_timestamps
+
+    def to_response(self, requested_result_row_names: Set[str]) -> ArrowOnlineResponse:
+        names = [name for name in self.values if name in requested_result_row_names]
+        return ArrowOnlineResponse(
+            pa.RecordBatch.from_arrays([self.values[n] for n in names], names=names),
+            pa.RecordBatch.from_arrays([self.statuses[n] for n in names], names=names),
+            pa.RecordBatch.from_arrays(
+                [self.event_timestamps[n] for n in names], names=names
+            ),
+        )
+
+
+def _online_retrieval_plan_key(
+    features: Union[List[str], FeatureService], full_feature_names: bool
+) -> Hashable:
+    # The narrowing is done on the list, since mypy doesn't narrow @typechecked classes.
+    if isinstance(features, (list, tuple)):
+        return tuple(features), full_feature_names
+    # Feature services are identified by their projections rather than their name, since
+    # the object passed in may differ from the version stored in the registry.
+    return (
+        features.name,
+        tuple(
+            (
+                projection.name,
+                projection.name_alias,
+                tuple(f.name for f in projection.features),
+                tuple(sorted(projection.join_key_map.items())),
+            )
+            for projection in features.feature_view_projections
+        ),
+        full_feature_names,
+    )
+
+
+_FeatureViewT = TypeVar("_FeatureViewT", FeatureView, StreamFeatureView)
+
+
+def _copy_feature_view(feature_view: _FeatureViewT) -> _FeatureViewT:
+    # Objects served from the registry cache are shared between callers, so they are copied
+    # before being modified. A proto round trip keeps fields that __copy__ drops.
+    return type(feature_view).from_proto(feature_view.to_proto())
+
+
+def _entity_key_protos(
+    entity_rows: Iterable[Mapping[str, Value]]
+) -> List[EntityKeyProto]:
+    # Instantiate one EntityKeyProto per Entity.
+    return [
+        EntityKeyProto(join_keys=row.keys(), entity_values=row.values())
+        for row in entity_rows
+    ]
+
+
+def _entity_rows_to_columnar(entity_rows: List[Dict[str, Any]]) -> Dict[str, List[Any]]:
+    columnar: Dict[str, List[Any]] = {k: [] for k in entity_rows[0].keys()}
+    for entity_row in entity_rows:
+        for key, value in entity_row.items():
+            try:
+                columnar[key].append(value)
+            except KeyError as e:
+                raise ValueError("All entity_rows must have the same keys.") from e
+    return columnar
+
+
 def _validate_entity_values(join_key_values: Dict[str, List[Value]]):
     set_of_row_lengths = {len(v) for v in join_key_values.values()}
     if len(set_of_row_lengths) > 1:
@@ -2714,6 +3301,21 @@ def _print_materialization_log(
         )
 
 
+def _materialization_chunks(
+    start_date: datetime, end_date: datetime, chunk_size: Optional[timedelta]
+) -> List[Tuple[datetime, datetime]]:
+    """Splits the interval from `start_date` to `end_date` into consecutive chunks of at most `chunk_size`."""
+    if not chunk_size or start_date >= end_date:
+        return [(start_date, end_date)]
+    chunks = []
+    chunk_start = start_date
+    while chunk_start < end_date:
+        chunk_end = min(chunk_start + chunk_size, end_date)
+        chunks.append((chunk_start, chunk_end))
+        chunk_start = chunk_end
+    return chunks
+
+
 def _validate_feature_views(feature_views: List[BaseFeatureView]):
     """Verify feature views have case-insensitively unique names"""
     fv_names = set()
@@ -2740,13 +3342,31 @@ def _validate_data_sources(data_sources: List[DataSource]):
             ds_names.add(case_insensitive_ds_name)
 
 
-def apply_list_mapping(
-    lst: Iterable[Any], mapping_indexes: Iterable[List[int]]
-) -> Iterable[Any]:
-    output_len = sum(len(item) for item in mapping_indexes)
-    output = [None] * output_len
-    for elem, destinations in zip(lst, mapping_indexes):
-        for idx in destinations:
-            output[idx] = elem
+def apply_list_mapping(lst: Sequence[Any], mapping_indexes: np.ndarray) -> List[Any]:
+    """Returns the elements of `lst` at `mapping_indexes`, e.g. the value of each unique Entity for every row."""
+    # Gathering through a NumPy object array would be slower, since NumPy inspects every Protobuf
+    # message when building the array.
+    return list(map(lst.__getitem__, mapping_indexes.tolist()))
+
 
-    return output
+def _factorize_rows(
+    columns: Sequence[Sequence[Any]],
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Identifies the unique rows of a table given as a list of equally long columns.
+
+    Returns:
+        The index of the first occurrence of each unique row, in order, and the number of the unique
+        row at every index.
+    """
+    num_rows = len(columns[0]) if columns else 0
+    inverse = np.zeros(num_rows, dtype=np.int64)
+    for column in columns:
+        values = np.empty(num_rows, dtype=object)
+        values[:] = column
+        codes, uniques = pd.factorize(values)
+        # Missing values are all given the code -1, make them their own unique value instead.
+        codes = np.where(codes == -1, len(uniques), codes).astype(np.int64)
+        inverse, _ = pd.factorize(inverse * (len(uniques) + 1) + codes)
+    first_indexes = np.unique(inverse, return_index=True)[1]
+    return first_indexes, inverse
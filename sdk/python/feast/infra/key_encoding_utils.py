@@ -1,5 +1,9 @@
 import struct
-from typing import List, Tuple
+import threading
+from collections import OrderedDict
+from typing import Any, List, Optional, Sequence, Tuple, Union, cast
+
+import numpy as np
 
 from feast.protos.feast.types.EntityKey_pb2 import EntityKey as EntityKeyProto
 from feast.protos.feast.types.Value_pb2 import Value as ValueProto
@@ -72,3 +76,304 @@ def serialize_entity_key(
         output.append(val_bytes)
 
     return b"".join(output)
+
+
+def deserialize_entity_key(
+    serialized_entity_key: bytes, join_keys: Sequence[str]
+) -> EntityKeyProto:
+    """
+    Deserializes an entity key serialized by serialize_entity_key, with any serialization version.
+
+    The join keys of the entity key are given, since they are serialized without their length.
+    """
+    prefix = serialize_entity_key_prefix(list(join_keys))
+    if not serialized_entity_key.startswith(prefix):
+        raise ValueError(f"The entity key doesn't have the join keys {join_keys}")
+
+    entity_values: List[ValueProto] = []
+    offset = len(prefix)
+    while offset < len(serialized_entity_key):
+        value_type, length = struct.unpack_from("<II", serialized_entity_key, offset)
+        offset += 8
+        val_bytes = serialized_entity_key[offset : offset + length]
+        offset += length
+        if value_type == ValueType.STRING:
+            entity_values.append(ValueProto(string_val=val_bytes.decode("utf8")))
+        elif value_type == ValueType.BYTES:
+            entity_values.append(ValueProto(bytes_val=val_bytes))
+        elif value_type == ValueType.INT32:
+            entity_values.append(
+                ValueProto(int32_val=struct.unpack("<i", val_bytes)[0])
+            )
+        elif value_type == ValueType.INT64:
+            # Version 1 packs int64 values in 4 bytes.
+            (int64_val,) = struct.unpack("<q" if length == 8 else "<l", val_bytes)
+            entity_values.append(ValueProto(int64_val=int64_val))
+        else:
+            raise ValueError(f"Value type not supported for entity keys: {value_type}")
+
+    return EntityKeyProto(join_keys=sorted(join_keys), entity_values=entity_values)
+
+
+def serialize_entity_keys(
+    entity_keys: Sequence[EntityKeyProto],
+    entity_key_serialization_version=1,
+) -> List[bytes]:
+    """
+    Serializes entity keys like serialize_entity_key. Keys sharing the same join keys, as is the case for
+    the keys of a single feature view, are serialized in bulk with serialize_entity_keys_bulk.
+    """
+    if not entity_keys:
+        return []
+
+    join_keys = list(entity_keys[0].join_keys)
+    if any(list(entity_key.join_keys) != join_keys for entity_key in entity_keys):
+        return [
+            serialize_entity_key(
+                entity_key,
+                entity_key_serialization_version=entity_key_serialization_version,
+            )
+            for entity_key in entity_keys
+        ]
+    columns = [
+        [entity_key.entity_values[i] for entity_key in entity_keys]
+        for i in range(len(join_keys))
+    ]
+    return serialize_entity_keys_bulk(
+        join_keys,
+        columns,
+        entity_key_serialization_version=entity_key_serialization_version,
+    )
+
+
+def serialize_entity_keys_bulk(
+    join_keys: List[str],
+    columns: Sequence[Union[Sequence[ValueProto], np.ndarray]],
+    entity_key_serialization_version=1,
+) -> List[bytes]:
+    """
+    Serializes the entity keys made of the values at the same position in each column, byte-identical to
+    serialize_entity_key.
+
+    Each column holds the values of the join key at the same position, either as Value protos of a single
+    type, or as a NumPy array: int32 and int64 arrays are serialized as INT32 and INT64 values, and string
+    or object arrays as STRING values (or BYTES values, if they hold bytes).
+    """
+    if len(join_keys) != len(columns):
+        raise ValueError(
+            f"Got {len(columns)} value columns for {len(join_keys)} join keys."
+        )
+    if not columns or len(columns[0]) == 0:
+        return []
+
+    prefix = serialize_entity_key_prefix(join_keys)
+    order = sorted(range(len(join_keys)), key=lambda i: join_keys[i])
+    packed_columns = [
+        _pack_entity_key_column(columns[i], entity_key_serialization_version)
+        for i in order
+    ]
+
+    fixed_width_columns = [
+        column for column in packed_columns if isinstance(column, np.ndarray)
+    ]
+    if len(fixed_width_columns) == len(packed_columns):
+        # Lay out the keys as the rows of a byte matrix, and split it once.
+        num_rows = len(fixed_width_columns[0])
+        prefixes = np.broadcast_to(
+            np.frombuffer(prefix, dtype=np.uint8), (num_rows, len(prefix))
+        )
+        matrix = np.hstack(
+            [
+                prefixes,
+                *(
+                    column.view(np.uint8).reshape(num_rows, -1)
+                    for column in fixed_width_columns
+                ),
+            ]
+        )
+        return _split_rows(matrix.tobytes(), matrix.shape[1])
+
+    parts = [
+        _split_rows(column.tobytes(), column.dtype.itemsize)
+        if isinstance(column, np.ndarray)
+        else column
+        for column in packed_columns
+    ]
+    if len(parts) == 1:
+        return [prefix + part for part in parts[0]]
+    return [b"".join((prefix, *row)) for row in zip(*parts)]
+
+
+# The value type and length headers of a serialized value, followed by the value itself.
+_INT32_ENTITY_VALUE_DTYPE = np.dtype([("type", "<u4"), ("len", "<u4"), ("val", "<i4")])
+_INT64_ENTITY_VALUE_DTYPE = np.dtype([("type", "<u4"), ("len", "<u4"), ("val", "<i8")])
+_ENTITY_VALUE_HEADER_DTYPE = np.dtype([("type", "<u4"), ("len", "<u4")])
+
+_INT32_MIN = np.iinfo(np.int32).min
+_INT32_MAX = np.iinfo(np.int32).max
+
+
+def _pack_entity_key_column(
+    column: Union[Sequence[ValueProto], np.ndarray], entity_key_serialization_version
+) -> Union[np.ndarray, List[bytes]]:
+    """
+    Serializes the values of a column with their headers, as a structured array for fixed-width values and
+    as a list of byte strings otherwise.
+    """
+    if isinstance(column, np.ndarray):
+        if column.dtype in (np.int32, np.int64):
+            return _pack_entity_key_ints(
+                ValueType.INT32 if column.dtype == np.int32 else ValueType.INT64,
+                column,
+                entity_key_serialization_version,
+            )
+        if column.dtype.kind not in "OUS":
+            raise ValueError(
+                f"Entity key columns of type {column.dtype} are not supported."
+            )
+        values = column.tolist()
+        if isinstance(values[0], bytes):
+            return _pack_entity_key_bytes(ValueType.BYTES, values)
+        return _pack_entity_key_bytes(
+            ValueType.STRING, [value.encode("utf8") for value in values]
+        )
+
+    value_fields = {value.WhichOneof("val") for value in column}
+    value_field = value_fields.pop() if len(value_fields) == 1 else None
+    if value_field == "int64_val":
+        return _pack_entity_key_ints(
+            ValueType.INT64,
+            np.array([value.int64_val for value in column], dtype=np.int64),
+            entity_key_serialization_version,
+        )
+    if value_field == "int32_val":
+        return _pack_entity_key_ints(
+            ValueType.INT32,
+            np.array([value.int32_val for value in column], dtype=np.int32),
+            entity_key_serialization_version,
+        )
+    if value_field == "string_val":
+        return _pack_entity_key_bytes(
+            ValueType.STRING, [value.string_val.encode("utf8") for value in column]
+        )
+    if value_field == "bytes_val":
+        return _pack_entity_key_bytes(
+            ValueType.BYTES, [value.bytes_val for value in column]
+        )
+
+    # Mixed or unsupported values are serialized (or rejected) value by value.
+    packed = []
+    for value in column:
+        val_bytes, value_type = _serialize_val(
+            value.WhichOneof("val"),
+            value,
+            entity_key_serialization_version=entity_key_serialization_version,
+        )
+        packed.append(
+            struct.pack("<I", value_type)
+            + struct.pack("<I", len(val_bytes))
+            + val_bytes
+        )
+    return packed
+
+
+def _pack_entity_key_ints(
+    value_type: int, values: np.ndarray, entity_key_serialization_version
+) -> np.ndarray:
+    # Version 1 serializes int64 values on 4 bytes, like int32 values.
+    if value_type == ValueType.INT32 or 0 <= entity_key_serialization_version <= 1:
+        if values.min() < _INT32_MIN or values.max() > _INT32_MAX:
+            raise struct.error("argument out of range")
+        packed = np.empty(len(values), dtype=_INT32_ENTITY_VALUE_DTYPE)
+        packed["len"] = 4
+    else:
+        packed = np.empty(len(values), dtype=_INT64_ENTITY_VALUE_DTYPE)
+        packed["len"] = 8
+    packed["type"] = value_type
+    packed["val"] = values
+    return packed
+
+
+def _pack_entity_key_bytes(value_type: int, values: List[bytes]) -> List[bytes]:
+    headers = np.empty(len(values), dtype=_ENTITY_VALUE_HEADER_DTYPE)
+    headers["type"] = value_type
+    headers["len"] = np.fromiter(map(len, values), dtype=np.uint32, count=len(values))
+    return [
+        header + value
+        for header, value in zip(
+            _split_rows(headers.tobytes(), headers.dtype.itemsize), values
+        )
+    ]
+
+
+def _split_rows(data: bytes, width: int) -> List[bytes]:
+    """Splits the serialization of fixed-width rows into one byte string per row."""
+    return [data[start : start + width] for start in range(0, len(data), width)]
+
+
+class EntityKeyCache:
+    """
+    A bounded LRU cache of serialized entity keys, keyed by their join keys and values. Online stores keep
+    one per instance, which may be shared by the threads reading from the store.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._serialized_keys: "OrderedDict[Tuple[Any, ...], bytes]" = OrderedDict()
+
+    def serialize(
+        self,
+        entity_keys: Sequence[EntityKeyProto],
+        entity_key_serialization_version=1,
+        maxsize: int = 0,
+    ) -> List[bytes]:
+        """
+        Serializes entity keys like serialize_entity_keys, looking them up in the cache first. Keys missing
+        from the cache are serialized in bulk, then added to it, evicting the least recently used keys beyond
+        `maxsize`. If `maxsize` is not positive, the cache is bypassed.
+        """
+        if maxsize <= 0:
+            return serialize_entity_keys(entity_keys, entity_key_serialization_version)
+
+        cache_keys = [
+            _entity_key_cache_key(entity_key, entity_key_serialization_version)
+            for entity_key in entity_keys
+        ]
+        serialized: List[Optional[bytes]] = []
+        with self._lock:
+            for cache_key in cache_keys:
+                entity_key_bin = self._serialized_keys.get(cache_key)
+                if entity_key_bin is not None:
+                    self._serialized_keys.move_to_end(cache_key)
+                serialized.append(entity_key_bin)
+
+        missing = [
+            i for i, entity_key_bin in enumerate(serialized) if entity_key_bin is None
+        ]
+        if missing:
+            missing_bins = serialize_entity_keys(
+                [entity_keys[i] for i in missing], entity_key_serialization_version
+            )
+            with self._lock:
+                for i, entity_key_bin in zip(missing, missing_bins):
+                    serialized[i] = entity_key_bin
+                    self._serialized_keys[cache_keys[i]] = entity_key_bin
+                while len(self._serialized_keys) > maxsize:
+                    self._serialized_keys.popitem(last=False)
+        return cast(List[bytes], serialized)
+
+
+def _entity_key_cache_key(
+    entity_key: EntityKeyProto, entity_key_serialization_version
+) -> Tuple[Any, ...]:
+    values = []
+    for value in entity_key.entity_values:
+        value_field = value.WhichOneof("val")
+        values.append(
+            (value_field, getattr(value, value_field) if value_field else None)
+        )
+    return (
+        entity_key_serialization_version,
+        tuple(entity_key.join_keys),
+        tuple(values),
+    )
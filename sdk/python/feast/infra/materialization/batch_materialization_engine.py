@@ -129,6 +129,12 @@ class BatchMaterializationEngine(ABC):
         """
         pass
 
+    def close(self) -> None:
+        """
+        Releases the resources kept by the engine across calls to `materialize`, such as worker processes.
+        """
+        pass
+
     @abstractmethod
     def teardown_infra(
         self,
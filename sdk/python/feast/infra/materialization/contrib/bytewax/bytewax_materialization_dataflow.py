@@ -31,12 +31,9 @@ class BytewaxMaterializationDataflow:
     def process_path(self, path):
         fs = s3fs.S3FileSystem()
         dataset = pq.ParquetDataset(path, filesystem=fs, use_legacy_dataset=False)
-        batches = []
+        # Yield the batches as they are read, instead of loading the whole file in memory.
         for fragment in dataset.fragments:
-            for batch in fragment.to_table().to_batches():
-                batches.append(batch)
-
-        return batches
+            yield from fragment.to_batches()
 
     def input_builder(self, worker_index, worker_count, _state):
         worker_paths = distribute(self.paths, worker_index, worker_count)
@@ -1,7 +1,31 @@
+import copy
+import functools
+import multiprocessing
+import threading
+from abc import ABC, abstractmethod
+from concurrent.futures import (
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Callable, List, Literal, Optional, Sequence, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Literal,
+    Optional,
+    Sequence,
+    Union,
+)
 
+import pyarrow as pa
+from pydantic import StrictInt
 from tqdm import tqdm
 
 from feast.batch_feature_view import BatchFeatureView
@@ -14,9 +38,11 @@ from feast.repo_config import FeastConfigBaseModel, RepoConfig
 from feast.stream_feature_view import StreamFeatureView
 from feast.utils import (
     _convert_arrow_to_proto,
+    _convert_arrow_to_serialized_rows,
     _get_column_names,
     _run_pyarrow_field_mapping,
 )
+from feast.value_type import ValueType
 
 from .batch_materialization_engine import (
     BatchMaterializationEngine,
@@ -34,6 +60,24 @@ class LocalMaterializationEngineConfig(FeastConfigBaseModel):
     type: Literal["local"] = "local"
     """ Type selector"""
 
+    batch_size: StrictInt = DEFAULT_BATCH_SIZE
+    """ (optional) Number of rows converted and written to the online store at a time. """
+
+    conversion_processes: StrictInt = 0
+    """ (optional) Number of worker processes converting batches to the online store format. If 0, batches
+    are converted by the thread materializing the feature view. """
+
+    write_threads: StrictInt = 1
+    """ (optional) Number of threads writing converted batches to the online store. More than one thread
+    requires an online store whose client can be shared across threads. """
+
+    feature_view_threads: StrictInt = 1
+    """ (optional) Number of feature views materialized concurrently, when several are materialized at once. """
+
+    max_pending_batches: Optional[StrictInt] = None
+    """ (optional) Maximum number of batches being converted or waiting to be written, which bounds the memory
+    used by the pipeline. Defaults to twice the number of conversion processes and write threads. """
+
 
 @dataclass
 class LocalMaterializationJob(MaterializationJob):
@@ -103,21 +147,65 @@ class LocalMaterializationEngine(BatchMaterializationEngine):
             online_store=online_store,
             **kwargs,
         )
+        self._pipeline: Optional[_ParallelPipeline] = None
+        self._pipeline_lock = threading.Lock()
 
     def materialize(
         self, registry, tasks: List[MaterializationTask]
     ) -> List[MaterializationJob]:
-        return [
-            self._materialize_one(
-                registry,
-                task.feature_view,
-                task.start_time,
-                task.end_time,
-                task.project,
-                task.tqdm_builder,
-            )
-            for task in tasks
-        ]
+        engine_config = self.repo_config.batch_engine
+        if (
+            engine_config.conversion_processes == 0
+            and engine_config.write_threads == 1
+            and engine_config.feature_view_threads == 1
+        ):
+            return [
+                self._materialize_one(
+                    registry,
+                    task.feature_view,
+                    task.start_time,
+                    task.end_time,
+                    task.project,
+                    task.tqdm_builder,
+                    _SerialPipeline(engine_config),
+                )
+                for task in tasks
+            ]
+
+        pipeline = self._get_pipeline()
+        with ThreadPoolExecutor(
+            max_workers=engine_config.feature_view_threads
+        ) as feature_view_executor:
+            # The batches of the feature views are converted and written by the shared pipeline, which
+            # overlaps reading the next feature views with converting and writing the previous ones.
+            futures = [
+                feature_view_executor.submit(
+                    self._materialize_one,
+                    registry,
+                    task.feature_view,
+                    task.start_time,
+                    task.end_time,
+                    task.project,
+                    task.tqdm_builder,
+                    pipeline,
+                )
+                for task in tasks
+            ]
+            return [future.result() for future in futures]
+
+    def _get_pipeline(self) -> "_ParallelPipeline":
+        # The pipeline outlives the calls to materialize, so that materializing feature views or chunks one
+        # call at a time doesn't spawn new worker processes for each of them.
+        with self._pipeline_lock:
+            if self._pipeline is None:
+                self._pipeline = _ParallelPipeline(self.repo_config.batch_engine)
+            return self._pipeline
+
+    def close(self) -> None:
+        with self._pipeline_lock:
+            pipeline, self._pipeline = self._pipeline, None
+        if pipeline is not None:
+            pipeline.close()
 
     def _materialize_one(
         self,
@@ -127,6 +215,7 @@ class LocalMaterializationEngine(BatchMaterializationEngine):
         end_date: datetime,
         project: str,
         tqdm_builder: Callable[[int], tqdm],
+        pipeline: "_Pipeline",
     ):
         entities = []
         for entity_name in feature_view.entities:
@@ -153,29 +242,40 @@ class LocalMaterializationEngine(BatchMaterializationEngine):
                 end_date=end_date,
             )
 
-            table = offline_job.to_arrow()
-
-            if feature_view.batch_source.field_mapping is not None:
-                table = _run_pyarrow_field_mapping(
-                    table, feature_view.batch_source.field_mapping
-                )
-
             join_key_to_value_type = {
                 entity.name: entity.dtype.to_value_type()
                 for entity in feature_view.entity_columns
             }
 
-            with tqdm_builder(table.num_rows) as pbar:
-                for batch in table.to_batches(DEFAULT_BATCH_SIZE):
-                    rows_to_write = _convert_arrow_to_proto(
-                        batch, feature_view, join_key_to_value_type
-                    )
-                    self.online_store.online_write_batch(
-                        self.repo_config,
-                        feature_view,
-                        rows_to_write,
-                        lambda x: pbar.update(x),
-                    )
+            # The rows are read incrementally, so the total of the progress bar grows as they are read.
+            with tqdm_builder(0) as pbar:
+
+                def read_batches():
+                    for batch in offline_job.to_arrow_batches(pipeline.batch_size):
+                        if feature_view.batch_source.field_mapping is not None:
+                            batch = _run_pyarrow_field_mapping(
+                                batch, feature_view.batch_source.field_mapping
+                            )
+                        pbar.total += batch.num_rows
+                        pbar.refresh()
+                        yield batch
+
+                pipeline.run(
+                    read_batches(),
+                    # A partial of a module function, which can be sent to worker processes. Feature
+                    # views read from the registry hold protobuf containers that can't be pickled, unlike
+                    # their copies.
+                    functools.partial(
+                        _convert_batch,
+                        feature_view=copy.copy(feature_view),
+                        join_key_to_value_type=join_key_to_value_type,
+                        entity_key_serialization_version=self.repo_config.entity_key_serialization_version,
+                        serialized=self.online_store.supports_serialized_writes(),
+                    ),
+                    lambda batch, rows: self._write_batch(
+                        feature_view, batch, rows, pbar
+                    ),
+                )
             return LocalMaterializationJob(
                 job_id=job_id, status=MaterializationJobStatus.SUCCEEDED
             )
@@ -183,3 +283,137 @@ class LocalMaterializationEngine(BatchMaterializationEngine):
             return LocalMaterializationJob(
                 job_id=job_id, status=MaterializationJobStatus.ERROR, error=e
             )
+
+    def _write_batch(
+        self,
+        feature_view: Union[BatchFeatureView, StreamFeatureView, FeatureView],
+        batch: pa.RecordBatch,
+        rows,
+        pbar: tqdm,
+    ):
+        if isinstance(rows, pa.RecordBatch):
+            self.online_store.online_write_batch_serialized(
+                self.repo_config, feature_view, rows
+            )
+            pbar.update(batch.num_rows)
+        else:
+            self.online_store.online_write_batch(
+                self.repo_config,
+                feature_view,
+                rows,
+                lambda x: pbar.update(x),
+            )
+
+
+def _convert_batch(
+    batch: pa.RecordBatch,
+    feature_view: Union[BatchFeatureView, StreamFeatureView, FeatureView],
+    join_key_to_value_type: Dict[str, ValueType],
+    entity_key_serialization_version: int,
+    serialized: bool,
+):
+    """Converts a batch of rows to the input of the online store's write method."""
+    if serialized:
+        return _convert_arrow_to_serialized_rows(
+            batch,
+            feature_view,
+            join_key_to_value_type,
+            entity_key_serialization_version,
+        )
+    return _convert_arrow_to_proto(batch, feature_view, join_key_to_value_type)
+
+
+class _Pipeline(ABC):
+    """Converts and writes the batches of rows of feature views."""
+
+    def __init__(self, engine_config: LocalMaterializationEngineConfig):
+        self.batch_size = engine_config.batch_size
+
+    @abstractmethod
+    def run(
+        self,
+        batches: Iterable[pa.RecordBatch],
+        convert: Callable[[pa.RecordBatch], Any],
+        write: Callable[[pa.RecordBatch, Any], None],
+    ):
+        ...
+
+
+class _SerialPipeline(_Pipeline):
+    """Converts and writes the batches one after another, in the calling thread."""
+
+    def run(self, batches, convert, write):
+        for batch in batches:
+            write(batch, convert(batch))
+
+
+class _ParallelPipeline(_Pipeline):
+    """
+    Converts batches in a process pool and writes them in a thread pool, which are shared by all the
+    feature views being materialized until the pipeline is closed. A semaphore bounds the number of batches in flight, so that
+    reading a feature view blocks until earlier batches have been written.
+    """
+
+    def __init__(self, engine_config: LocalMaterializationEngineConfig):
+        super().__init__(engine_config)
+        self._conversion_executor: Optional[Executor] = None
+        if engine_config.conversion_processes > 0:
+            # The worker processes are spawned rather than forked, since forking while the write and
+            # feature view threads hold locks could deadlock the children.
+            self._conversion_executor = ProcessPoolExecutor(
+                max_workers=engine_config.conversion_processes,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        self._write_executor = ThreadPoolExecutor(
+            max_workers=engine_config.write_threads
+        )
+        max_pending_batches = engine_config.max_pending_batches or 2 * (
+            engine_config.conversion_processes + engine_config.write_threads
+        )
+        self._pending_batches = threading.BoundedSemaphore(max_pending_batches)
+
+    def close(self):
+        self._write_executor.shutdown()
+        if self._conversion_executor:
+            self._conversion_executor.shutdown()
+
+    def run(self, batches, convert, write):
+        write_failed = threading.Event()
+
+        def on_write_done(write_future: Future):
+            self._pending_batches.release()
+            if write_future.exception():
+                write_failed.set()
+
+        write_futures: List[Future] = []
+        try:
+            for batch in batches:
+                # Stop reading batches once a write failed.
+                if write_failed.is_set():
+                    break
+                self._pending_batches.acquire()
+                try:
+                    converted = self._convert(convert, batch)
+                    write_future = self._write_executor.submit(
+                        _write_converted, write, batch, converted
+                    )
+                except BaseException:
+                    self._pending_batches.release()
+                    raise
+                write_future.add_done_callback(on_write_done)
+                write_futures.append(write_future)
+        finally:
+            wait(write_futures)
+        for write_future in write_futures:
+            write_future.result()
+
+    def _convert(self, convert, batch: pa.RecordBatch) -> Future:
+        if self._conversion_executor is None:
+            rows: Future = Future()
+            rows.set_result(convert(batch))
+            return rows
+        return self._conversion_executor.submit(convert, batch)
+
+
+def _write_converted(write, batch: pa.RecordBatch, converted: Future):
+    write(batch, converted.result())
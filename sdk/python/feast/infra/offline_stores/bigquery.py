@@ -515,6 +515,23 @@ class BigQueryRetrievalJob(RetrievalJob):
             assert q
             return q.to_arrow()
 
+    def _to_arrow_batches_internal(
+        self,
+        batch_size: Optional[int] = None,
+        timeout: Optional[int] = None,
+    ) -> Iterator[pyarrow.RecordBatch]:
+        with self._query_generator() as query:
+            q = self._execute_query(query=query, timeout=timeout)
+            assert q
+            rows = q.result()
+            if not hasattr(rows, "to_arrow_iterable"):
+                # Older versions of google-cloud-bigquery can only read the whole result at once.
+                yield from rows.to_arrow().to_batches(batch_size)
+                return
+            # The result pages are downloaded as they are consumed, with the BigQuery Storage API if available.
+            for pa_batch in rows.to_arrow_iterable():
+                yield from pyarrow.Table.from_batches([pa_batch]).to_batches(batch_size)
+
     @log_exceptions_and_usage
     def _execute_query(
         self, query, job_config=None, timeout: Optional[int] = None
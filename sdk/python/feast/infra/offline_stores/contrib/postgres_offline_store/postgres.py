@@ -1,4 +1,5 @@
 import contextlib
+import uuid
 from dataclasses import asdict
 from datetime import datetime
 from typing import (
@@ -49,6 +50,9 @@ from feast.usage import log_exceptions_and_usage
 
 from .postgres_source import PostgreSQLSource
 
+# Number of rows fetched at a time by `to_arrow_batches`, when no batch size is given.
+DEFAULT_FETCH_SIZE = 10_000
+
 
 class PostgreSQLOfflineStoreConfig(PostgreSQLConfig):
     type: Literal["postgres"] = "postgres"
@@ -280,23 +284,33 @@ class PostgreSQLRetrievalJob(RetrievalJob):
             with _get_conn(self.config.offline_store) as conn, conn.cursor() as cur:
                 conn.set_session(readonly=True)
                 cur.execute(query)
-                fields = [
-                    (c.name, pg_type_code_to_arrow(c.type_code))
-                    for c in cur.description
-                ]
+                schema = _cursor_arrow_schema(cur)
                 data = cur.fetchall()
-                schema = pa.schema(fields)
-                # TODO: Fix...
-                data_transposed: List[List[Any]] = []
-                for col in range(len(fields)):
-                    data_transposed.append([])
-                    for row in range(len(data)):
-                        data_transposed[col].append(data[row][col])
-
-                table = pa.Table.from_arrays(
-                    [pa.array(row) for row in data_transposed], schema=schema
+                return pa.Table.from_arrays(
+                    _rows_to_arrays(data, len(schema)), schema=schema
                 )
-                return table
+
+    def _to_arrow_batches_internal(
+        self,
+        batch_size: Optional[int] = None,
+        timeout: Optional[int] = None,
+    ) -> Iterator[pa.RecordBatch]:
+        batch_size = batch_size or DEFAULT_FETCH_SIZE
+        with self._query_generator() as query:
+            with _get_conn(self.config.offline_store) as conn:
+                conn.set_session(readonly=True)
+                # A named cursor is a server-side cursor, which fetches the rows in batches.
+                with conn.cursor(name=f"feast_{uuid.uuid4().hex}") as cur:
+                    cur.execute(query)
+                    while True:
+                        data = cur.fetchmany(batch_size)
+                        if not data:
+                            break
+                        # The description of a named cursor is only set after the first fetch.
+                        schema = _cursor_arrow_schema(cur)
+                        yield pa.RecordBatch.from_arrays(
+                            _rows_to_arrays(data, len(schema)), schema=schema
+                        )
 
     @property
     def metadata(self) -> Optional[RetrievalMetadata]:
@@ -317,6 +331,18 @@ class PostgreSQLRetrievalJob(RetrievalJob):
         )
 
 
+def _cursor_arrow_schema(cur) -> pa.Schema:
+    return pa.schema(
+        [(c.name, pg_type_code_to_arrow(c.type_code)) for c in cur.description]
+    )
+
+
+def _rows_to_arrays(data: List[Tuple[Any, ...]], num_columns: int) -> List[pa.Array]:
+    if not data:
+        return [pa.array([]) for _ in range(num_columns)]
+    return [pa.array(column) for column in zip(*data)]
+
+
 def _get_entity_df_event_timestamp_range(
     entity_df: Union[pd.DataFrame, str],
     entity_df_event_timestamp_col: str,
@@ -1,15 +1,35 @@
+import functools
+import multiprocessing
+import operator
 import os
+import tempfile
 import uuid
-from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Callable, List, Optional, Tuple, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
 import dask.dataframe as dd
+import numpy as np
 import pandas as pd
 import pyarrow
 import pyarrow.dataset
+import pyarrow.ipc
 import pyarrow.parquet
 import pytz
+from pydantic import StrictInt
 from pydantic.typing import Literal
 
 from feast.data_source import DataSource
@@ -50,6 +70,21 @@ class FileOfflineStoreConfig(FeastConfigBaseModel):
     type: Literal["file"] = "file"
     """ Offline store type selector"""
 
+    engine: Literal["dask", "arrow"] = "dask"
+    """ Engine running historical retrievals. "dask" merges each feature view with the entity dataframe and
+    then filters and deduplicates the result with Dask. "arrow" only reads the columns and the time range of
+    each source needed for the entity dataframe, through a pyarrow dataset, and joins them with a sorted
+    as-of join (`pandas.merge_asof`), which keeps a single row per entity row in memory. """
+
+    partitions: StrictInt = 1
+    """ (optional) Number of partitions the "arrow" engine splits historical retrievals into, by hashing the
+    join keys shared by all the feature views. Partitions are spilled to a temporary directory and joined one
+    at a time, so that only a partition of the sources is held in memory by each process joining them. """
+
+    join_processes: StrictInt = 0
+    """ (optional) Number of worker processes joining partitions, when there is more than one. If 0,
+    partitions are joined by the process running the retrieval. """
+
 
 class FileRetrievalJob(RetrievalJob):
     def __init__(
@@ -78,16 +113,34 @@ class FileRetrievalJob(RetrievalJob):
     @log_exceptions_and_usage
     def _to_df_internal(self, timeout: Optional[int] = None) -> pd.DataFrame:
         # Only execute the evaluation function to build the final historical retrieval dataframe at the last moment.
-        df = self.evaluation_function().compute()
+        df = _compute(self.evaluation_function())
         df = df.reset_index(drop=True)
         return df
 
     @log_exceptions_and_usage
     def _to_arrow_internal(self, timeout: Optional[int] = None):
         # Only execute the evaluation function to build the final historical retrieval dataframe at the last moment.
-        df = self.evaluation_function().compute()
+        df = _compute(self.evaluation_function())
         return pyarrow.Table.from_pandas(df)
 
+    def _to_arrow_batches_internal(
+        self,
+        batch_size: Optional[int] = None,
+        timeout: Optional[int] = None,
+    ) -> Iterator[pyarrow.RecordBatch]:
+        result = self.evaluation_function()
+        # Compute the partitions of dask dataframes one at a time.
+        partitions = (
+            (partition.compute() for partition in result.to_delayed())
+            if isinstance(result, dd.DataFrame)
+            else [result]
+        )
+        for df in partitions:
+            if len(df):
+                yield from pyarrow.Table.from_pandas(
+                    df, preserve_index=False
+                ).to_batches(batch_size)
+
     def persist(
         self,
         storage: SavedDatasetStorage,
@@ -238,7 +291,25 @@ class FileOfflineStore(OfflineStore):
 
                 all_join_keys = list(set(all_join_keys + join_keys))
 
-                df_to_join = _read_datasource(feature_view.batch_source)
+                dataset_schema = _get_dataset(feature_view.batch_source).schema
+                source_columns = _get_source_columns(
+                    dataset_schema.names,
+                    feature_view,
+                    set(right_entity_key_columns + features),
+                )
+                start_date = None
+                if feature_view.ttl and feature_view.ttl.total_seconds() != 0:
+                    start_date = entity_df_event_timestamp_range[0] - feature_view.ttl
+                df_to_join = _read_datasource(
+                    feature_view.batch_source,
+                    columns=list(source_columns),
+                    filters=_timestamp_range_filters(
+                        dataset_schema,
+                        _get_source_column(source_columns, timestamp_field),
+                        start_date,
+                        entity_df_event_timestamp_range[1],
+                    ),
+                )
 
                 df_to_join, timestamp_field = _field_mapping(
                     df_to_join,
@@ -280,8 +351,22 @@ class FileOfflineStore(OfflineStore):
 
             return entity_df_with_features.persist()
 
+        evaluation_function: Callable[[], Union[dd.DataFrame, pd.DataFrame]]
+        if config.offline_store.engine == "arrow":
+            evaluation_function = functools.partial(
+                _arrow_historical_retrieval,
+                entity_df,
+                entity_df_event_timestamp_col,
+                feature_views_to_features,
+                full_feature_names,
+                partitions=config.offline_store.partitions,
+                join_processes=config.offline_store.join_processes,
+            )
+        else:
+            evaluation_function = evaluate_historical_retrieval
+
         job = FileRetrievalJob(
-            evaluation_function=evaluate_historical_retrieval,
+            evaluation_function=evaluation_function,
             full_feature_names=full_feature_names,
             on_demand_feature_views=OnDemandFeatureView.get_requested_odfvs(
                 feature_refs, project, registry
@@ -312,7 +397,30 @@ class FileOfflineStore(OfflineStore):
 
         # Create lazy function that is only called from the RetrievalJob object
         def evaluate_offline_job():
-            source_df = _read_datasource(data_source)
+            dataset_schema = _get_dataset(data_source).schema
+            ts_columns = (
+                [timestamp_field, created_timestamp_column]
+                if created_timestamp_column
+                else [timestamp_field]
+            )
+            # Missing join keys are reported below.
+            source_df = _read_datasource(
+                data_source,
+                columns=[
+                    column
+                    for column in dict.fromkeys(
+                        join_key_columns + feature_name_columns + ts_columns
+                    )
+                    if column in dataset_schema.names
+                ],
+                filters=_timestamp_range_filters(
+                    dataset_schema,
+                    timestamp_field,
+                    start_date,
+                    end_date,
+                    include_end_date=False,
+                ),
+            )
 
             source_df = _normalize_timestamp(
                 source_df, timestamp_field, created_timestamp_column
@@ -324,11 +432,6 @@ class FileOfflineStore(OfflineStore):
                     data_source.path, set(join_key_columns), source_columns
                 )
 
-            ts_columns = (
-                [timestamp_field, created_timestamp_column]
-                if created_timestamp_column
-                else [timestamp_field]
-            )
             # try-catch block is added to deal with this issue https://github.com/dask/dask/issues/8939.
             # TODO(kevjumba): remove try catch when fix is merged upstream in Dask.
             try:
@@ -492,7 +595,467 @@ def _get_entity_df_event_timestamp_range(
     )
 
 
-def _read_datasource(data_source) -> dd.DataFrame:
+def _compute(result: Union[dd.DataFrame, pd.DataFrame]) -> pd.DataFrame:
+    return result.compute() if isinstance(result, dd.DataFrame) else result
+
+
+@dataclass(frozen=True)
+class _FeatureViewJoin:
+    """The parameters of the as-of join of a feature view, which can be sent to worker processes."""
+
+    join_keys: List[str]
+    features: List[str]
+    timestamp_field: str
+    created_timestamp_column: Optional[str]
+    ttl: Optional[timedelta]
+
+
+def _arrow_historical_retrieval(
+    entity_df: Union[pd.DataFrame, dd.DataFrame],
+    entity_df_event_timestamp_col: str,
+    feature_views_to_features: Dict[FeatureView, List[str]],
+    full_feature_names: bool,
+    partitions: int = 1,
+    join_processes: int = 0,
+) -> pd.DataFrame:
+    """
+    Runs a point-in-time join with the "arrow" engine: each feature view is read with only the columns and
+    time range needed for the entity dataframe, and joined to it with a sorted as-of join.
+
+    With more than one partition, the entity dataframe and the sources are hash-partitioned on the join keys
+    shared by all the feature views, and spilled to a temporary directory. The partitions are then joined
+    one at a time, by `join_processes` worker processes or by this process if there are none.
+    """
+    entity_df = _compute(entity_df)
+    # Tz-naive timestamps are assumed to be in UTC.
+    entity_df = entity_df.assign(
+        **{
+            entity_df_event_timestamp_col: pd.to_datetime(
+                entity_df[entity_df_event_timestamp_col], utc=True
+            )
+        }
+    )
+    event_timestamps = entity_df[entity_df_event_timestamp_col]
+
+    joins = []
+    sources = []
+    for feature_view, features in feature_views_to_features.items():
+        join_keys = [
+            feature_view.projection.join_key_map.get(
+                entity_column.name, entity_column.name
+            )
+            for entity_column in feature_view.entity_columns
+        ]
+        ttl = None
+        start_date = None
+        if feature_view.ttl and feature_view.ttl.total_seconds() != 0:
+            ttl = feature_view.ttl
+            start_date = event_timestamps.min() - ttl
+        joins.append(
+            _FeatureViewJoin(
+                join_keys=join_keys,
+                features=features,
+                timestamp_field=feature_view.batch_source.timestamp_field,
+                created_timestamp_column=feature_view.batch_source.created_timestamp_column,
+                ttl=ttl,
+            )
+        )
+        sources.append(
+            _scan_feature_view_source(
+                feature_view,
+                features,
+                join_keys,
+                full_feature_names,
+                start_date,
+                event_timestamps.max(),
+            )
+        )
+
+    partition_keys = sorted(
+        set(joins[0].join_keys).intersection(*(join.join_keys for join in joins))
+        if joins
+        else []
+    )
+    if partitions <= 1 or not partition_keys or entity_df.empty:
+        return _point_in_time_join(
+            entity_df,
+            entity_df_event_timestamp_col,
+            (
+                (
+                    join,
+                    _to_feature_view_df(
+                        pyarrow.Table.from_batches(batches, schema), join
+                    ),
+                )
+                for join, (schema, batches) in zip(joins, sources)
+            ),
+        )
+
+    key_dtypes = entity_df.dtypes[partition_keys]
+    with tempfile.TemporaryDirectory() as spill_dir:
+        entity_df_partitions = _hash_partitions(entity_df[partition_keys], partitions)
+        tasks = []
+        for partition in range(partitions):
+            entity_df_partition = entity_df[entity_df_partitions == partition]
+            if entity_df_partition.empty:
+                continue
+            entity_df_path = os.path.join(spill_dir, f"entity_df-{partition}.pkl")
+            entity_df_partition.to_pickle(entity_df_path)
+            tasks.append(
+                (
+                    entity_df_path,
+                    [
+                        (join, os.path.join(spill_dir, f"{i}-{partition}.arrow"))
+                        for i, join in enumerate(joins)
+                    ],
+                )
+            )
+
+        for i, (schema, batches) in enumerate(sources):
+            _spill_partitions(
+                schema,
+                batches,
+                key_dtypes,
+                [
+                    os.path.join(spill_dir, f"{i}-{partition}.arrow")
+                    for partition in range(partitions)
+                ],
+            )
+
+        join_partition = functools.partial(
+            _join_partition, entity_df_event_timestamp_col=entity_df_event_timestamp_col
+        )
+        if join_processes > 0:
+            # The worker processes are spawned rather than forked, since forking while other threads of this
+            # process hold locks could deadlock the children.
+            with ProcessPoolExecutor(
+                max_workers=join_processes,
+                mp_context=multiprocessing.get_context("spawn"),
+            ) as executor:
+                results = list(executor.map(join_partition, *zip(*tasks)))
+        else:
+            results = [join_partition(*task) for task in tasks]
+
+    return pd.concat(results, ignore_index=True).sort_values(
+        entity_df_event_timestamp_col, kind="stable", ignore_index=True
+    )
+
+
+def _point_in_time_join(
+    entity_df: pd.DataFrame,
+    entity_df_event_timestamp_col: str,
+    joins: Iterable[Tuple[_FeatureViewJoin, pd.DataFrame]],
+) -> pd.DataFrame:
+    """
+    Joins the rows of each feature view to the entity dataframe. The feature views are only iterated over
+    as they are joined, so that a single one can be held in memory at a time.
+    """
+    entity_df_with_features = entity_df.sort_values(
+        entity_df_event_timestamp_col, kind="stable"
+    )
+
+    all_join_keys: List[str] = []
+    for join, df_to_join in joins:
+        timestamp_field = join.timestamp_field
+        all_join_keys = list(set(all_join_keys + join.join_keys))
+
+        # Make sure to not have duplicated columns
+        if entity_df_event_timestamp_col == timestamp_field:
+            df_to_join = df_to_join.rename(
+                columns={timestamp_field: f"__{timestamp_field}"}
+            )
+            timestamp_field = f"__{timestamp_field}"
+
+        entity_df_with_features = _merge_asof(
+            entity_df_with_features,
+            df_to_join,
+            join.join_keys,
+            entity_df_event_timestamp_col,
+            timestamp_field,
+            join.created_timestamp_column,
+            join.ttl,
+        )
+        del df_to_join
+
+        # Like the dask engine, keep a single row per entity and event timestamp.
+        entity_df_with_features = entity_df_with_features.drop_duplicates(
+            all_join_keys + [entity_df_event_timestamp_col], keep="last"
+        )
+        entity_df_with_features = entity_df_with_features.drop(
+            columns=[
+                column
+                for column in (timestamp_field, join.created_timestamp_column)
+                if column and column not in join.features
+            ]
+        )
+
+    return entity_df_with_features.reset_index(drop=True)
+
+
+def _join_partition(
+    entity_df_path: str,
+    joins: List[Tuple[_FeatureViewJoin, str]],
+    entity_df_event_timestamp_col: str,
+) -> pd.DataFrame:
+    """Runs the point-in-time join of a partition spilled by `_arrow_historical_retrieval`."""
+    return _point_in_time_join(
+        pd.read_pickle(entity_df_path),
+        entity_df_event_timestamp_col,
+        (
+            (
+                join,
+                _to_feature_view_df(
+                    pyarrow.ipc.open_file(pyarrow.memory_map(path)).read_all(), join
+                ),
+            )
+            for join, path in joins
+        ),
+    )
+
+
+def _hash_partitions(keys: pd.DataFrame, partitions: int) -> np.ndarray:
+    return pd.util.hash_pandas_object(keys, index=False).to_numpy() % partitions
+
+
+def _spill_partitions(
+    schema: pyarrow.Schema,
+    batches: Iterator[pyarrow.RecordBatch],
+    key_dtypes: pd.Series,
+    paths: List[str],
+):
+    """
+    Writes the rows of a feature view to one Arrow file per partition, batch by batch. The join keys are
+    hashed with the types of the entity dataframe, so that equal keys land in the same partition.
+    """
+    writers = [pyarrow.ipc.new_file(path, schema) for path in paths]
+    try:
+        for batch in batches:
+            keys = pd.DataFrame(
+                {
+                    key: batch.column(schema.get_field_index(key))
+                    .to_pandas()
+                    .astype(dtype)
+                    for key, dtype in key_dtypes.items()
+                }
+            )
+            batch_partitions = _hash_partitions(keys, len(paths))
+            order = np.argsort(batch_partitions, kind="stable")
+            batch = batch.take(pyarrow.array(order))
+            bounds = np.searchsorted(batch_partitions[order], np.arange(len(paths) + 1))
+            for writer, start, stop in zip(writers, bounds[:-1], bounds[1:]):
+                if stop > start:
+                    writer.write_batch(batch.slice(start, stop - start))
+    finally:
+        for writer in writers:
+            writer.close()
+
+
+def _scan_feature_view_source(
+    feature_view: FeatureView,
+    features: List[str],
+    join_keys: List[str],
+    full_feature_names: bool,
+    start_date: Optional[datetime],
+    end_date: datetime,
+) -> Tuple[pyarrow.Schema, Iterator[pyarrow.RecordBatch]]:
+    """
+    Scans the join keys, timestamps and features of a feature view from its source, with the columns named
+    as in the entity dataframe and the output of the retrieval. Only the columns needed are read, and only
+    the rows with an event timestamp between `start_date` (if any) and `end_date`.
+    """
+    data_source = feature_view.batch_source
+    assert isinstance(data_source, FileSource)
+    timestamp_field = data_source.timestamp_field
+    created_timestamp_column = data_source.created_timestamp_column
+
+    columns_map = {
+        feature: f"{feature_view.projection.name_to_use()}__{feature}"
+        if full_feature_names
+        else feature
+        for feature in features
+    }
+    mapped_columns = set(
+        join_keys
+        + [column for column in (timestamp_field, created_timestamp_column) if column]
+        + features
+    )
+
+    dataset = _get_dataset(data_source)
+    source_to_mapped = _get_source_columns(
+        dataset.schema.names, feature_view, mapped_columns
+    )
+    filters = _timestamp_range_filters(
+        dataset.schema,
+        _get_source_column(source_to_mapped, timestamp_field),
+        start_date,
+        end_date,
+    )
+    names = [columns_map.get(mapped, mapped) for mapped in source_to_mapped.values()]
+    schema = pyarrow.schema(
+        [
+            (name, dataset.schema.field(column).type)
+            for column, name in zip(source_to_mapped, names)
+        ]
+    )
+    batches = (
+        pyarrow.RecordBatch.from_arrays(batch.columns, names=names)
+        for batch in dataset.to_batches(
+            columns=list(source_to_mapped),
+            filter=_filters_to_expression(filters) if filters else None,
+        )
+    )
+    return schema, batches
+
+
+def _to_feature_view_df(table: pyarrow.Table, join: _FeatureViewJoin) -> pd.DataFrame:
+    df = table.to_pandas()
+    for column in (join.timestamp_field, join.created_timestamp_column):
+        if column and column not in join.features:
+            # Tz-naive timestamps are assumed to be in UTC.
+            df[column] = pd.to_datetime(df[column], utc=True)
+    return df
+
+
+def _get_dataset(data_source: FileSource) -> pyarrow.dataset.Dataset:
+    filesystem, path = FileSource.create_filesystem_and_path(
+        data_source.path, data_source.file_options.s3_endpoint_override
+    )
+    return pyarrow.dataset.dataset(
+        path, filesystem=filesystem, format="parquet", partitioning="hive"
+    )
+
+
+def _get_source_columns(
+    source_columns: List[str], feature_view: FeatureView, mapped_columns: Set[str]
+) -> Dict[str, str]:
+    """
+    Returns the columns of the source of a feature view which are named as one of `mapped_columns` once
+    the field mapping of the source and then the join key map of the projection are applied, along with
+    these names.
+    """
+    source_to_mapped = {}
+    for name in source_columns:
+        mapped_name = feature_view.batch_source.field_mapping.get(name, name)
+        mapped_name = feature_view.projection.join_key_map.get(mapped_name, mapped_name)
+        if mapped_name in mapped_columns:
+            source_to_mapped[name] = mapped_name
+    return source_to_mapped
+
+
+def _get_source_column(
+    source_to_mapped: Dict[str, str], mapped_name: str
+) -> Optional[str]:
+    return next(
+        (name for name, mapped in source_to_mapped.items() if mapped == mapped_name),
+        None,
+    )
+
+
+def _timestamp_range_filters(
+    schema: pyarrow.Schema,
+    timestamp_field: Optional[str],
+    start_date: Optional[datetime],
+    end_date: Optional[datetime],
+    include_end_date: bool = True,
+) -> List[Tuple[str, str, datetime]]:
+    """
+    Returns the filters bounding the event timestamps of a dataset, in the format of the `filters` of
+    `dask.dataframe.read_parquet`. No filters are returned if the timestamps aren't stored as timestamps.
+    """
+    if timestamp_field not in schema.names:
+        return []
+    field = schema.field(timestamp_field)
+    if not pyarrow.types.is_timestamp(field.type):
+        return []
+
+    def to_column_timezone(date: datetime) -> datetime:
+        # Tz-naive timestamps are assumed to be in UTC.
+        date = date.astimezone(pytz.utc) if date.tzinfo else date
+        return date.replace(tzinfo=pytz.utc if field.type.tz else None)
+
+    filters = []
+    if start_date is not None:
+        filters.append((field.name, ">=", to_column_timezone(start_date)))
+    if end_date is not None:
+        filters.append(
+            (
+                field.name,
+                "<=" if include_end_date else "<",
+                to_column_timezone(end_date),
+            )
+        )
+    return filters
+
+
+def _filters_to_expression(
+    filters: List[Tuple[str, str, Any]]
+) -> pyarrow.dataset.Expression:
+    """Combines `read_parquet`-style filters into a pyarrow dataset expression."""
+    comparisons = {
+        "<": operator.lt,
+        "<=": operator.le,
+        ">": operator.gt,
+        ">=": operator.ge,
+        "==": operator.eq,
+    }
+    return functools.reduce(
+        operator.and_,
+        (
+            comparisons[op](pyarrow.dataset.field(name), value)
+            for name, op, value in filters
+        ),
+    )
+
+
+def _merge_asof(
+    entity_df_with_features: pd.DataFrame,
+    df_to_join: pd.DataFrame,
+    join_keys: List[str],
+    entity_df_event_timestamp_col: str,
+    timestamp_field: str,
+    created_timestamp_column: Optional[str],
+    ttl: Optional[timedelta],
+) -> pd.DataFrame:
+    """
+    Joins the latest row of a feature view at or before the event timestamp of each entity row, and at
+    most `ttl` before it. Ties on the event timestamp are broken by the created timestamp.
+    """
+    df_to_join = df_to_join.dropna(subset=[timestamp_field]).sort_values(
+        [column for column in (timestamp_field, created_timestamp_column) if column],
+        na_position="first",
+        kind="stable",
+    )
+    for join_key in join_keys:
+        # merge_asof requires the join keys to have the same type on both sides.
+        if df_to_join[join_key].dtype != entity_df_with_features[join_key].dtype:
+            df_to_join[join_key] = df_to_join[join_key].astype(
+                entity_df_with_features[join_key].dtype
+            )
+
+    tolerance = pd.Timedelta(ttl) if ttl else None
+
+    return pd.merge_asof(
+        entity_df_with_features,
+        df_to_join,
+        left_on=entity_df_event_timestamp_col,
+        right_on=timestamp_field,
+        by=join_keys or None,
+        tolerance=tolerance,
+        allow_exact_matches=True,
+        direction="backward",
+        suffixes=("", "__"),
+    )
+
+
+def _read_datasource(
+    data_source,
+    columns: Optional[List[str]] = None,
+    filters: Optional[List[Tuple[str, str, Any]]] = None,
+) -> dd.DataFrame:
+    """
+    Reads a file source, or only some of its columns. The filters skip the row groups and the hive
+    partitions which can't match them, and may also filter rows, so they must be applied again.
+    """
     storage_options = (
         {
             "client_kwargs": {
@@ -505,6 +1068,8 @@ def _read_datasource(data_source) -> dd.DataFrame:
 
     return dd.read_parquet(
         data_source.path,
+        columns=columns,
+        filters=filters or None,
         storage_options=storage_options,
     )
 
@@ -15,7 +15,7 @@ import warnings
 from abc import ABC, abstractmethod
 from datetime import datetime
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Callable, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Callable, Iterator, List, Optional, Union
 
 import pandas as pd
 import pyarrow
@@ -146,6 +146,27 @@ class RetrievalJob(ABC):
 
         return pyarrow.Table.from_pandas(features_df)
 
+    def to_arrow_batches(
+        self,
+        batch_size: Optional[int] = None,
+        timeout: Optional[int] = None,
+    ) -> Iterator[pyarrow.RecordBatch]:
+        """
+        Synchronously executes the underlying query and returns the result as an iterator of arrow
+        record batches.
+
+        Offline stores that support it read the result incrementally, so that it doesn't have to fit in
+        memory. If there are on demand transformations, the whole result is read with `to_arrow` instead.
+
+        Args:
+            batch_size (optional): The maximum number of rows of each batch. If not set, the batches have
+                the size in which the offline store returns results.
+            timeout (optional): The query timeout if applicable.
+        """
+        if self.on_demand_feature_views:
+            return iter(self.to_arrow(timeout=timeout).to_batches(batch_size))
+        return self._to_arrow_batches_internal(batch_size=batch_size, timeout=timeout)
+
     def to_sql(self) -> str:
         """
         Return RetrievalJob generated SQL statement if applicable.
@@ -176,6 +197,22 @@ class RetrievalJob(ABC):
         """
         pass
 
+    def _to_arrow_batches_internal(
+        self,
+        batch_size: Optional[int] = None,
+        timeout: Optional[int] = None,
+    ) -> Iterator[pyarrow.RecordBatch]:
+        """
+        Synchronously executes the underlying query and returns the result as an iterator of arrow
+        record batches.
+
+        By default, the whole result is read with `_to_arrow_internal`. RetrievalJob implementations that
+        can read results incrementally should override this method.
+
+        Does not handle on demand transformations. For those, `to_arrow_batches` should be used.
+        """
+        return iter(self._to_arrow_internal(timeout=timeout).to_batches(batch_size))
+
     @property
     @abstractmethod
     def full_feature_names(self) -> bool:
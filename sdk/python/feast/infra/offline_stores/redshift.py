@@ -456,6 +456,25 @@ class RedshiftRetrievalJob(RetrievalJob):
                 query,
             )
 
+    def _to_arrow_batches_internal(
+        self,
+        batch_size: Optional[int] = None,
+        timeout: Optional[int] = None,
+    ) -> Iterator[pa.RecordBatch]:
+        with self._query_generator() as query:
+            yield from aws_utils.unload_redshift_query_to_pa_batches(
+                self._redshift_client,
+                self._config.offline_store.cluster_id,
+                self._config.offline_store.workgroup,
+                self._config.offline_store.database,
+                self._config.offline_store.user,
+                self._s3_resource,
+                self._s3_path,
+                self._config.offline_store.iam_role,
+                query,
+                batch_size=batch_size,
+            )
+
     @log_exceptions_and_usage
     def to_s3(self) -> str:
         """Export dataset to S3 in Parquet format and return path"""
@@ -1,5 +1,6 @@
 import hashlib
 import logging
+import re
 from concurrent import futures
 from datetime import datetime
 from typing import Any, Callable, Dict, List, Optional, Sequence, Set, Tuple
@@ -7,12 +8,13 @@ from typing import Any, Callable, Dict, List, Optional, Sequence, Set, Tuple
 import google
 from google.cloud import bigtable
 from google.cloud.bigtable import row_filters
-from pydantic import StrictStr
+from google.cloud.bigtable.table import DEFAULT_RETRY_READ_ROWS
+from pydantic import PositiveFloat, PositiveInt, StrictStr
 from pydantic.typing import Literal
 
 from feast import Entity, FeatureView, utils
 from feast.feature_view import DUMMY_ENTITY_NAME
-from feast.infra.online_stores.helpers import compute_entity_id
+from feast.infra.online_stores.helpers import LazyThreadPool, compute_entity_id
 from feast.infra.online_stores.online_store import OnlineStore
 from feast.protos.feast.types.EntityKey_pb2 import EntityKey as EntityKeyProto
 from feast.protos.feast.types.Value_pb2 import Value as ValueProto
@@ -44,12 +46,25 @@ class BigtableOnlineStoreConfig(FeastConfigBaseModel):
     max_versions: int = 2
     """The number of historical versions of data that will be kept around."""
 
+    read_concurrency: PositiveInt = BIGTABLE_CLIENT_CONNECTION_POOL_SIZE
+    """Maximum number of ReadRows calls made concurrently by online_read."""
+
+    read_batch_size: PositiveInt = 500
+    """Maximum number of row keys read by each ReadRows call."""
+
+    read_timeout: Optional[PositiveFloat] = None
+    """(optional) Deadline in seconds of each ReadRows call, retries included."""
+
 
 class BigtableOnlineStore(OnlineStore):
     _client: Optional[bigtable.Client] = None
 
     feature_column_family: str = "features"
 
+    def __init__(self) -> None:
+        super().__init__()
+        self._read_executor = LazyThreadPool()
+
     @log_exceptions_and_usage(online_store="bigtable")
     def online_read(
         self,
@@ -58,13 +73,13 @@ class BigtableOnlineStore(OnlineStore):
         entity_keys: List[EntityKeyProto],
         requested_features: Optional[List[str]] = None,
     ) -> List[Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]]:
-        # Potential performance improvement opportunity described in
-        # https://github.com/feast-dev/feast/issues/3259
+        online_config = config.online_store
+        assert isinstance(online_config, BigtableOnlineStoreConfig)
         feature_view = table
         bt_table_name = self._get_table_name(config=config, feature_view=feature_view)
 
-        client = self._get_client(online_config=config.online_store)
-        bt_instance = client.instance(instance_id=config.online_store.instance)
+        client = self._get_client(online_config=online_config)
+        bt_instance = client.instance(instance_id=online_config.instance)
         bt_table = bt_instance.table(bt_table_name)
         row_keys = [
             self._compute_row_key(
@@ -75,29 +90,63 @@ class BigtableOnlineStore(OnlineStore):
             for entity_key in entity_keys
         ]
 
-        row_set = bigtable.row_set.RowSet()
-        for row_key in row_keys:
-            row_set.add_row_key(row_key)
-        rows = bt_table.read_rows(
-            row_set=row_set,
-            filter_=(
-                row_filters.ColumnQualifierRegexFilter(
-                    f"^({'|'.join(requested_features)}|event_ts)$".encode()
-                )
-                if requested_features
-                else None
-            ),
+        # Row keys are deduplicated and split into shards which are read in parallel,
+        # so that the latency of a large read is bounded by its slowest shard.
+        unique_row_keys = list(dict.fromkeys(row_keys))
+        shards = [
+            unique_row_keys[i : i + online_config.read_batch_size]
+            for i in range(0, len(unique_row_keys), online_config.read_batch_size)
+        ]
+        row_filter = self._read_filter(requested_features)
+        retry = (
+            DEFAULT_RETRY_READ_ROWS.with_deadline(online_config.read_timeout)
+            if online_config.read_timeout is not None
+            else DEFAULT_RETRY_READ_ROWS
         )
 
+        def read_shard(
+            shard_row_keys: List[bytes],
+        ) -> List[bigtable.row.PartialRowData]:
+            row_set = bigtable.row_set.RowSet()
+            for row_key in shard_row_keys:
+                row_set.add_row_key(row_key)
+            return list(
+                bt_table.read_rows(row_set=row_set, filter_=row_filter, retry=retry)
+            )
+
+        if len(shards) > 1 and online_config.read_concurrency > 1:
+            shard_rows = self._read_executor.get(online_config.read_concurrency).map(
+                read_shard, shards
+            )
+        else:
+            shard_rows = map(read_shard, shards)
+
         # The BigTable client library only returns rows for keys that are found. This
         # means that it's our responsibility to match the returned rows to the original
         # `row_keys` and make sure that we're returning a list of the same length as
         # `entity_keys`.
         bt_rows_dict: Dict[bytes, bigtable.row.PartialRowData] = {
-            row.row_key: row for row in rows
+            row.row_key: row for rows in shard_rows for row in rows
         }
         return [self._process_bt_row(bt_rows_dict.get(row_key)) for row_key in row_keys]
 
+    def _read_filter(
+        self, requested_features: Optional[List[str]]
+    ) -> row_filters.RowFilter:
+        # Only the latest version of each cell is used, so older versions are not read.
+        latest_version = row_filters.CellsColumnLimitFilter(1)
+        if not requested_features:
+            return latest_version
+        columns = "|".join(re.escape(feature) for feature in requested_features)
+        return row_filters.RowFilterChain(
+            filters=[
+                row_filters.ColumnQualifierRegexFilter(
+                    f"^({columns}|event_ts)$".encode()
+                ),
+                latest_version,
+            ]
+        )
+
     def _process_bt_row(
         self, row: Optional[bigtable.row.PartialRowData]
     ) -> Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]:
@@ -107,8 +156,10 @@ class BigtableOnlineStore(OnlineStore):
             return (None, None)
 
         row_values = row.cells[self.feature_column_family]
-        event_ts = datetime.fromisoformat(row_values.pop(b"event_ts")[0].value.decode())
+        event_ts = datetime.fromisoformat(row_values[b"event_ts"][0].value.decode())
         for feature_name, feature_values in row_values.items():
+            if feature_name == b"event_ts":
+                continue
             # We only want to retrieve the latest value for each feature
             feature_value = feature_values[0]
             val = ValueProto()
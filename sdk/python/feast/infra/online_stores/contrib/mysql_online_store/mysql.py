@@ -1,16 +1,30 @@
 from __future__ import absolute_import
 
+import contextlib
+import itertools
+import queue
+import threading
 from datetime import datetime
-from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+from typing import (
+    Any,
+    Callable,
+    ContextManager,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
 
 import pymysql
 import pytz
-from pydantic import StrictStr
+from pydantic import PositiveInt, StrictStr
 from pymysql.connections import Connection
 from pymysql.cursors import Cursor
 
 from feast import Entity, FeatureView, RepoConfig
-from feast.infra.key_encoding_utils import serialize_entity_key
+from feast.infra.key_encoding_utils import EntityKeyCache, serialize_entity_keys
 from feast.infra.online_stores.online_store import OnlineStore
 from feast.protos.feast.types.EntityKey_pb2 import EntityKey as EntityKeyProto
 from feast.protos.feast.types.Value_pb2 import Value as ValueProto
@@ -31,6 +45,45 @@ class MySQLOnlineStoreConfig(FeastConfigBaseModel):
     database: Optional[StrictStr] = None
     port: Optional[int] = None
 
+    pool_size: PositiveInt = 4
+    """ (optional) Maximum number of connections opened by the online store. Connections are shared by the
+    threads reading and writing feature values, which wait for one to be released when all are in use. """
+
+    read_batch_size: PositiveInt = 1000
+    """ (optional) Maximum number of entity keys read by a single query. """
+
+    write_batch_size: PositiveInt = 1000
+    """ (optional) Number of entity rows upserted per transaction by online_write_batch. """
+
+
+class _ConnectionPool:
+    """
+    A thread-safe pool of at most `size` connections, which are opened as they are needed. A connection which
+    was in use when an error was raised is closed instead of being returned to the pool.
+    """
+
+    def __init__(self, connect: Callable[[], Connection], size: int):
+        self._connect = connect
+        self._idle: "queue.LifoQueue[Connection]" = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(size)
+
+    @contextlib.contextmanager
+    def connection(self) -> Iterator[Connection]:
+        self._slots.acquire()
+        try:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                conn = self._connect()
+            try:
+                yield conn
+            except BaseException:
+                conn.close()
+                raise
+            self._idle.put(conn)
+        finally:
+            self._slots.release()
+
 
 class MySQLOnlineStore(OnlineStore):
     """
@@ -38,23 +91,32 @@ class MySQLOnlineStore(OnlineStore):
     NOTE: The class *must* end with the `OnlineStore` suffix.
     """
 
-    _conn: Optional[Connection] = None
+    _pool: Optional[_ConnectionPool] = None
+    _pool_lock = threading.Lock()
 
-    def _get_conn(self, config: RepoConfig) -> Connection:
+    def __init__(self) -> None:
+        super().__init__()
+        self._entity_key_cache = EntityKeyCache()
 
+    def _get_conn(self, config: RepoConfig) -> ContextManager[Connection]:
+        """Returns a context manager borrowing a connection from the pool of the online store."""
         online_store_config = config.online_store
         assert isinstance(online_store_config, MySQLOnlineStoreConfig)
 
-        if not self._conn:
-            self._conn = pymysql.connect(
-                host=online_store_config.host or "127.0.0.1",
-                user=online_store_config.user or "test",
-                password=online_store_config.password or "test",
-                database=online_store_config.database or "feast",
-                port=online_store_config.port or 3306,
-                autocommit=True,
-            )
-        return self._conn
+        with self._pool_lock:
+            if not self._pool:
+                self._pool = _ConnectionPool(
+                    lambda: pymysql.connect(
+                        host=online_store_config.host or "127.0.0.1",
+                        user=online_store_config.user or "test",
+                        password=online_store_config.password or "test",
+                        database=online_store_config.database or "feast",
+                        port=online_store_config.port or 3306,
+                        autocommit=True,
+                    ),
+                    online_store_config.pool_size,
+                )
+        return self._pool.connection()
 
     def online_write_batch(
         self,
@@ -66,61 +128,67 @@ class MySQLOnlineStore(OnlineStore):
         progress: Optional[Callable[[int], Any]],
     ) -> None:
 
-        conn = self._get_conn(config)
-        cur = conn.cursor()
-
         project = config.project
-
-        for entity_key, values, timestamp, created_ts in data:
-            entity_key_bin = serialize_entity_key(
-                entity_key,
-                entity_key_serialization_version=2,
-            ).hex()
-            timestamp = _to_naive_utc(timestamp)
-            if created_ts is not None:
-                created_ts = _to_naive_utc(created_ts)
-
-            for feature_name, val in values.items():
-                self.write_to_table(
-                    created_ts,
-                    cur,
-                    entity_key_bin,
-                    feature_name,
-                    project,
-                    table,
-                    timestamp,
-                    val,
+        batch_size = config.online_store.write_batch_size
+
+        with self._get_conn(config) as conn, conn.cursor() as cur:
+            # The connections are in autocommit mode, so that reads don't see a stale snapshot. Each batch
+            # of entity rows is upserted in an explicit transaction instead, which is rolled back if the
+            # connection is closed by the pool after an error.
+            data_iter = iter(data)
+            while True:
+                batch = list(itertools.islice(data_iter, batch_size))
+                if not batch:
+                    break
+                conn.begin()
+                entity_key_bins = serialize_entity_keys(
+                    [entity_key for entity_key, _, _, _ in batch],
+                    entity_key_serialization_version=2,
                 )
-            conn.commit()
-            if progress:
-                progress(1)
+                rows = []
+                for entity_key_bin, (_, values, timestamp, created_ts) in zip(
+                    entity_key_bins, batch
+                ):
+                    timestamp = _to_naive_utc(timestamp)
+                    if created_ts is not None:
+                        created_ts = _to_naive_utc(created_ts)
+                    for feature_name, val in values.items():
+                        rows.append(
+                            (
+                                entity_key_bin.hex(),
+                                feature_name,
+                                val.SerializeToString(),
+                                timestamp,
+                                created_ts,
+                            )
+                        )
+                self.write_to_table(cur, project, table, rows)
+                conn.commit()
+                if progress:
+                    progress(len(batch))
 
     @staticmethod
     def write_to_table(
-        created_ts, cur, entity_key_bin, feature_name, project, table, timestamp, val
+        cur: Cursor,
+        project: str,
+        table: FeatureView,
+        rows: List[Tuple[str, str, bytes, datetime, Optional[datetime]]],
     ) -> None:
-        cur.execute(
+        """
+        Upserts rows of (entity key, feature name, value, event timestamp, created timestamp). pymysql sends
+        them as multi-row INSERT statements, as large as the maximum statement length of the connection.
+        """
+        cur.executemany(
             f"""
             INSERT INTO {_table_id(project, table)}
             (entity_key, feature_name, value, event_ts, created_ts)
-            values (%s, %s, %s, %s, %s)
+            VALUES (%s, %s, %s, %s, %s)
             ON DUPLICATE KEY UPDATE
-            value = %s,
-            event_ts = %s,
-            created_ts = %s;
+            value = VALUES(value),
+            event_ts = VALUES(event_ts),
+            created_ts = VALUES(created_ts)
             """,
-            (
-                # Insert
-                entity_key_bin,
-                feature_name,
-                val.SerializeToString(),
-                timestamp,
-                created_ts,
-                # Update on duplicate key
-                val.SerializeToString(),
-                timestamp,
-                created_ts,
-            ),
+            rows,
         )
 
     def online_read(
@@ -130,32 +198,41 @@ class MySQLOnlineStore(OnlineStore):
         entity_keys: List[EntityKeyProto],
         requested_features: Optional[List[str]] = None,
     ) -> List[Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]]:
-        conn = self._get_conn(config)
-        cur = conn.cursor()
-
-        result: List[Tuple[Optional[datetime], Optional[Dict[str, Any]]]] = []
-
-        project = config.project
-        for entity_key in entity_keys:
-            entity_key_bin = serialize_entity_key(
-                entity_key,
+        entity_key_bins = [
+            entity_key_bin.hex()
+            for entity_key_bin in self._entity_key_cache.serialize(
+                entity_keys,
                 entity_key_serialization_version=2,
-            ).hex()
-
-            cur.execute(
-                f"SELECT feature_name, value, event_ts FROM {_table_id(project, table)} WHERE entity_key = %s",
-                (entity_key_bin,),
+                maxsize=config.entity_key_cache_size,
             )
+        ]
+
+        # Entity keys are read in batches, with a single query per batch.
+        records: Dict[str, List[Tuple[str, bytes, datetime]]] = {}
+        unique_entity_key_bins = list(dict.fromkeys(entity_key_bins))
+        batch_size = config.online_store.read_batch_size
+        with self._get_conn(config) as conn, conn.cursor() as cur:
+            for i in range(0, len(unique_entity_key_bins), batch_size):
+                batch = unique_entity_key_bins[i : i + batch_size]
+                cur.execute(
+                    f"SELECT entity_key, feature_name, value, event_ts FROM {_table_id(config.project, table)} "
+                    f"WHERE entity_key IN ({', '.join(['%s'] * len(batch))})",
+                    batch,
+                )
+                for entity_key_bin, feature_name, val_bin, ts in cur.fetchall():
+                    records.setdefault(entity_key_bin, []).append(
+                        (feature_name, val_bin, ts)
+                    )
 
+        result: List[Tuple[Optional[datetime], Optional[Dict[str, Any]]]] = []
+        for entity_key_bin in entity_key_bins:
             res = {}
             res_ts: Optional[datetime] = None
-            records = cur.fetchall()
-            if records:
-                for feature_name, val_bin, ts in records:
-                    val = ValueProto()
-                    val.ParseFromString(val_bin)
-                    res[feature_name] = val
-                    res_ts = ts
+            for feature_name, val_bin, ts in records.get(entity_key_bin, []):
+                val = ValueProto()
+                val.ParseFromString(val_bin)
+                res[feature_name] = val
+                res_ts = ts
 
             if not res:
                 result.append((None, None))
@@ -172,27 +249,26 @@ class MySQLOnlineStore(OnlineStore):
         entities_to_keep: Sequence[Entity],
         partial: bool,
     ) -> None:
-        conn = self._get_conn(config)
-        cur = conn.cursor()
         project = config.project
 
-        # We don't create any special state for the entities in this implementation.
-        for table in tables_to_keep:
-            cur.execute(
-                f"""CREATE TABLE IF NOT EXISTS {_table_id(project, table)} (entity_key VARCHAR(512),
-                feature_name VARCHAR(256),
-                value BLOB,
-                event_ts timestamp NULL DEFAULT NULL,
-                created_ts timestamp NULL DEFAULT NULL,
-                PRIMARY KEY(entity_key, feature_name))"""
-            )
+        with self._get_conn(config) as conn, conn.cursor() as cur:
+            # We don't create any special state for the entities in this implementation.
+            for table in tables_to_keep:
+                cur.execute(
+                    f"""CREATE TABLE IF NOT EXISTS {_table_id(project, table)} (entity_key VARCHAR(512),
+                    feature_name VARCHAR(256),
+                    value BLOB,
+                    event_ts timestamp NULL DEFAULT NULL,
+                    created_ts timestamp NULL DEFAULT NULL,
+                    PRIMARY KEY(entity_key, feature_name))"""
+                )
 
-            cur.execute(
-                f"ALTER TABLE {_table_id(project, table)} ADD INDEX {_table_id(project, table)}_ek (entity_key);"
-            )
+                cur.execute(
+                    f"ALTER TABLE {_table_id(project, table)} ADD INDEX {_table_id(project, table)}_ek (entity_key);"
+                )
 
-        for table in tables_to_delete:
-            _drop_table_and_index(cur, project, table)
+            for table in tables_to_delete:
+                _drop_table_and_index(cur, project, table)
 
     def teardown(
         self,
@@ -200,12 +276,11 @@ class MySQLOnlineStore(OnlineStore):
         tables: Sequence[FeatureView],
         entities: Sequence[Entity],
     ) -> None:
-        conn = self._get_conn(config)
-        cur = conn.cursor()
         project = config.project
 
-        for table in tables:
-            _drop_table_and_index(cur, project, table)
+        with self._get_conn(config) as conn, conn.cursor() as cur:
+            for table in tables:
+                _drop_table_and_index(cur, project, table)
 
 
 def _drop_table_and_index(cur: Cursor, project: str, table: FeatureView) -> None:
@@ -1,48 +1,126 @@
 import contextlib
+import hashlib
+import io
 import logging
+import threading
+import time
 from collections import defaultdict
 from datetime import datetime
-from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set, Tuple
 
+import numpy as np
 import psycopg2
+import pyarrow
 import pytz
 from psycopg2 import sql
 from psycopg2.extras import execute_values
-from psycopg2.pool import SimpleConnectionPool
+from psycopg2.pool import ThreadedConnectionPool
+from pydantic import StrictBool
 from pydantic.schema import Literal
 
 from feast import Entity
 from feast.feature_view import FeatureView
-from feast.infra.key_encoding_utils import serialize_entity_key
+from feast.infra.key_encoding_utils import EntityKeyCache, serialize_entity_keys
+from feast.infra.online_stores.helpers import EventLoopLocal
 from feast.infra.online_stores.online_store import OnlineStore
-from feast.infra.utils.postgres.connection_utils import _get_conn, _get_connection_pool
+from feast.infra.utils.postgres.connection_utils import (
+    _get_conn,
+    _get_conn_async,
+    _get_connection_pool,
+    _get_connection_pool_async,
+)
 from feast.infra.utils.postgres.postgres_config import ConnectionType, PostgreSQLConfig
 from feast.protos.feast.types.EntityKey_pb2 import EntityKey as EntityKeyProto
 from feast.protos.feast.types.Value_pb2 import Value as ValueProto
 from feast.repo_config import RepoConfig
 from feast.usage import log_exceptions_and_usage
+from feast.utils import SERIALIZED_ROWS_SCHEMA
+
+# Signature, flags and header extension length of the binary format of COPY.
+_COPY_BINARY_HEADER = b"PGCOPY\n\xff\r\n\x00" + bytes(8)
+_COPY_BINARY_TRAILER = b"\xff\xff"
+# Microseconds between the Unix epoch and 2000-01-01, the epoch of Postgres timestamps.
+_POSTGRES_EPOCH_US = 946_684_800_000_000
+# Seconds a pooled connection can stay idle before it is checked with a query when it is taken again.
+_POOL_IDLE_CHECK_SECONDS = 30.0
 
 
 class PostgreSQLOnlineStoreConfig(PostgreSQLConfig):
     type: Literal["postgres"] = "postgres"
 
+    write_mode: Literal["insert", "copy"] = "insert"
+    """ (optional) How feature values are written. "insert" upserts them with multi-row INSERT statements.
+    "copy" streams each batch to a temporary table with a binary COPY, and merges it into the table of the
+    feature view with a single INSERT ... ON CONFLICT, which is much faster for large materializations. """
+
+    prepared_statements: StrictBool = False
+    """ (optional) Whether reads run server-side prepared statements, which are prepared once per connection
+    and per table. They can't be enabled behind a pooler running in transaction mode, such as PgBouncer, which
+    may run the statements of a connection on different server connections. """
+
+
+class _Connection(psycopg2.extensions.connection):
+    """
+    A psycopg2 connection which keeps track of the statements prepared on it, and of when it was last returned
+    to the pool.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.prepared_statements: Set[str] = set()
+        self.released_at: Optional[float] = None
+
 
 class PostgreSQLOnlineStore(OnlineStore):
-    _conn: Optional[psycopg2._psycopg.connection] = None
-    _conn_pool: Optional[SimpleConnectionPool] = None
+    _conn: Optional[_Connection] = None
+    _conn_pool: Optional[ThreadedConnectionPool] = None
+    # Bounds the connections taken from the pool, which raises an error instead of waiting when all are in use.
+    _conn_pool_slots: Optional[threading.BoundedSemaphore] = None
+    _conn_lock = threading.Lock()
+
+    def __init__(self) -> None:
+        super().__init__()
+        # psycopg 3 connection and connection pool of each event loop, used by `online_read_async`.
+        self._conn_async: EventLoopLocal[Any] = EventLoopLocal()
+        self._conn_pool_async: EventLoopLocal[Any] = EventLoopLocal()
+        self._entity_key_cache = EntityKeyCache()
 
     @contextlib.contextmanager
     def _get_conn(self, config: RepoConfig):
         assert config.online_store.type == "postgres"
         if config.online_store.conn_type == ConnectionType.pool:
-            if not self._conn_pool:
-                self._conn_pool = _get_connection_pool(config.online_store)
-            connection = self._conn_pool.getconn()
-            yield connection
-            self._conn_pool.putconn(connection)
+            with self._conn_lock:
+                if not self._conn_pool:
+                    self._conn_pool = _get_connection_pool(
+                        config.online_store, connection_factory=_Connection
+                    )
+                    self._conn_pool_slots = threading.BoundedSemaphore(
+                        config.online_store.max_conn
+                    )
+            assert self._conn_pool_slots
+            with self._conn_pool_slots:
+                connection = self._conn_pool.getconn()
+                # Connections which were closed, or were dropped by the server while they were idle, are
+                # replaced.
+                while not _is_usable(connection):
+                    self._conn_pool.putconn(connection, close=True)
+                    connection = self._conn_pool.getconn()
+                close = False
+                try:
+                    yield connection
+                except (psycopg2.OperationalError, psycopg2.InterfaceError):
+                    # The connection may be broken, so it isn't reused.
+                    close = True
+                    raise
+                finally:
+                    connection.released_at = time.monotonic()
+                    self._conn_pool.putconn(connection, close=close)
         else:
-            if not self._conn:
-                self._conn = _get_conn(config.online_store)
+            with self._conn_lock:
+                if not self._conn or self._conn.closed:
+                    self._conn = _get_conn(
+                        config.online_store, connection_factory=_Connection
+                    )
             yield self._conn
 
     @log_exceptions_and_usage(online_store="postgres")
@@ -57,50 +135,65 @@ class PostgreSQLOnlineStore(OnlineStore):
     ) -> None:
         project = config.project
 
+        entity_key_bins = serialize_entity_keys(
+            [entity_key for entity_key, _, _, _ in data],
+            entity_key_serialization_version=config.entity_key_serialization_version,
+        )
+        insert_values = []
+        for entity_key_bin, (_, values, timestamp, created_ts) in zip(
+            entity_key_bins, data
+        ):
+            timestamp = _to_naive_utc(timestamp)
+            if created_ts is not None:
+                created_ts = _to_naive_utc(created_ts)
+
+            for feature_name, val in values.items():
+                insert_values.append(
+                    (
+                        entity_key_bin,
+                        feature_name,
+                        val.SerializeToString(),
+                        timestamp,
+                        created_ts,
+                    )
+                )
+
         with self._get_conn(config) as conn, conn.cursor() as cur:
-            insert_values = []
-            for entity_key, values, timestamp, created_ts in data:
-                entity_key_bin = serialize_entity_key(
-                    entity_key,
-                    entity_key_serialization_version=config.entity_key_serialization_version,
+            if config.online_store.write_mode == "copy":
+                _copy_values(
+                    cur, project, table, _values_to_record_batch(insert_values)
                 )
-                timestamp = _to_naive_utc(timestamp)
-                if created_ts is not None:
-                    created_ts = _to_naive_utc(created_ts)
+                conn.commit()
+                if progress:
+                    progress(len(data))
+            else:
+                _upsert_values(cur, project, table, insert_values, progress)
 
-                for feature_name, val in values.items():
-                    insert_values.append(
-                        (
-                            entity_key_bin,
-                            feature_name,
-                            val.SerializeToString(),
-                            timestamp,
-                            created_ts,
-                        )
+    def supports_serialized_writes(self) -> bool:
+        return True
+
+    @log_exceptions_and_usage(online_store="postgres")
+    def online_write_batch_serialized(
+        self,
+        config: RepoConfig,
+        table: FeatureView,
+        data: pyarrow.RecordBatch,
+    ) -> None:
+        with self._get_conn(config) as conn, conn.cursor() as cur:
+            if config.online_store.write_mode == "copy":
+                _copy_values(cur, config.project, table, data)
+                conn.commit()
+            else:
+                insert_values = list(
+                    zip(
+                        data.column("entity_key").to_pylist(),
+                        data.column("feature_name").to_pylist(),
+                        data.column("value").to_pylist(),
+                        data.column("event_ts").to_pylist(),
+                        data.column("created_ts").to_pylist(),
                     )
-            # Control the batch so that we can update the progress
-            batch_size = 5000
-            for i in range(0, len(insert_values), batch_size):
-                cur_batch = insert_values[i : i + batch_size]
-                execute_values(
-                    cur,
-                    sql.SQL(
-                        """
-                        INSERT INTO {}
-                        (entity_key, feature_name, value, event_ts, created_ts)
-                        VALUES %s
-                        ON CONFLICT (entity_key, feature_name) DO
-                        UPDATE SET
-                            value = EXCLUDED.value,
-                            event_ts = EXCLUDED.event_ts,
-                            created_ts = EXCLUDED.created_ts;
-                        """,
-                    ).format(sql.Identifier(_table_id(project, table))),
-                    cur_batch,
-                    page_size=batch_size,
                 )
-                if progress:
-                    progress(len(cur_batch))
+                _upsert_values(cur, config.project, table, insert_values, None)
 
     @log_exceptions_and_usage(online_store="postgres")
     def online_read(
@@ -110,68 +203,82 @@ class PostgreSQLOnlineStore(OnlineStore):
         entity_keys: List[EntityKeyProto],
         requested_features: Optional[List[str]] = None,
     ) -> List[Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]]:
-        result: List[Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]] = []
+        # Collecting all the keys to a list allows us to make fewer round trips
+        # to PostgreSQL
+        keys = self._entity_key_cache.serialize(
+            entity_keys,
+            entity_key_serialization_version=config.entity_key_serialization_version,
+            maxsize=config.entity_key_cache_size,
+        )
+        params = (keys, requested_features) if requested_features else (keys,)
 
-        project = config.project
         with self._get_conn(config) as conn, conn.cursor() as cur:
-            # Collecting all the keys to a list allows us to make fewer round trips
-            # to PostgreSQL
-            keys = []
-            for entity_key in entity_keys:
-                keys.append(
-                    serialize_entity_key(
-                        entity_key,
-                        entity_key_serialization_version=config.entity_key_serialization_version,
-                    )
-                )
-
-            if not requested_features:
-                cur.execute(
-                    sql.SQL(
-                        """
-                        SELECT entity_key, feature_name, value, event_ts
-                        FROM {} WHERE entity_key = ANY(%s);
-                        """
-                    ).format(
-                        sql.Identifier(_table_id(project, table)),
-                    ),
-                    (keys,),
+            if config.online_store.prepared_statements:
+                _execute_prepared_read(
+                    conn, cur, config.project, table, requested_features, params
                 )
             else:
                 cur.execute(
-                    sql.SQL(
-                        """
-                        SELECT entity_key, feature_name, value, event_ts
-                        FROM {} WHERE entity_key = ANY(%s) and feature_name = ANY(%s);
-                        """
-                    ).format(
-                        sql.Identifier(_table_id(project, table)),
-                    ),
-                    (keys, requested_features),
+                    _read_query(sql, config.project, table, requested_features),
+                    params,
                 )
-
             rows = cur.fetchall()
 
-            # Since we don't know the order returned from PostgreSQL we'll need
-            # to construct a dict to be able to quickly look up the correct row
-            # when we iterate through the keys since they are in the correct order
-            values_dict = defaultdict(list)
-            for row in rows if rows is not None else []:
-                values_dict[row[0].tobytes()].append(row[1:])
-
-            for key in keys:
-                if key in values_dict:
-                    value = values_dict[key]
-                    res = {}
-                    for feature_name, value_bin, event_ts in value:
-                        val = ValueProto()
-                        val.ParseFromString(bytes(value_bin))
-                        res[feature_name] = val
-                    result.append((event_ts, res))
-                else:
-                    result.append((None, None))
-
-        return result
+        return _rows_to_read_result(keys, rows)
+
+    async def online_read_async(
+        self,
+        config: RepoConfig,
+        table: FeatureView,
+        entity_keys: List[EntityKeyProto],
+        requested_features: Optional[List[str]] = None,
+    ) -> List[Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]]:
+        try:
+            from psycopg import sql as async_sql
+        except ImportError as e:
+            from feast.errors import FeastExtrasDependencyImportError
+
+            raise FeastExtrasDependencyImportError("postgres", str(e))
+
+        keys = self._entity_key_cache.serialize(
+            entity_keys,
+            entity_key_serialization_version=config.entity_key_serialization_version,
+            maxsize=config.entity_key_cache_size,
+        )
+        query = _read_query(async_sql, config.project, table, requested_features)
+        params = (keys, requested_features) if requested_features else (keys,)
+
+        async with self._get_conn_async(config) as conn:
+            async with conn.cursor() as cur:
+                # psycopg 3 prepares the statement on the connection the first time it is run.
+                await cur.execute(
+                    query, params, prepare=config.online_store.prepared_statements
+                )
+                rows = await cur.fetchall()
+
+        return _rows_to_read_result(keys, rows)
+
+    @contextlib.asynccontextmanager
+    async def _get_conn_async(self, config: RepoConfig):
+        assert config.online_store.type == "postgres"
+        if config.online_store.conn_type == ConnectionType.pool:
+            pool = await self._conn_pool_async.get(
+                lambda: _get_connection_pool_async(config.online_store)
+            )
+            async with pool.connection() as connection:
+                yield connection
+        else:
+            yield await self._conn_async.get(
+                lambda: _get_conn_async(config.online_store)
+            )
+
+    async def close_async(self) -> None:
+        pool = await self._conn_pool_async.pop()
+        if pool is not None:
+            await pool.close()
+        conn = await self._conn_async.pop()
+        if conn is not None:
+            await conn.close()
 
     @log_exceptions_and_usage(online_store="postgres")
     def update(
@@ -256,6 +363,284 @@ def _table_id(project: str, table: FeatureView) -> str:
     return f"{project}_{table.name}"
 
 
+def _upsert_values(
+    cur,
+    project: str,
+    table: FeatureView,
+    insert_values: List[Tuple[bytes, str, bytes, datetime, Optional[datetime]]],
+    progress: Optional[Callable[[int], Any]],
+) -> None:
+    # Control the batch so that we can update the progress
+    batch_size = 5000
+    for i in range(0, len(insert_values), batch_size):
+        cur_batch = insert_values[i : i + batch_size]
+        execute_values(
+            cur,
+            sql.SQL(
+                """
+                INSERT INTO {}
+                (entity_key, feature_name, value, event_ts, created_ts)
+                VALUES %s
+                ON CONFLICT (entity_key, feature_name) DO
+                UPDATE SET
+                    value = EXCLUDED.value,
+                    event_ts = EXCLUDED.event_ts,
+                    created_ts = EXCLUDED.created_ts;
+                """,
+            ).format(sql.Identifier(_table_id(project, table))),
+            cur_batch,
+            page_size=batch_size,
+        )
+        if progress:
+            progress(len(cur_batch))
+
+
+def _copy_values(
+    cur, project: str, table: FeatureView, rows: pyarrow.RecordBatch
+) -> None:
+    """
+    Upserts rows of `SERIALIZED_ROWS_SCHEMA` by copying them to a temporary table with a binary COPY, and
+    merging it into the table of the feature view. The temporary table is dropped on commit.
+    """
+    if rows.num_rows == 0:
+        return
+    table_name = _table_id(project, table)
+    staging_table_name = f"{table_name}_staging"
+    cur.execute(
+        sql.SQL("CREATE TEMPORARY TABLE {} (LIKE {}) ON COMMIT DROP;").format(
+            sql.Identifier(staging_table_name), sql.Identifier(table_name)
+        )
+    )
+    cur.copy_expert(
+        sql.SQL(
+            """
+            COPY {} (entity_key, feature_name, value, event_ts, created_ts)
+            FROM STDIN (FORMAT binary);
+            """
+        ).format(sql.Identifier(staging_table_name)),
+        io.BytesIO(_to_copy_binary(rows)),
+    )
+    cur.execute(
+        sql.SQL(
+            """
+            INSERT INTO {}
+            (entity_key, feature_name, value, event_ts, created_ts)
+            SELECT entity_key, feature_name, value, event_ts, created_ts FROM {}
+            ON CONFLICT (entity_key, feature_name) DO
+            UPDATE SET
+                value = EXCLUDED.value,
+                event_ts = EXCLUDED.event_ts,
+                created_ts = EXCLUDED.created_ts;
+            """
+        ).format(sql.Identifier(table_name), sql.Identifier(staging_table_name))
+    )
+
+
+def _values_to_record_batch(
+    insert_values: List[Tuple[bytes, str, bytes, datetime, Optional[datetime]]]
+) -> pyarrow.RecordBatch:
+    columns: List[Sequence[Any]] = [[] for _ in SERIALIZED_ROWS_SCHEMA]
+    if insert_values:
+        columns = list(zip(*insert_values))
+    return pyarrow.RecordBatch.from_arrays(
+        [
+            pyarrow.array(column, field.type)
+            for column, field in zip(columns, SERIALIZED_ROWS_SCHEMA)
+        ],
+        schema=SERIALIZED_ROWS_SCHEMA,
+    )
+
+
+def _to_copy_binary(rows: pyarrow.RecordBatch) -> bytes:
+    """
+    Encodes rows of `SERIALIZED_ROWS_SCHEMA` in the binary format of COPY. Each row is laid out as its
+    number of fields, followed by the length of each field (-1 if it's null) and its bytes. The rows are
+    encoded all at once, by scattering the bytes of each column to their positions in the output.
+    """
+    num_rows = rows.num_rows
+    fields = []
+    for column in rows.columns:
+        valid = column.is_valid().to_numpy(zero_copy_only=False)
+        if pyarrow.types.is_timestamp(column.type):
+            micros = (
+                column.cast(pyarrow.timestamp("us"))
+                .cast(pyarrow.int64())
+                .fill_null(0)
+                .to_numpy()
+            )
+            data = (micros - _POSTGRES_EPOCH_US).astype(">i8").view(np.uint8)
+            starts = np.arange(num_rows, dtype=np.int64) * 8
+            sizes = np.where(valid, 8, 0)
+        else:
+            offsets_buffer, data_buffer = column.buffers()[1:]
+            offsets = np.frombuffer(offsets_buffer, dtype=np.int32)[
+                column.offset : column.offset + num_rows + 1
+            ].astype(np.int64)
+            data = (
+                np.frombuffer(data_buffer, dtype=np.uint8)
+                if data_buffer is not None
+                else np.empty(0, dtype=np.uint8)
+            )
+            starts = offsets[:-1]
+            sizes = np.where(valid, np.diff(offsets), 0)
+        fields.append((valid, data, starts, sizes))
+
+    row_sizes = np.full(num_rows, 2, dtype=np.int64)
+    for _, _, _, sizes in fields:
+        row_sizes += 4 + sizes
+    row_starts = len(_COPY_BINARY_HEADER) + np.cumsum(row_sizes) - row_sizes
+    total_size = (
+        len(_COPY_BINARY_HEADER) + int(row_sizes.sum()) + len(_COPY_BINARY_TRAILER)
+    )
+    out = np.empty(total_size, dtype=np.uint8)
+    out[: len(_COPY_BINARY_HEADER)] = np.frombuffer(_COPY_BINARY_HEADER, np.uint8)
+    out[-len(_COPY_BINARY_TRAILER) :] = np.frombuffer(_COPY_BINARY_TRAILER, np.uint8)
+
+    _put_big_endian(out, row_starts, np.full(num_rows, len(fields), dtype=">i2"))
+    positions = row_starts + 2
+    for valid, data, starts, sizes in fields:
+        _put_big_endian(out, positions, np.where(valid, sizes, -1).astype(">i4"))
+        positions = positions + 4
+        _scatter_bytes(out, positions, data, starts, sizes)
+        positions = positions + sizes
+    return out.tobytes()
+
+
+def _put_big_endian(out: np.ndarray, positions: np.ndarray, values: np.ndarray):
+    width = values.dtype.itemsize
+    out[positions[:, None] + np.arange(width)] = values.view(np.uint8).reshape(
+        -1, width
+    )
+
+
+def _scatter_bytes(
+    out: np.ndarray,
+    positions: np.ndarray,
+    data: np.ndarray,
+    starts: np.ndarray,
+    sizes: np.ndarray,
+):
+    """Copies `data[starts[i] : starts[i] + sizes[i]]` to `out[positions[i] :]`, for every i."""
+    total_size = int(sizes.sum())
+    if total_size == 0:
+        return
+    offsets_in_field = np.arange(total_size) - np.repeat(
+        np.cumsum(sizes) - sizes, sizes
+    )
+    out[np.repeat(positions, sizes) + offsets_in_field] = data[
+        np.repeat(starts, sizes) + offsets_in_field
+    ]
+
+
+def _is_usable(connection: _Connection) -> bool:
+    """
+    Returns whether a connection taken from the pool can be used. Connections which were idle for more than
+    `_POOL_IDLE_CHECK_SECONDS` run a `SELECT 1` first, since the server may have dropped them in the meantime.
+    """
+    if connection.closed:
+        return False
+    if (
+        connection.released_at is None
+        or time.monotonic() - connection.released_at < _POOL_IDLE_CHECK_SECONDS
+    ):
+        return True
+    try:
+        with connection.cursor() as cur:
+            cur.execute("SELECT 1")
+        connection.rollback()
+    except (psycopg2.OperationalError, psycopg2.InterfaceError):
+        return False
+    return True
+
+
+def _read_query(
+    sql_module,
+    project: str,
+    table: FeatureView,
+    requested_features: Optional[List[str]],
+    placeholders: Tuple[str, str] = ("%s", "%s"),
+):
+    """
+    Builds the query reading the rows of the given entity keys, with `sql_module` being the `sql` module
+    of either psycopg2 or psycopg 3. The entity keys and the requested features are passed as the
+    parameters named by `placeholders`.
+    """
+    if not requested_features:
+        query = """
+            SELECT entity_key, feature_name, value, event_ts
+            FROM {table} WHERE entity_key = ANY({entity_keys});
+            """
+    else:
+        query = """
+            SELECT entity_key, feature_name, value, event_ts
+            FROM {table} WHERE entity_key = ANY({entity_keys}) and feature_name = ANY({feature_names});
+            """
+    return sql_module.SQL(query).format(
+        table=sql_module.Identifier(_table_id(project, table)),
+        entity_keys=sql_module.SQL(placeholders[0]),
+        feature_names=sql_module.SQL(placeholders[1]),
+    )
+
+
+def _execute_prepared_read(
+    conn: _Connection,
+    cur,
+    project: str,
+    table: FeatureView,
+    requested_features: Optional[List[str]],
+    params: Tuple,
+) -> None:
+    """
+    Runs the read query of a table as a prepared statement, which is prepared the first time it is run on
+    the connection. Reads of all the features and of some of them use different statements.
+    """
+    table_hash = hashlib.md5(_table_id(project, table).encode()).hexdigest()
+    statement_name = f"feast_read_{table_hash}_{len(params)}"
+    if statement_name not in conn.prepared_statements:
+        cur.execute(
+            sql.SQL("PREPARE {} ({}) AS {}").format(
+                sql.Identifier(statement_name),
+                sql.SQL("bytea[], text[]" if requested_features else "bytea[]"),
+                _read_query(
+                    sql, project, table, requested_features, placeholders=("$1", "$2")
+                ),
+            )
+        )
+        conn.prepared_statements.add(statement_name)
+    cur.execute(
+        sql.SQL("EXECUTE {} ({});").format(
+            sql.Identifier(statement_name),
+            sql.SQL(", ").join([sql.Placeholder()] * len(params)),
+        ),
+        params,
+    )
+
+
+def _rows_to_read_result(
+    keys: List[bytes], rows: Optional[List[Tuple]]
+) -> List[Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]]:
+    # Since we don't know the order returned from PostgreSQL we'll need
+    # to construct a dict to be able to quickly look up the correct row
+    # when we iterate through the keys since they are in the correct order
+    values_dict = defaultdict(list)
+    for row in rows if rows is not None else []:
+        values_dict[bytes(row[0])].append(row[1:])
+
+    result: List[Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]] = []
+    for key in keys:
+        if key in values_dict:
+            value = values_dict[key]
+            res = {}
+            for feature_name, value_bin, event_ts in value:
+                val = ValueProto()
+                val.ParseFromString(bytes(value_bin))
+                res[feature_name] = val
+            result.append((event_ts, res))
+        else:
+            result.append((None, None))
+    return result
+
+
 def _drop_table_and_index(table_name):
     return sql.SQL(
         """
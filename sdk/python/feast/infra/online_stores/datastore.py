@@ -19,14 +19,14 @@ from queue import Empty, Queue
 from threading import Lock, Thread
 from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
 
-from pydantic import PositiveInt, StrictStr
+from pydantic import PositiveFloat, PositiveInt, StrictStr
 from pydantic.typing import Literal
 
 from feast import Entity, utils
 from feast.errors import FeastProviderLoginError
 from feast.feature_view import FeatureView
 from feast.infra.infra_object import DATASTORE_INFRA_OBJECT_CLASS_TYPE, InfraObject
-from feast.infra.online_stores.helpers import compute_entity_id
+from feast.infra.online_stores.helpers import LazyThreadPool, compute_entity_id
 from feast.infra.online_stores.online_store import OnlineStore
 from feast.protos.feast.core.DatastoreTable_pb2 import (
     DatastoreTable as DatastoreTableProto,
@@ -77,6 +77,15 @@ class DatastoreOnlineStoreConfig(FeastConfigBaseModel):
     write_batch_size: Optional[PositiveInt] = 50
     """ (optional) Amount of feature rows per batch being written into Datastore"""
 
+    read_concurrency: PositiveInt = 10
+    """ (optional) Amount of threads to use when reading batches of feature rows from Datastore"""
+
+    read_batch_size: PositiveInt = 100
+    """ (optional) Amount of feature rows per lookup being read from Datastore"""
+
+    read_timeout: Optional[PositiveFloat] = None
+    """ (optional) Deadline in seconds of each lookup being read from Datastore"""
+
 
 class DatastoreOnlineStore(OnlineStore):
     """
@@ -87,10 +96,15 @@ class DatastoreOnlineStore(OnlineStore):
 
     Attributes:
         _client: Datastore connection.
+        _read_executor: Thread pool reading minibatches of feature rows concurrently.
     """
 
     _client: Optional[datastore.Client] = None
 
+    def __init__(self) -> None:
+        super().__init__()
+        self._read_executor = LazyThreadPool()
+
     @log_exceptions_and_usage(online_store="datastore")
     def update(
         self,
@@ -271,14 +285,35 @@ class DatastoreOnlineStore(OnlineStore):
 
         # NOTE: get_multi doesn't return values in the same order as the keys in the request.
         # Also, len(values) can be less than len(keys) in the case of missing values.
+        # Keys are deduplicated and looked up in concurrent minibatches, so that the
+        # latency of a large read is bounded by its slowest lookup.
+        unique_keys = list(dict.fromkeys(keys))
+        minibatches = [
+            unique_keys[i : i + online_config.read_batch_size]
+            for i in range(0, len(unique_keys), online_config.read_batch_size)
+        ]
+
+        def get_minibatch(minibatch_keys: List[Key]) -> List[datastore.Entity]:
+            return client.get_multi(minibatch_keys, timeout=online_config.read_timeout)
+
         with tracing_span(name="remote_call"):
-            values = client.get_multi(keys)
-        values_dict = {v.key: v for v in values} if values is not None else {}
+            if len(minibatches) > 1 and online_config.read_concurrency > 1:
+                values = self._read_executor.get(online_config.read_concurrency).map(
+                    get_minibatch, minibatches
+                )
+            else:
+                values = map(get_minibatch, minibatches)
+            values_dict = {v.key: v for minibatch in values for v in minibatch or []}
+        # Lookups can't be restricted to some properties, so features which weren't
+        # requested are skipped instead of being deserialized.
+        requested = set(requested_features) if requested_features else None
         for key in keys:
             if key in values_dict:
                 value = values_dict[key]
                 res = {}
                 for feature_name, value_bin in value["values"].items():
+                    if requested is not None and feature_name not in requested:
+                        continue
                     val = ValueProto()
                     val.ParseFromString(value_bin)
                     res[feature_name] = val
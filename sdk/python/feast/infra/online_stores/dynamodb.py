@@ -11,17 +11,28 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import asyncio
 import itertools
 import logging
+import random
+import time
 from datetime import datetime
-from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
 
-from pydantic import StrictBool, StrictStr
+import pyarrow
+from pydantic import StrictBool, StrictInt, StrictStr
 from pydantic.typing import Literal, Union
 
 from feast import Entity, FeatureView, utils
+from feast.errors import DynamoDBUnprocessedKeysError
 from feast.infra.infra_object import DYNAMODB_INFRA_OBJECT_CLASS_TYPE, InfraObject
-from feast.infra.online_stores.helpers import compute_entity_id
+from feast.infra.online_stores.helpers import (
+    EventLoopLocal,
+    LazyThreadPool,
+    compute_entity_id,
+    compute_serialized_entity_id,
+    group_serialized_rows,
+)
 from feast.infra.online_stores.online_store import OnlineStore
 from feast.protos.feast.core.DynamoDBTable_pb2 import (
     DynamoDBTable as DynamoDBTableProto,
@@ -34,6 +45,7 @@ from feast.usage import get_user_agent, log_exceptions_and_usage, tracing_span
 
 try:
     import boto3
+    from boto3.dynamodb.types import TypeDeserializer
     from botocore.config import Config
     from botocore.exceptions import ClientError
 except ImportError as e:
@@ -44,6 +56,9 @@ except ImportError as e:
 
 logger = logging.getLogger(__name__)
 
+# Base delay before retrying the keys left unprocessed by a BatchGetItem call, doubled on each retry.
+UNPROCESSED_KEYS_BACKOFF_SECONDS = 0.05
+
 
 class DynamoDBOnlineStoreConfig(FeastConfigBaseModel):
     """Online store config for DynamoDB store"""
@@ -66,6 +81,14 @@ class DynamoDBOnlineStoreConfig(FeastConfigBaseModel):
     consistent_reads: StrictBool = False
     """Whether to read from Dynamodb by forcing consistent reads"""
 
+    read_concurrency: StrictInt = 8
+    """Maximum number of BatchGetItem calls made concurrently by online_read. Note that boto3 clients hold 10
+    connections by default."""
+
+    max_unprocessed_keys_retries: StrictInt = 5
+    """Number of times keys left unprocessed by a BatchGetItem call, e.g. because of throttling, are retried
+    with exponential backoff before an error is raised."""
+
 
 class DynamoDBOnlineStore(OnlineStore):
     """
@@ -74,11 +97,18 @@ class DynamoDBOnlineStore(OnlineStore):
     Attributes:
         _dynamodb_client: Boto3 DynamoDB client.
         _dynamodb_resource: Boto3 DynamoDB resource.
+        _aiodynamodb_client: aiobotocore DynamoDB client of each event loop, used by
+            `online_read_async`.
     """
 
     _dynamodb_client = None
     _dynamodb_resource = None
 
+    def __init__(self) -> None:
+        super().__init__()
+        self._aiodynamodb_client: EventLoopLocal[Any] = EventLoopLocal()
+        self._read_executor = LazyThreadPool()
+
     @log_exceptions_and_usage(online_store="dynamodb")
     def update(
         self,
@@ -194,6 +224,49 @@ class DynamoDBOnlineStore(OnlineStore):
         )
         self._write_batch_non_duplicates(table_instance, data, progress, config)
 
+    def supports_serialized_writes(self) -> bool:
+        return True
+
+    @log_exceptions_and_usage(online_store="dynamodb")
+    def online_write_batch_serialized(
+        self,
+        config: RepoConfig,
+        table: FeatureView,
+        data: pyarrow.RecordBatch,
+    ) -> None:
+        """
+        Write a batch of serialized feature values to online DynamoDB store, with an item per entity key.
+
+        Args:
+            config: The RepoConfig for the current FeatureStore.
+            table: Feast FeatureView.
+            data: a record batch of serialized feature values, as described by
+                `OnlineStore.online_write_batch_serialized`.
+        """
+        online_config = config.online_store
+        assert isinstance(online_config, DynamoDBOnlineStoreConfig)
+        dynamodb_resource = self._get_dynamodb_resource(
+            online_config.region, online_config.endpoint_url
+        )
+        table_instance = dynamodb_resource.Table(
+            _get_table_name(online_config, config, table)
+        )
+
+        items = [
+            {
+                "entity_id": compute_serialized_entity_id(entity_key_bin),
+                "event_ts": str(utils.make_tzaware(event_ts)),
+                "values": values,
+            }
+            for entity_key_bin, (event_ts, values) in group_serialized_rows(
+                data
+            ).items()
+        ]
+
+        with table_instance.batch_writer(overwrite_by_pkeys=["entity_id"]) as batch:
+            for item in items:
+                batch.put_item(Item=item)
+
     @log_exceptions_and_usage(online_store="dynamodb")
     def online_read(
         self,
@@ -205,21 +278,90 @@ class DynamoDBOnlineStore(OnlineStore):
         """
         Retrieve feature values from the online DynamoDB store.
 
+        The BatchGetItem calls of the batches of entity keys are made concurrently, from a thread pool of
+        `read_concurrency` threads.
+
         Args:
             config: The RepoConfig for the current FeatureStore.
             table: Feast FeatureView.
             entity_keys: a list of entity keys that should be read from the FeatureStore.
+            requested_features: the features to read, instead of all the features of the items.
         """
         online_config = config.online_store
         assert isinstance(online_config, DynamoDBOnlineStoreConfig)
-        dynamodb_resource = self._get_dynamodb_resource(
+        # boto3 clients are thread-safe, unlike resources.
+        client = self._get_dynamodb_client(
             online_config.region, online_config.endpoint_url
         )
-        table_instance = dynamodb_resource.Table(
-            _get_table_name(online_config, config, table)
+        table_name = _get_table_name(online_config, config, table)
+
+        entity_ids = [
+            compute_entity_id(
+                entity_key,
+                entity_key_serialization_version=config.entity_key_serialization_version,
+            )
+            for entity_key in entity_keys
+        ]
+        batches = _batch_get_item_requests(
+            online_config, table_name, entity_ids, requested_features
+        )
+        deserializer = TypeDeserializer()
+
+        def get_batch(request_items: Dict[str, Any]) -> List[Dict[str, Any]]:
+            items = []
+            for attempt in range(online_config.max_unprocessed_keys_retries + 1):
+                if attempt:
+                    time.sleep(_unprocessed_keys_backoff(attempt))
+                with tracing_span(name="remote_call"):
+                    response = client.batch_get_item(RequestItems=request_items)
+                items.extend(response["Responses"].get(table_name, []))
+                request_items = response.get("UnprocessedKeys")
+                if not request_items:
+                    return [
+                        {k: deserializer.deserialize(v) for k, v in item.items()}
+                        for item in items
+                    ]
+            raise DynamoDBUnprocessedKeysError(
+                table_name, len(request_items[table_name]["Keys"]), attempt + 1
+            )
+
+        if len(batches) > 1 and online_config.read_concurrency > 1:
+            batch_items = self._read_executor.get(online_config.read_concurrency).map(
+                get_batch, batches
+            )
+        else:
+            batch_items = map(get_batch, batches)
+        return _items_to_read_result(
+            itertools.chain.from_iterable(batch_items), entity_ids
         )
 
-        result: List[Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]] = []
+    async def online_read_async(
+        self,
+        config: RepoConfig,
+        table: FeatureView,
+        entity_keys: List[EntityKeyProto],
+        requested_features: Optional[List[str]] = None,
+    ) -> List[Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]]:
+        """
+        Retrieve feature values from the online DynamoDB store asynchronously, with aiobotocore.
+
+        The BatchGetItem calls of all the batches of entity keys are made concurrently.
+
+        Args:
+            config: The RepoConfig for the current FeatureStore.
+            table: Feast FeatureView.
+            entity_keys: a list of entity keys that should be read from the FeatureStore.
+            requested_features: the features to read, instead of all the features of the items.
+        """
+        online_config = config.online_store
+        assert isinstance(online_config, DynamoDBOnlineStoreConfig)
+        client = await self._aiodynamodb_client.get(
+            lambda: _open_aiodynamodb_client(
+                online_config.region, online_config.endpoint_url
+            )
+        )
+        table_name = _get_table_name(online_config, config, table)
+
         entity_ids = [
             compute_entity_id(
                 entity_key,
@@ -227,60 +369,44 @@ class DynamoDBOnlineStore(OnlineStore):
             )
             for entity_key in entity_keys
         ]
-        batch_size = online_config.batch_size
-        entity_ids_iter = iter(entity_ids)
-        while True:
-            batch = list(itertools.islice(entity_ids_iter, batch_size))
-            batch_result: List[
-                Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]
-            ] = []
-            # No more items to insert
-            if len(batch) == 0:
-                break
-            batch_entity_ids = {
-                table_instance.name: {
-                    "Keys": [{"entity_id": entity_id} for entity_id in batch],
-                    "ConsistentRead": online_config.consistent_reads,
-                }
-            }
-            with tracing_span(name="remote_call"):
-                response = dynamodb_resource.batch_get_item(
-                    RequestItems=batch_entity_ids,
-                )
-            response = response.get("Responses")
-            table_responses = response.get(table_instance.name)
-            if table_responses:
-                table_responses = self._sort_dynamodb_response(
-                    table_responses, entity_ids
-                )
-                entity_idx = 0
-                for tbl_res in table_responses:
-                    entity_id = tbl_res["entity_id"]
-                    while entity_id != batch[entity_idx]:
-                        batch_result.append((None, None))
-                        entity_idx += 1
-                    res = {}
-                    for feature_name, value_bin in tbl_res["values"].items():
-                        val = ValueProto()
-                        val.ParseFromString(value_bin.value)
-                        res[feature_name] = val
-                    batch_result.append(
-                        (datetime.fromisoformat(tbl_res["event_ts"]), res)
-                    )
-                    entity_idx += 1
-
-            # Not all entities in a batch may have responses
-            # Pad with remaining values in batch that were not found
-            batch_size_nones = ((None, None),) * (len(batch) - len(batch_result))
-            batch_result.extend(batch_size_nones)
-            result.extend(batch_result)
-        return result
+        batches = _batch_get_item_requests(
+            online_config, table_name, entity_ids, requested_features
+        )
+        deserializer = TypeDeserializer()
+
+        async def get_batch(request_items: Dict[str, Any]) -> List[Dict[str, Any]]:
+            items = []
+            for attempt in range(online_config.max_unprocessed_keys_retries + 1):
+                if attempt:
+                    await asyncio.sleep(_unprocessed_keys_backoff(attempt))
+                with tracing_span(name="remote_call"):
+                    response = await client.batch_get_item(RequestItems=request_items)
+                items.extend(response["Responses"].get(table_name, []))
+                request_items = response.get("UnprocessedKeys")
+                if not request_items:
+                    return [
+                        {k: deserializer.deserialize(v) for k, v in item.items()}
+                        for item in items
+                    ]
+            raise DynamoDBUnprocessedKeysError(
+                table_name, len(request_items[table_name]["Keys"]), attempt + 1
+            )
+
+        batch_items = await asyncio.gather(*[get_batch(batch) for batch in batches])
+        return _items_to_read_result(
+            itertools.chain.from_iterable(batch_items), entity_ids
+        )
 
     def _get_dynamodb_client(self, region: str, endpoint_url: Optional[str] = None):
         if self._dynamodb_client is None:
             self._dynamodb_client = _initialize_dynamodb_client(region, endpoint_url)
         return self._dynamodb_client
 
+    async def close_async(self) -> None:
+        client = await self._aiodynamodb_client.pop()
+        if client is not None:
+            await client.close()
+
     def _get_dynamodb_resource(self, region: str, endpoint_url: Optional[str] = None):
         if self._dynamodb_resource is None:
             self._dynamodb_resource = _initialize_dynamodb_resource(
@@ -288,20 +414,6 @@ class DynamoDBOnlineStore(OnlineStore):
             )
         return self._dynamodb_resource
 
-    def _sort_dynamodb_response(self, responses: list, order: list):
-        """DynamoDB Batch Get Item doesn't return items in a particular order."""
-        # Assign an index to order
-        order_with_index = {value: idx for idx, value in enumerate(order)}
-        # Sort table responses by index
-        table_responses_ordered = [
-            (order_with_index[tbl_res["entity_id"]], tbl_res) for tbl_res in responses
-        ]
-        table_responses_ordered = sorted(
-            table_responses_ordered, key=lambda tup: tup[0]
-        )
-        _, table_responses_ordered = zip(*table_responses_ordered)
-        return table_responses_ordered
-
     @log_exceptions_and_usage(online_store="dynamodb")
     def _write_batch_non_duplicates(
         self,
@@ -333,6 +445,75 @@ class DynamoDBOnlineStore(OnlineStore):
                     progress(1)
 
 
+def _batch_get_item_requests(
+    online_config: DynamoDBOnlineStoreConfig,
+    table_name: str,
+    entity_ids: List[str],
+    requested_features: Optional[List[str]],
+) -> List[Dict[str, Any]]:
+    """
+    Builds the BatchGetItem requests of the distinct entity ids, in batches of `batch_size`. Only the
+    requested features are read, if any.
+    """
+    projection: Dict[str, Any] = {}
+    if requested_features:
+        # Attribute names are aliased, as "values" is a reserved word and feature names may be as well.
+        projection = {
+            "ProjectionExpression": ", ".join(
+                ["#entity_id", "#event_ts"]
+                + [f"#values.#f{i}" for i in range(len(requested_features))]
+            ),
+            "ExpressionAttributeNames": {
+                "#entity_id": "entity_id",
+                "#event_ts": "event_ts",
+                "#values": "values",
+                **{f"#f{i}": name for i, name in enumerate(requested_features)},
+            },
+        }
+
+    # BatchGetItem rejects requests with duplicate keys.
+    unique_entity_ids = list(dict.fromkeys(entity_ids))
+    batch_size = online_config.batch_size
+    return [
+        {
+            table_name: {
+                "Keys": [
+                    {"entity_id": {"S": entity_id}}
+                    for entity_id in unique_entity_ids[i : i + batch_size]
+                ],
+                "ConsistentRead": online_config.consistent_reads,
+                **projection,
+            }
+        }
+        for i in range(0, len(unique_entity_ids), batch_size)
+    ]
+
+
+def _unprocessed_keys_backoff(attempt: int) -> float:
+    """Returns the delay before the given retry of unprocessed keys, with full jitter."""
+    return random.uniform(0, UNPROCESSED_KEYS_BACKOFF_SECONDS * 2 ** (attempt - 1))
+
+
+def _items_to_read_result(
+    items: Iterable[Dict[str, Any]], entity_ids: List[str]
+) -> List[Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]]:
+    """Converts the items returned by BatchGetItem calls, in the order of the entity ids."""
+    items_by_entity_id = {item["entity_id"]: item for item in items}
+    result: List[Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]] = []
+    for entity_id in entity_ids:
+        item = items_by_entity_id.get(entity_id)
+        if item is None:
+            result.append((None, None))
+            continue
+        res = {}
+        for feature_name, value_bin in item.get("values", {}).items():
+            val = ValueProto()
+            val.ParseFromString(value_bin.value)
+            res[feature_name] = val
+        result.append((datetime.fromisoformat(item["event_ts"]), res))
+    return result
+
+
 def _initialize_dynamodb_client(region: str, endpoint_url: Optional[str] = None):
     return boto3.client(
         "dynamodb",
@@ -342,6 +523,28 @@ def _initialize_dynamodb_client(region: str, endpoint_url: Optional[str] = None)
     )
 
 
+def _initialize_aiodynamodb_client(region: str, endpoint_url: Optional[str] = None):
+    try:
+        from aiobotocore.config import AioConfig
+        from aiobotocore.session import get_session
+    except ImportError as e:
+        from feast.errors import FeastExtrasDependencyImportError
+
+        raise FeastExtrasDependencyImportError("aws-async", str(e))
+
+    return get_session().create_client(
+        "dynamodb",
+        region_name=region,
+        endpoint_url=endpoint_url,
+        config=AioConfig(user_agent=get_user_agent()),
+    )
+
+
+async def _open_aiodynamodb_client(region: str, endpoint_url: Optional[str] = None):
+    # The client is closed by `close`, rather than by leaving its context manager.
+    return await _initialize_aiodynamodb_client(region, endpoint_url).__aenter__()
+
+
 def _initialize_dynamodb_resource(region: str, endpoint_url: Optional[str] = None):
     return boto3.resource("dynamodb", region_name=region, endpoint_url=endpoint_url)
 
@@ -1,7 +1,23 @@
+import asyncio
+import functools
 import struct
-from typing import Any, List
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import (
+    Any,
+    Callable,
+    Coroutine,
+    Dict,
+    Generic,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
 
 import mmh3
+import pyarrow
 
 from feast.importer import import_class
 from feast.infra.key_encoding_utils import (
@@ -11,6 +27,8 @@ from feast.infra.key_encoding_utils import (
 from feast.infra.online_stores.online_store import OnlineStore
 from feast.protos.feast.types.EntityKey_pb2 import EntityKey as EntityKeyProto
 
+_T = TypeVar("_T")
+
 
 def get_online_store_from_config(online_store_config: Any) -> OnlineStore:
     """Creates an online store corresponding to the given online store config."""
@@ -38,11 +56,14 @@ def _redis_key_prefix(entity_keys: List[str]) -> bytes:
     return serialize_entity_key_prefix(entity_keys)
 
 
+@functools.lru_cache(maxsize=8192)
 def _mmh3(key: str):
     """
     Calculate murmur3_32 hash which is equal to scala version which is using little endian:
         https://stackoverflow.com/questions/29932956/murmur3-hash-different-result-between-python-and-java-implementation
         https://stackoverflow.com/questions/13141787/convert-decimal-int-to-little-endian-string-x-x
+
+    The hashes are memoized, since the same feature names are hashed for every read and write.
     """
     key_hash = mmh3.hash(key, signed=False)
     return bytes.fromhex(struct.pack("<Q", key_hash).hex()[:8])
@@ -56,9 +77,105 @@ def compute_entity_id(
     Remember that Entity here refers to `EntityKeyProto` which is used in some online stores to encode the keys.
     It has nothing to do with the Entity concept we have in Feast.
     """
-    return mmh3.hash_bytes(
+    return compute_serialized_entity_id(
         serialize_entity_key(
             entity_key,
             entity_key_serialization_version=entity_key_serialization_version,
         )
-    ).hex()
+    )
+
+
+def compute_serialized_entity_id(entity_key_bin: bytes) -> str:
+    """Compute Entity id given a serialized Feast Entity Key, like `compute_entity_id`."""
+    return mmh3.hash_bytes(entity_key_bin).hex()
+
+
+def group_serialized_rows(
+    data: pyarrow.RecordBatch,
+) -> Dict[bytes, Tuple[datetime, Dict[str, bytes]]]:
+    """
+    Groups the serialized feature values of a batch written with `online_write_batch_serialized` by
+    serialized entity key, along with their event timestamp.
+
+    When an entity key has rows with several event timestamps, only the values of the latest ones
+    are kept, so that the values and the timestamp written for the key always belong together.
+    Values with the same event timestamp are merged, the later rows taking precedence.
+    """
+    rows: Dict[bytes, Tuple[datetime, Dict[str, bytes]]] = {}
+    for entity_key_bin, feature_name, value, event_ts in zip(
+        data.column("entity_key").to_pylist(),
+        data.column("feature_name").to_pylist(),
+        data.column("value").to_pylist(),
+        data.column("event_ts").to_pylist(),
+    ):
+        row = rows.get(entity_key_bin)
+        if row is None or event_ts > row[0]:
+            row = rows[entity_key_bin] = (event_ts, {})
+        elif event_ts < row[0]:
+            continue
+        row[1][feature_name] = value
+    return rows
+
+
+class EventLoopLocal(Generic[_T]):
+    """
+    Holds a value, such as an asyncio client, for each running event loop.
+
+    Asyncio clients are bound to the event loop which opened them, so an online store can't cache
+    a single one: it would break as soon as it is used from another loop, e.g. by a second
+    `asyncio.run`. Values are opened lazily by `get`, and should be closed with `pop` before their
+    loop is closed. The values of loops closed in the meantime are dropped, since they can't be
+    closed anymore.
+    """
+
+    def __init__(self) -> None:
+        self._values: Dict[asyncio.AbstractEventLoop, "asyncio.Future[_T]"] = {}
+        self._lock = threading.Lock()
+
+    async def get(self, open_value: Callable[[], Coroutine[Any, Any, _T]]) -> _T:
+        """Returns the value of the running event loop, opening it with `open_value` first if needed."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            for closed_loop in [other for other in self._values if other.is_closed()]:
+                del self._values[closed_loop]
+            future = self._values.get(loop)
+            if future is None:
+                future = self._values[loop] = loop.create_task(open_value())
+        try:
+            # Concurrent callers wait for the same value to be opened.
+            return await asyncio.shield(future)
+        except Exception:
+            with self._lock:
+                if self._values.get(loop) is future:
+                    del self._values[loop]
+            raise
+
+    async def pop(self) -> Optional[_T]:
+        """Removes the value of the running event loop and returns it, or None if it has none."""
+        with self._lock:
+            future = self._values.pop(asyncio.get_running_loop(), None)
+        if future is None:
+            return None
+        try:
+            return await future
+        except Exception:
+            return None
+
+
+class LazyThreadPool:
+    """
+    A thread pool created on first use, since online stores only get their config on each call.
+
+    Online stores use it to make the requests of a single read concurrently.
+    """
+
+    def __init__(self) -> None:
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def get(self, max_workers: int) -> ThreadPoolExecutor:
+        """Returns the thread pool, creating it with `max_workers` threads first if needed."""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=max_workers)
+            return self._executor
@@ -12,10 +12,14 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
+import functools
 from abc import ABC, abstractmethod
 from datetime import datetime
 from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 
+import pyarrow
+
 from feast import Entity
 from feast.feature_view import FeatureView
 from feast.infra.infra_object import InfraObject
@@ -23,6 +27,7 @@ from feast.protos.feast.core.Registry_pb2 import Registry as RegistryProto
 from feast.protos.feast.types.EntityKey_pb2 import EntityKey as EntityKeyProto
 from feast.protos.feast.types.Value_pb2 import Value as ValueProto
 from feast.repo_config import RepoConfig
+from feast.utils import _convert_serialized_rows_to_proto
 
 
 class OnlineStore(ABC):
@@ -56,6 +61,41 @@ class OnlineStore(ABC):
         """
         pass
 
+    def online_write_batch_serialized(
+        self,
+        config: RepoConfig,
+        table: FeatureView,
+        data: pyarrow.RecordBatch,
+    ) -> None:
+        """
+        Writes a batch of pre-serialized feature values to the online store.
+
+        By default, the batch is deserialized and written with `online_write_batch`. Online stores that
+        can write the serialized entity keys and feature values as they are should override this method,
+        as well as `supports_serialized_writes`, so that materialization produces this format for them.
+
+        Args:
+            config: The config for the current feature store.
+            table: Feature view to which these feature values correspond.
+            data: A record batch with one row per feature value, with the columns `entity_key` (the
+                entity key serialized with the configured serialization version), `feature_name`,
+                `value` (the serialized Value proto), `event_ts` and `created_ts` (nullable). The
+                timestamps are tz-naive UTC timestamps.
+        """
+        self.online_write_batch(
+            config,
+            table,
+            _convert_serialized_rows_to_proto(data, table),
+            progress=None,
+        )
+
+    def supports_serialized_writes(self) -> bool:
+        """
+        Returns whether this online store writes serialized feature values natively, with
+        `online_write_batch_serialized`. If not, feature rows are written with `online_write_batch`.
+        """
+        return False
+
     @abstractmethod
     def online_read(
         self,
@@ -80,6 +120,70 @@ class OnlineStore(ABC):
         """
         pass
 
+    def online_read_many(
+        self,
+        config: RepoConfig,
+        reads: List[Tuple[FeatureView, List[EntityKeyProto], Optional[List[str]]]],
+    ) -> List[List[Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]]]:
+        """
+        Reads features values for the given entity keys of several feature views.
+
+        By default, `online_read` is called for each feature view in turn. Online stores that can read
+        several feature views in a single round trip should override this method.
+
+        Args:
+            config: The config for the current feature store.
+            reads: A list of triplets, each containing a feature view, the list of entity keys for which
+                its feature values should be read, and the list of its features that should be read.
+
+        Returns:
+            A list with the result of `online_read` for each item of reads, in the same order.
+        """
+        return [
+            self.online_read(config, table, entity_keys, requested_features)
+            for table, entity_keys, requested_features in reads
+        ]
+
+    async def online_read_async(
+        self,
+        config: RepoConfig,
+        table: FeatureView,
+        entity_keys: List[EntityKeyProto],
+        requested_features: Optional[List[str]] = None,
+    ) -> List[Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]]:
+        """
+        Reads features values for the given entity keys asynchronously.
+
+        By default, `online_read` is run in the default executor of the running event loop. Online
+        stores with an asynchronous client should override this method to read natively.
+
+        Args:
+            config: The config for the current feature store.
+            table: The feature view whose feature values should be read.
+            entity_keys: The list of entity keys for which feature values should be read.
+            requested_features: The list of features that should be read.
+
+        Returns:
+            A list of the same length as entity_keys. Each item in the list is a tuple where the first
+            item is the event timestamp for the row, and the second item is a dict mapping feature names
+            to values, which are returned in proto format.
+        """
+        return await asyncio.get_running_loop().run_in_executor(
+            None,
+            functools.partial(
+                self.online_read, config, table, entity_keys, requested_features
+            ),
+        )
+
+    async def close_async(self) -> None:
+        """
+        Closes the asynchronous clients opened by `online_read_async` in the running event loop.
+
+        Asynchronous clients are bound to the event loop which opened them, so online stores with
+        native asynchronous reads open one per loop. This should be awaited before the loop is closed.
+        """
+        pass
+
     @abstractmethod
     def update(
         self,
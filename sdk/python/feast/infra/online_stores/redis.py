@@ -27,13 +27,21 @@ from typing import (
     Union,
 )
 
+import pyarrow
 import pytz
 from google.protobuf.timestamp_pb2 import Timestamp
 from pydantic import StrictStr
 from pydantic.typing import Literal
 
 from feast import Entity, FeatureView, RepoConfig, utils
-from feast.infra.online_stores.helpers import _mmh3, _redis_key, _redis_key_prefix
+from feast.infra.key_encoding_utils import EntityKeyCache
+from feast.infra.online_stores.helpers import (
+    EventLoopLocal,
+    _mmh3,
+    _redis_key,
+    _redis_key_prefix,
+    group_serialized_rows,
+)
 from feast.infra.online_stores.online_store import OnlineStore
 from feast.protos.feast.types.EntityKey_pb2 import EntityKey as EntityKeyProto
 from feast.protos.feast.types.Value_pb2 import Value as ValueProto
@@ -42,6 +50,7 @@ from feast.usage import log_exceptions_and_usage, tracing_span
 
 try:
     from redis import Redis
+    from redis import asyncio as redis_asyncio
     from redis.cluster import ClusterNode, RedisCluster
 except ImportError as e:
     from feast.errors import FeastExtrasDependencyImportError
@@ -82,10 +91,16 @@ class RedisOnlineStore(OnlineStore):
 
     Attributes:
         _client: Redis connection.
+        _client_async: Redis asyncio connection of each event loop, used by `online_read_async`.
     """
 
     _client: Optional[Union[Redis, RedisCluster]] = None
 
+    def __init__(self) -> None:
+        super().__init__()
+        self._client_async: EventLoopLocal[Optional[Any]] = EventLoopLocal()
+        self._entity_key_cache = EntityKeyCache()
+
     def delete_entity_values(self, config: RepoConfig, join_keys: List[str]):
         client = self._get_client(config.online_store)
         deleted_count = 0
@@ -194,37 +209,84 @@ class RedisOnlineStore(OnlineStore):
         ],
         progress: Optional[Callable[[int], Any]],
     ) -> None:
+        feature_view = table.name
+        entity_hsets = []
+        for entity_key, values, timestamp, _ in data:
+            redis_key_bin = _redis_key(
+                config.project,
+                entity_key,
+                entity_key_serialization_version=config.entity_key_serialization_version,
+            )
+            event_time_seconds = int(utils.make_tzaware(timestamp).timestamp())
+            entity_hset = {
+                _mmh3(f"{feature_view}:{feature_name}"): val.SerializeToString()
+                for feature_name, val in values.items()
+            }
+            entity_hsets.append((redis_key_bin, event_time_seconds, entity_hset))
+
+        self._write_entity_hsets(config, table, entity_hsets, progress)
+
+    def supports_serialized_writes(self) -> bool:
+        return True
+
+    @log_exceptions_and_usage(online_store="redis")
+    def online_write_batch_serialized(
+        self,
+        config: RepoConfig,
+        table: FeatureView,
+        data: pyarrow.RecordBatch,
+    ) -> None:
+        project_bin = config.project.encode("utf-8")
+        feature_view = table.name
+        # The feature values of each entity key are written as a single hash.
+        entity_hsets = [
+            (
+                entity_key_bin + project_bin,
+                int(utils.make_tzaware(event_ts).timestamp()),
+                {
+                    _mmh3(f"{feature_view}:{feature_name}"): value
+                    for feature_name, value in values.items()
+                },
+            )
+            for entity_key_bin, (event_ts, values) in group_serialized_rows(
+                data
+            ).items()
+        ]
+        self._write_entity_hsets(config, table, entity_hsets, None)
+
+    def _write_entity_hsets(
+        self,
+        config: RepoConfig,
+        table: FeatureView,
+        entity_hsets: List[Tuple[bytes, int, Dict[bytes, bytes]]],
+        progress: Optional[Callable[[int], Any]],
+    ) -> None:
+        """
+        Writes the hash of serialized feature values of each redis key, unless the key already holds
+        values with a later event timestamp.
+        """
         online_store_config = config.online_store
         assert isinstance(online_store_config, RedisOnlineStoreConfig)
 
         client = self._get_client(online_store_config)
-        project = config.project
 
-        feature_view = table.name
-        ts_key = f"_ts:{feature_view}"
-        keys = []
+        ts_key = f"_ts:{table.name}"
         # redis pipelining optimization: send multiple commands to redis server without waiting for every reply
         with client.pipeline(transaction=False) as pipe:
             # check if a previous record under the key bin exists
             # TODO: investigate if check and set is a better approach rather than pulling all entity ts and then setting
             # it may be significantly slower but avoids potential (rare) race conditions
-            for entity_key, _, _, _ in data:
-                redis_key_bin = _redis_key(
-                    project,
-                    entity_key,
-                    entity_key_serialization_version=config.entity_key_serialization_version,
-                )
-                keys.append(redis_key_bin)
+            for redis_key_bin, _, _ in entity_hsets:
                 pipe.hmget(redis_key_bin, ts_key)
             prev_event_timestamps = pipe.execute()
             # flattening the list of lists. `hmget` does the lookup assuming a list of keys in the key bin
             prev_event_timestamps = [i[0] for i in prev_event_timestamps]
 
-            for redis_key_bin, prev_event_time, (_, values, timestamp, _) in zip(
-                keys, prev_event_timestamps, data
-            ):
-                event_time_seconds = int(utils.make_tzaware(timestamp).timestamp())
-
+            for (
+                redis_key_bin,
+                event_time_seconds,
+                entity_hset,
+            ), prev_event_time in zip(entity_hsets, prev_event_timestamps):
                 # ignore if event_timestamp is before the event features that are currently in the feature store
                 if prev_event_time:
                     prev_ts = Timestamp()
@@ -237,12 +299,7 @@ class RedisOnlineStore(OnlineStore):
 
                 ts = Timestamp()
                 ts.seconds = event_time_seconds
-                entity_hset = dict()
-                entity_hset[ts_key] = ts.SerializeToString()
-
-                for feature_name, val in values.items():
-                    f_key = _mmh3(f"{feature_view}:{feature_name}")
-                    entity_hset[f_key] = val.SerializeToString()
+                entity_hset[ts_key.encode("utf-8")] = ts.SerializeToString()
 
                 pipe.hset(redis_key_bin, mapping=entity_hset)
 
@@ -266,39 +323,185 @@ class RedisOnlineStore(OnlineStore):
         assert isinstance(online_store_config, RedisOnlineStoreConfig)
 
         client = self._get_client(online_store_config)
-        feature_view = table.name
-        project = config.project
+        keys, hset_keys, requested_features = self._prepare_read(
+            config, table, entity_keys, requested_features
+        )
+        with client.pipeline(transaction=False) as pipe:
+            for redis_key_bin in keys:
+                pipe.hmget(redis_key_bin, hset_keys)
+            with tracing_span(name="remote_call"):
+                redis_values = pipe.execute()
+        return [
+            self._get_features_for_entity(values, table.name, requested_features)
+            for values in redis_values
+        ]
 
-        result: List[Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]] = []
+    @log_exceptions_and_usage(online_store="redis")
+    def online_read_many(
+        self,
+        config: RepoConfig,
+        reads: List[Tuple[FeatureView, List[EntityKeyProto], Optional[List[str]]]],
+    ) -> List[List[Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]]]:
+        """
+        Reads several feature views in a single pipeline.
 
-        if not requested_features:
-            requested_features = [f.name for f in table.features]
+        All the feature views of an entity are stored in the same hash, so the fields requested from
+        every feature view are fetched with a single HMGET per distinct entity key.
+        """
+        online_store_config = config.online_store
+        assert isinstance(online_store_config, RedisOnlineStoreConfig)
+
+        client = self._get_client(online_store_config)
+        # Feature views sharing join keys are read with equal entity keys, which are only serialized once.
+        key_cache: Dict[bytes, bytes] = {}
+        prepared_reads = [
+            self._prepare_read(
+                config, table, entity_keys, requested_features, key_cache
+            )
+            for table, entity_keys, requested_features in reads
+        ]
 
-        hset_keys = [_mmh3(f"{feature_view}:{k}") for k in requested_features]
+        # The position of every requested field in the HMGET of its entity key.
+        fields_by_key: Dict[bytes, Dict[Union[str, bytes], int]] = {}
+        for keys, hset_keys, _ in prepared_reads:
+            for redis_key_bin in keys:
+                fields = fields_by_key.setdefault(redis_key_bin, {})
+                for hset_key in hset_keys:
+                    fields.setdefault(hset_key, len(fields))
 
-        ts_key = f"_ts:{feature_view}"
-        hset_keys.append(ts_key)
-        requested_features.append(ts_key)
+        with client.pipeline(transaction=False) as pipe:
+            for redis_key_bin, fields in fields_by_key.items():
+                pipe.hmget(redis_key_bin, list(fields))
+            with tracing_span(name="remote_call"):
+                redis_values = dict(zip(fields_by_key, pipe.execute()))
 
-        keys = []
-        for entity_key in entity_keys:
-            redis_key_bin = _redis_key(
-                project,
-                entity_key,
-                entity_key_serialization_version=config.entity_key_serialization_version,
+        results = []
+        for (table, _, _), (keys, hset_keys, requested_features) in zip(
+            reads, prepared_reads
+        ):
+            result = []
+            for redis_key_bin in keys:
+                fields = fields_by_key[redis_key_bin]
+                values = redis_values[redis_key_bin]
+                result.append(
+                    self._get_features_for_entity(
+                        [values[fields[hset_key]] for hset_key in hset_keys],
+                        table.name,
+                        requested_features,
+                    )
+                )
+            results.append(result)
+        return results
+
+    async def online_read_async(
+        self,
+        config: RepoConfig,
+        table: FeatureView,
+        entity_keys: List[EntityKeyProto],
+        requested_features: Optional[List[str]] = None,
+    ) -> List[Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]]:
+        online_store_config = config.online_store
+        assert isinstance(online_store_config, RedisOnlineStoreConfig)
+
+        client = await self._client_async.get(
+            lambda: self._open_client_async(online_store_config)
+        )
+        if client is None:
+            # This version of redis-py has no asyncio cluster client.
+            return await super().online_read_async(
+                config, table, entity_keys, requested_features
             )
-            keys.append(redis_key_bin)
-        with client.pipeline(transaction=False) as pipe:
+
+        keys, hset_keys, requested_features = self._prepare_read(
+            config, table, entity_keys, requested_features
+        )
+        async with client.pipeline(transaction=False) as pipe:
             for redis_key_bin in keys:
                 pipe.hmget(redis_key_bin, hset_keys)
             with tracing_span(name="remote_call"):
-                redis_values = pipe.execute()
-        for values in redis_values:
-            features = self._get_features_for_entity(
-                values, feature_view, requested_features
-            )
-            result.append(features)
-        return result
+                redis_values = await pipe.execute()
+        return [
+            self._get_features_for_entity(values, table.name, requested_features)
+            for values in redis_values
+        ]
+
+    async def close_async(self) -> None:
+        client = await self._client_async.pop()
+        if client is not None:
+            await client.close()
+
+    async def _open_client_async(self, online_store_config: RedisOnlineStoreConfig):
+        """
+        Creates the asyncio Redis client RedisCluster or Redis depending on configuration, or returns
+        None if the installed redis-py has no asyncio client for it.
+        """
+        startup_nodes, kwargs = self._parse_connection_string(
+            online_store_config.connection_string
+        )
+        if online_store_config.redis_type == RedisType.redis_cluster:
+            try:
+                from redis.asyncio.cluster import ClusterNode as AsyncClusterNode
+                from redis.asyncio.cluster import RedisCluster as AsyncRedisCluster
+            except ImportError:
+                return None
+            kwargs["startup_nodes"] = [
+                AsyncClusterNode(**node) for node in startup_nodes
+            ]
+            return AsyncRedisCluster(**kwargs)
+        kwargs["host"] = startup_nodes[0]["host"]
+        kwargs["port"] = startup_nodes[0]["port"]
+        return redis_asyncio.Redis(**kwargs)
+
+    def _prepare_read(
+        self,
+        config: RepoConfig,
+        table: FeatureView,
+        entity_keys: List[EntityKeyProto],
+        requested_features: Optional[List[str]],
+        key_cache: Optional[Dict[bytes, bytes]] = None,
+    ) -> Tuple[List[bytes], List[Union[str, bytes]], List[str]]:
+        """
+        Returns the redis keys of the entities, the hash fields to read for each of them, and the
+        names of these fields, which end with the event timestamp field of the feature view.
+
+        If a key cache is given, the redis keys are memoized in it by serialized entity key proto.
+        """
+        feature_view = table.name
+        if not requested_features:
+            requested_features = [f.name for f in table.features]
+
+        hset_keys: List[Union[str, bytes]] = [
+            _mmh3(f"{feature_view}:{k}") for k in requested_features
+        ]
+
+        ts_key = f"_ts:{feature_view}"
+        hset_keys.append(ts_key)
+        # Copy the requested features rather than appending to them, since callers may reuse them.
+        requested_features = [*requested_features, ts_key]
+
+        if key_cache is None:
+            project = config.project.encode("utf-8")
+            keys = [
+                entity_key_bin + project
+                for entity_key_bin in self._entity_key_cache.serialize(
+                    entity_keys,
+                    entity_key_serialization_version=config.entity_key_serialization_version,
+                    maxsize=config.entity_key_cache_size,
+                )
+            ]
+        else:
+            keys = []
+            for entity_key in entity_keys:
+                entity_key_bin = entity_key.SerializeToString()
+                redis_key_bin = key_cache.get(entity_key_bin)
+                if redis_key_bin is None:
+                    redis_key_bin = key_cache[entity_key_bin] = _redis_key(
+                        config.project,
+                        entity_key,
+                        entity_key_serialization_version=config.entity_key_serialization_version,
+                    )
+                keys.append(redis_key_bin)
+        return keys, hset_keys, requested_features
 
     def _get_features_for_entity(
         self,
@@ -14,17 +14,19 @@
 import itertools
 import os
 import sqlite3
+import threading
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 
-from pydantic import StrictStr
+import pyarrow
+from pydantic import StrictInt, StrictStr
 from pydantic.schema import Literal
 
 from feast import Entity
 from feast.feature_view import FeatureView
 from feast.infra.infra_object import SQLITE_INFRA_OBJECT_CLASS_TYPE, InfraObject
-from feast.infra.key_encoding_utils import serialize_entity_key
+from feast.infra.key_encoding_utils import EntityKeyCache, serialize_entity_keys
 from feast.infra.online_stores.online_store import OnlineStore
 from feast.protos.feast.core.InfraObject_pb2 import InfraObject as InfraObjectProto
 from feast.protos.feast.core.Registry_pb2 import Registry as RegistryProto
@@ -47,6 +49,21 @@ class SqliteOnlineStoreConfig(FeastConfigBaseModel):
     path: StrictStr = "data/online.db"
     """ (optional) Path to sqlite db """
 
+    journal_mode: Optional[
+        Literal["DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF"]
+    ] = None
+    """ (optional) SQLite journal mode of the db. WAL lets readers proceed while a batch is being written, but
+    adds -wal and -shm files next to the db, and doesn't work on network filesystems. If None, the journal mode
+    of the db is left as is. """
+
+    synchronous: Optional[Literal["OFF", "NORMAL", "FULL", "EXTRA"]] = None
+    """ (optional) SQLite synchronous level of the connections. In WAL mode, NORMAL is durable against
+    application crashes, and only syncs to disk at WAL checkpoints. If None, SQLite's default (FULL) is used. """
+
+    write_batch_size: StrictInt = 10000
+    """ (optional) Number of entity rows written per transaction by online_write_batch, and of feature
+    values by online_write_batch_serialized. """
+
 
 class SqliteOnlineStore(OnlineStore):
     """
@@ -58,6 +75,12 @@ class SqliteOnlineStore(OnlineStore):
 
     _conn: Optional[sqlite3.Connection] = None
 
+    def __init__(self) -> None:
+        super().__init__()
+        # Writes on the connection must be serialized, since it may be used by several threads.
+        self._write_lock = threading.Lock()
+        self._entity_key_cache = EntityKeyCache()
+
     @staticmethod
     def _get_db_path(config: RepoConfig) -> str:
         assert (
@@ -75,6 +98,14 @@ class SqliteOnlineStore(OnlineStore):
         if not self._conn:
             db_path = self._get_db_path(config)
             self._conn = _initialize_conn(db_path)
+            if config.online_store.journal_mode:
+                self._conn.execute(
+                    f"PRAGMA journal_mode = {config.online_store.journal_mode}"
+                )
+            if config.online_store.synchronous:
+                self._conn.execute(
+                    f"PRAGMA synchronous = {config.online_store.synchronous}"
+                )
         return self._conn
 
     @log_exceptions_and_usage(online_store="sqlite")
@@ -89,51 +120,53 @@ class SqliteOnlineStore(OnlineStore):
     ) -> None:
 
         conn = self._get_conn(config)
+        query = _upsert_query(config.project, table)
+
+        # Each batch of entity rows is upserted in its own transaction.
+        batch_size = config.online_store.write_batch_size
+        data_iter = iter(data)
+        while True:
+            batch = list(itertools.islice(data_iter, batch_size))
+            if not batch:
+                break
+            with self._write_lock, conn:
+                conn.executemany(query, _upsert_rows(config, batch))
+            if progress:
+                progress(len(batch))
+
+    def supports_serialized_writes(self) -> bool:
+        return True
 
-        project = config.project
-
-        with conn:
-            for entity_key, values, timestamp, created_ts in data:
-                entity_key_bin = serialize_entity_key(
-                    entity_key,
-                    entity_key_serialization_version=config.entity_key_serialization_version,
+    @log_exceptions_and_usage(online_store="sqlite")
+    def online_write_batch_serialized(
+        self,
+        config: RepoConfig,
+        table: FeatureView,
+        data: pyarrow.RecordBatch,
+    ) -> None:
+        conn = self._get_conn(config)
+        query = _upsert_query(config.project, table)
+
+        # Each batch of feature values is upserted in its own transaction.
+        batch_size = config.online_store.write_batch_size
+        for offset in range(0, data.num_rows, batch_size):
+            batch = data.slice(offset, batch_size)
+            with self._write_lock, conn:
+                conn.executemany(
+                    query,
+                    zip(
+                        *(
+                            batch.column(name).to_pylist()
+                            for name in (
+                                "entity_key",
+                                "feature_name",
+                                "value",
+                                "event_ts",
+                                "created_ts",
+                            )
+                        )
+                    ),
                 )
-                timestamp = to_naive_utc(timestamp)
-                if created_ts is not None:
-                    created_ts = to_naive_utc(created_ts)
-
-                for feature_name, val in values.items():
-                    conn.execute(
-                        f"""
-                            UPDATE {_table_id(project, table)}
-                            SET value = ?, event_ts = ?, created_ts = ?
-                            WHERE (entity_key = ? AND feature_name = ?)
-                        """,
-                        (
-                            # SET
-                            val.SerializeToString(),
-                            timestamp,
-                            created_ts,
-                            # WHERE
-                            entity_key_bin,
-                            feature_name,
-                        ),
-                    )
-
-                    conn.execute(
-                        f"""INSERT OR IGNORE INTO {_table_id(project, table)}
-                            (entity_key, feature_name, value, event_ts, created_ts)
-                            VALUES (?, ?, ?, ?, ?)""",
-                        (
-                            entity_key_bin,
-                            feature_name,
-                            val.SerializeToString(),
-                            timestamp,
-                            created_ts,
-                        ),
-                    )
-                if progress:
-                    progress(1)
 
     @log_exceptions_and_usage(online_store="sqlite")
     def online_read(
@@ -148,6 +181,12 @@ class SqliteOnlineStore(OnlineStore):
 
         result: List[Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]] = []
 
+        entity_key_bins = self._entity_key_cache.serialize(
+            entity_keys,
+            entity_key_serialization_version=config.entity_key_serialization_version,
+            maxsize=config.entity_key_cache_size,
+        )
+
         with tracing_span(name="remote_call"):
             # Fetch all entities in one go
             cur.execute(
@@ -155,24 +194,14 @@ class SqliteOnlineStore(OnlineStore):
                 f"FROM {_table_id(config.project, table)} "
                 f"WHERE entity_key IN ({','.join('?' * len(entity_keys))}) "
                 f"ORDER BY entity_key",
-                [
-                    serialize_entity_key(
-                        entity_key,
-                        entity_key_serialization_version=config.entity_key_serialization_version,
-                    )
-                    for entity_key in entity_keys
-                ],
+                entity_key_bins,
             )
             rows = cur.fetchall()
 
         rows = {
             k: list(group) for k, group in itertools.groupby(rows, key=lambda r: r[0])
         }
-        for entity_key in entity_keys:
-            entity_key_bin = serialize_entity_key(
-                entity_key,
-                entity_key_serialization_version=config.entity_key_serialization_version,
-            )
+        for entity_key_bin in entity_key_bins:
             res = {}
             res_ts = None
             for _, feature_name, val_bin, ts in rows.get(entity_key_bin, []):
@@ -235,10 +264,16 @@ class SqliteOnlineStore(OnlineStore):
         tables: Sequence[FeatureView],
         entities: Sequence[Entity],
     ):
-        try:
-            os.unlink(self._get_db_path(config))
-        except FileNotFoundError:
-            pass
+        if self._conn:
+            self._conn.close()
+            self._conn = None
+        db_path = self._get_db_path(config)
+        # Also remove the WAL files, which must not outlive their db.
+        for path in (db_path, f"{db_path}-wal", f"{db_path}-shm"):
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
 
 
 def _initialize_conn(db_path: str):
@@ -250,6 +285,45 @@ def _initialize_conn(db_path: str):
     )
 
 
+def _upsert_query(project: str, table: FeatureView) -> str:
+    return f"""
+        INSERT INTO {_table_id(project, table)}
+        (entity_key, feature_name, value, event_ts, created_ts)
+        VALUES (?, ?, ?, ?, ?)
+        ON CONFLICT (entity_key, feature_name) DO UPDATE SET
+            value = excluded.value,
+            event_ts = excluded.event_ts,
+            created_ts = excluded.created_ts
+    """
+
+
+def _upsert_rows(
+    config: RepoConfig,
+    data: List[
+        Tuple[EntityKeyProto, Dict[str, ValueProto], datetime, Optional[datetime]]
+    ],
+):
+    entity_key_bins = serialize_entity_keys(
+        [entity_key for entity_key, _, _, _ in data],
+        entity_key_serialization_version=config.entity_key_serialization_version,
+    )
+    for entity_key_bin, (_, values, timestamp, created_ts) in zip(
+        entity_key_bins, data
+    ):
+        timestamp = to_naive_utc(timestamp)
+        if created_ts is not None:
+            created_ts = to_naive_utc(created_ts)
+
+        for feature_name, val in values.items():
+            yield (
+                entity_key_bin,
+                feature_name,
+                val.SerializeToString(),
+                timestamp,
+                created_ts,
+            )
+
+
 def _table_id(project: str, table: FeatureView) -> str:
     return f"{project}_{table.name}"
 
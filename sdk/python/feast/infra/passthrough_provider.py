@@ -29,6 +29,7 @@ from feast.stream_feature_view import StreamFeatureView
 from feast.usage import RatioSampler, log_exceptions_and_usage, set_usage_attribute
 from feast.utils import (
     _convert_arrow_to_proto,
+    _convert_arrow_to_serialized_rows,
     _run_pyarrow_field_mapping,
     make_tzaware,
 )
@@ -180,7 +181,7 @@ class PassthroughProvider(Provider):
         config: RepoConfig,
         table: FeatureView,
         entity_keys: List[EntityKeyProto],
-        requested_features: List[str] = None,
+        requested_features: Optional[List[str]] = None,
     ) -> List:
         set_usage_attribute("provider", self.__class__.__name__)
         result = []
@@ -190,6 +191,40 @@ class PassthroughProvider(Provider):
             )
         return result
 
+    @log_exceptions_and_usage(sampler=RatioSampler(ratio=0.001))
+    def online_read_many(
+        self,
+        config: RepoConfig,
+        reads: List[Tuple[FeatureView, List[EntityKeyProto], Optional[List[str]]]],
+    ) -> List:
+        set_usage_attribute("provider", self.__class__.__name__)
+        if not self.online_store:
+            return [[] for _ in reads]
+        return self.online_store.online_read_many(config, reads)
+
+    async def online_read_async(
+        self,
+        config: RepoConfig,
+        table: FeatureView,
+        entity_keys: List[EntityKeyProto],
+        requested_features: Optional[List[str]] = None,
+    ) -> List:
+        set_usage_attribute("provider", self.__class__.__name__)
+        result = []
+        if self.online_store:
+            result = await self.online_store.online_read_async(
+                config, table, entity_keys, requested_features
+            )
+        return result
+
+    async def close_async(self) -> None:
+        if self.online_store:
+            await self.online_store.close_async()
+
+    def close(self) -> None:
+        if self._batch_engine:
+            self._batch_engine.close()
+
     def ingest_df(
         self,
         feature_view: FeatureView,
@@ -207,6 +242,19 @@ class PassthroughProvider(Provider):
             entity.name: entity.dtype.to_value_type()
             for entity in feature_view.entity_columns
         }
+        if self.online_store and self.online_store.supports_serialized_writes():
+            self.online_store.online_write_batch_serialized(
+                self.repo_config,
+                feature_view,
+                _convert_arrow_to_serialized_rows(
+                    table,
+                    feature_view,
+                    join_keys,
+                    self.repo_config.entity_key_serialization_version,
+                ),
+            )
+            return
+
         rows_to_write = _convert_arrow_to_proto(table, feature_view, join_keys)
 
         self.online_write_batch(
@@ -239,19 +287,43 @@ class PassthroughProvider(Provider):
             or isinstance(feature_view, StreamFeatureView)
             or isinstance(feature_view, FeatureView)
         ), f"Unexpected type for {feature_view.name}: {type(feature_view)}"
-        task = MaterializationTask(
-            project=project,
-            feature_view=feature_view,
-            start_time=start_date,
-            end_time=end_date,
-            tqdm_builder=tqdm_builder,
-        )
-        jobs = self.batch_engine.materialize(registry, [task])
-        assert len(jobs) == 1
-        if jobs[0].status() == MaterializationJobStatus.ERROR and jobs[0].error():
-            e = jobs[0].error()
-            assert e
-            raise e
+        error = self.materialize_feature_views(
+            config,
+            [(feature_view, start_date, end_date)],
+            registry,
+            project,
+            tqdm_builder,
+        )[0]
+        if error:
+            raise error
+
+    def materialize_feature_views(
+        self,
+        config: RepoConfig,
+        materializations: List[Tuple[FeatureView, datetime, datetime]],
+        registry: BaseRegistry,
+        project: str,
+        tqdm_builder: Callable[[int], tqdm],
+    ) -> List[Optional[BaseException]]:
+        set_usage_attribute("provider", self.__class__.__name__)
+        # The feature views are materialized by a single call to the batch engine, which can run them
+        # concurrently.
+        tasks = [
+            MaterializationTask(
+                project=project,
+                feature_view=feature_view,
+                start_time=start_date,
+                end_time=end_date,
+                tqdm_builder=tqdm_builder,
+            )
+            for feature_view, start_date, end_date in materializations
+        ]
+        jobs = self.batch_engine.materialize(registry, tasks)
+        assert len(jobs) == len(tasks)
+        return [
+            job.error() if job.status() == MaterializationJobStatus.ERROR else None
+            for job in jobs
+        ]
 
     def get_historical_features(
         self,
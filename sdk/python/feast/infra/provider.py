@@ -1,3 +1,5 @@
+import asyncio
+import functools
 from abc import ABC, abstractmethod
 from datetime import datetime
 from pathlib import Path
@@ -173,6 +175,50 @@ class Provider(ABC):
         """
         pass
 
+    def materialize_feature_views(
+        self,
+        config: RepoConfig,
+        materializations: List[Tuple[FeatureView, datetime, datetime]],
+        registry: BaseRegistry,
+        project: str,
+        tqdm_builder: Callable[[int], tqdm],
+    ) -> List[Optional[BaseException]]:
+        """
+        Writes latest feature values of several feature views to the online store.
+
+        By default, `materialize_single_feature_view` is called for each feature view in turn. Providers may
+        materialize the feature views concurrently instead.
+
+        Args:
+            config: The config for the current feature store.
+            materializations: A list of triplets, each containing a feature view to materialize and the
+                start and end of its time range.
+            registry: The registry for the current feature store.
+            project: Feast project to which the objects belong.
+            tqdm_builder: A function to monitor the progress of materialization.
+
+        Returns:
+            A list with the error raised while materializing each item of materializations, or None if
+            it was materialized, in the same order.
+        """
+        errors: List[Optional[BaseException]] = []
+        for feature_view, start_date, end_date in materializations:
+            try:
+                self.materialize_single_feature_view(
+                    config,
+                    feature_view,
+                    start_date,
+                    end_date,
+                    registry,
+                    project,
+                    tqdm_builder,
+                )
+            except Exception as e:
+                errors.append(e)
+            else:
+                errors.append(None)
+        return errors
+
     @abstractmethod
     def get_historical_features(
         self,
@@ -211,7 +257,7 @@ class Provider(ABC):
         config: RepoConfig,
         table: FeatureView,
         entity_keys: List[EntityKeyProto],
-        requested_features: List[str] = None,
+        requested_features: Optional[List[str]] = None,
     ) -> List[Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]]:
         """
         Reads features values for the given entity keys.
@@ -229,6 +275,71 @@ class Provider(ABC):
         """
         pass
 
+    def online_read_many(
+        self,
+        config: RepoConfig,
+        reads: List[Tuple[FeatureView, List[EntityKeyProto], Optional[List[str]]]],
+    ) -> List[List[Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]]]:
+        """
+        Reads features values for the given entity keys of several feature views.
+
+        By default, `online_read` is called for each feature view in turn.
+
+        Args:
+            config: The config for the current feature store.
+            reads: A list of triplets, each containing a feature view, the list of entity keys for which
+                its feature values should be read, and the list of its features that should be read.
+
+        Returns:
+            A list with the result of `online_read` for each item of reads, in the same order.
+        """
+        return [
+            self.online_read(config, table, entity_keys, requested_features)
+            for table, entity_keys, requested_features in reads
+        ]
+
+    async def online_read_async(
+        self,
+        config: RepoConfig,
+        table: FeatureView,
+        entity_keys: List[EntityKeyProto],
+        requested_features: Optional[List[str]] = None,
+    ) -> List[Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]]:
+        """
+        Reads features values for the given entity keys asynchronously.
+
+        By default, `online_read` is run in the default executor of the running event loop.
+
+        Args:
+            config: The config for the current feature store.
+            table: The feature view whose feature values should be read.
+            entity_keys: The list of entity keys for which feature values should be read.
+            requested_features: The list of features that should be read.
+
+        Returns:
+            A list of the same length as entity_keys. Each item in the list is a tuple where the first
+            item is the event timestamp for the row, and the second item is a dict mapping feature names
+            to values, which are returned in proto format.
+        """
+        return await asyncio.get_running_loop().run_in_executor(
+            None,
+            functools.partial(
+                self.online_read, config, table, entity_keys, requested_features
+            ),
+        )
+
+    async def close_async(self) -> None:
+        """
+        Closes the asynchronous clients opened by `online_read_async` in the running event loop.
+        """
+        pass
+
+    def close(self) -> None:
+        """
+        Releases the resources kept by the provider across materializations, such as worker processes.
+        """
+        pass
+
     @abstractmethod
     def retrieve_saved_dataset(
         self, config: RepoConfig, dataset: SavedDataset
@@ -15,7 +15,7 @@ import json
 from abc import ABC, abstractmethod
 from collections import defaultdict
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Hashable, List, Optional
 
 from google.protobuf.json_format import MessageToJson
 from proto import Message
@@ -26,6 +26,7 @@ from feast.entity import Entity
 from feast.feature_service import FeatureService
 from feast.feature_view import FeatureView
 from feast.infra.infra_object import Infra
+from feast.infra.registry.registry_refresher import RegistryRefreshMetrics
 from feast.on_demand_feature_view import OnDemandFeatureView
 from feast.project_metadata import ProjectMetadata
 from feast.protos.feast.core.Registry_pb2 import Registry as RegistryProto
@@ -572,6 +573,32 @@ class BaseRegistry(ABC):
     def refresh(self, project: Optional[str] = None):
         """Refreshes the state of the registry cache by fetching the registry state from the remote registry store."""
 
+    def get_cache_version(self, project: str) -> Optional[Hashable]:
+        """
+        Returns a token identifying the registry state that is currently served from the registry cache,
+        refreshing the cache first if it has expired.
+
+        The token changes every time the cache is refreshed or modified, which allows callers to memoize
+        state derived from cached registry objects. Registries that do not cache return None, in which
+        case derived state must not be memoized.
+
+        Args:
+            project: Feast project whose cached state is being used
+
+        Returns:
+            A hashable token, or None if the registry state is not cached.
+        """
+        return None
+
+    def get_refresh_metrics(self) -> Optional[RegistryRefreshMetrics]:
+        """
+        Returns metrics about the background refreshes of the registry cache.
+
+        Returns:
+            The refresh metrics, or None if the registry cache is not refreshed in the background.
+        """
+        return None
+
     @staticmethod
     def _message_to_sorted_dict(message: Message) -> Dict[str, Any]:
         return json.loads(MessageToJson(message, sort_keys=True))
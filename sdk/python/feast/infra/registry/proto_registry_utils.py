@@ -1,5 +1,6 @@
 import uuid
-from typing import List, Optional
+from threading import Lock
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
 
 from feast import usage
 from feast.data_source import DataSource
@@ -23,6 +24,139 @@ from feast.saved_dataset import SavedDataset, ValidationReference
 from feast.stream_feature_view import StreamFeatureView
 
 
+class RegistryProtoIndex:
+    """
+    An index over a single RegistryProto snapshot that supports O(1) lookups of registry objects by
+    project and name.
+
+    Objects of each type are deserialized once, on first access, and are shared between all callers
+    afterwards. Callers must therefore treat them as read-only. The index must be replaced whenever the
+    underlying proto is replaced or modified.
+    """
+
+    # Maps each indexed field of the RegistryProto to the python class of its objects and a function that
+    # extracts the (project, name) key from an object proto.
+    _INDEXED_FIELDS: Dict[str, Tuple[Type, Callable[[Any], Tuple[str, str]]]] = {
+        "entities": (Entity, lambda proto: (proto.spec.project, proto.spec.name)),
+        "data_sources": (DataSource, lambda proto: (proto.project, proto.name)),
+        "feature_views": (
+            FeatureView,
+            lambda proto: (proto.spec.project, proto.spec.name),
+        ),
+        "stream_feature_views": (
+            StreamFeatureView,
+            lambda proto: (proto.spec.project, proto.spec.name),
+        ),
+        "on_demand_feature_views": (
+            OnDemandFeatureView,
+            lambda proto: (proto.spec.project, proto.spec.name),
+        ),
+        "request_feature_views": (
+            RequestFeatureView,
+            lambda proto: (proto.spec.project, proto.spec.name),
+        ),
+        "feature_services": (
+            FeatureService,
+            lambda proto: (proto.spec.project, proto.spec.name),
+        ),
+    }
+
+    def __init__(self, registry_proto: RegistryProto):
+        self.registry_proto = registry_proto
+        self._indexes: Dict[
+            str, Tuple[Dict[Tuple[str, str], Any], Dict[str, List[Any]]]
+        ] = {}
+        self._lock = Lock()
+
+    def _get(self, field: str, name: str, project: str) -> Optional[Any]:
+        objects_by_key, _ = self._get_index(field)
+        return objects_by_key.get((project, name))
+
+    def _list(self, field: str, project: str) -> List[Any]:
+        _, objects_by_project = self._get_index(field)
+        return list(objects_by_project.get(project, []))
+
+    def _get_index(
+        self, field: str
+    ) -> Tuple[Dict[Tuple[str, str], Any], Dict[str, List[Any]]]:
+        index = self._indexes.get(field)
+        if index is not None:
+            return index
+
+        with self._lock:
+            if field not in self._indexes:
+                python_class, get_key = self._INDEXED_FIELDS[field]
+                objects_by_key: Dict[Tuple[str, str], Any] = {}
+                objects_by_project: Dict[str, List[Any]] = {}
+                for proto in getattr(self.registry_proto, field):
+                    key = get_key(proto)
+                    obj = python_class.from_proto(proto)
+                    # Keep the first match, which is what a linear scan would return.
+                    objects_by_key.setdefault(key, obj)
+                    objects_by_project.setdefault(key[0], []).append(obj)
+                self._indexes[field] = (objects_by_key, objects_by_project)
+            return self._indexes[field]
+
+    def get_entity(self, name: str, project: str) -> Entity:
+        entity = self._get("entities", name, project)
+        if entity is None:
+            raise EntityNotFoundException(name, project=project)
+        return entity
+
+    def get_data_source(self, name: str, project: str) -> DataSource:
+        data_source = self._get("data_sources", name, project)
+        if data_source is None:
+            raise DataSourceObjectNotFoundException(name, project=project)
+        return data_source
+
+    def get_feature_view(self, name: str, project: str) -> FeatureView:
+        feature_view = self._get("feature_views", name, project)
+        if feature_view is None:
+            raise FeatureViewNotFoundException(name, project)
+        return feature_view
+
+    def get_stream_feature_view(self, name: str, project: str) -> StreamFeatureView:
+        stream_feature_view = self._get("stream_feature_views", name, project)
+        if stream_feature_view is None:
+            raise FeatureViewNotFoundException(name, project)
+        return stream_feature_view
+
+    def get_on_demand_feature_view(
+        self, name: str, project: str
+    ) -> OnDemandFeatureView:
+        on_demand_feature_view = self._get("on_demand_feature_views", name, project)
+        if on_demand_feature_view is None:
+            raise FeatureViewNotFoundException(name, project=project)
+        return on_demand_feature_view
+
+    def get_feature_service(self, name: str, project: str) -> FeatureService:
+        feature_service = self._get("feature_services", name, project)
+        if feature_service is None:
+            raise FeatureServiceNotFoundException(name, project=project)
+        return feature_service
+
+    def list_entities(self, project: str) -> List[Entity]:
+        return self._list("entities", project)
+
+    def list_data_sources(self, project: str) -> List[DataSource]:
+        return self._list("data_sources", project)
+
+    def list_feature_views(self, project: str) -> List[FeatureView]:
+        return self._list("feature_views", project)
+
+    def list_stream_feature_views(self, project: str) -> List[StreamFeatureView]:
+        return self._list("stream_feature_views", project)
+
+    def list_on_demand_feature_views(self, project: str) -> List[OnDemandFeatureView]:
+        return self._list("on_demand_feature_views", project)
+
+    def list_request_feature_views(self, project: str) -> List[RequestFeatureView]:
+        return self._list("request_feature_views", project)
+
+    def list_feature_services(self, project: str) -> List[FeatureService]:
+        return self._list("feature_services", project)
+
+
 def init_project_metadata(cached_registry_proto: RegistryProto, project: str):
     new_project_uuid = f"{uuid.uuid4()}"
     usage.set_current_project_uuid(new_project_uuid)
@@ -16,7 +16,7 @@ from datetime import datetime, timedelta
 from enum import Enum
 from pathlib import Path
 from threading import Lock
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Hashable, List, Optional
 from urllib.parse import urlparse
 
 from google.protobuf.internal.containers import RepeatedCompositeFieldContainer
@@ -40,6 +40,10 @@ from feast.importer import import_class
 from feast.infra.infra_object import Infra
 from feast.infra.registry import proto_registry_utils
 from feast.infra.registry.base_registry import BaseRegistry
+from feast.infra.registry.registry_refresher import (
+    RegistryRefresher,
+    RegistryRefreshMetrics,
+)
 from feast.infra.registry.registry_store import NoopRegistryStore
 from feast.on_demand_feature_view import OnDemandFeatureView
 from feast.project_metadata import ProjectMetadata
@@ -162,6 +166,16 @@ class Registry(BaseRegistry):
     cached_registry_proto_created: Optional[datetime] = None
     cached_registry_proto_ttl: timedelta
 
+    # Incremented every time cached_registry_proto is replaced or handed out for modification,
+    # see get_cache_version().
+    _cache_version: int = 0
+
+    # Index of the objects in cached_registry_proto, which is rebuilt lazily after the proto changes.
+    _registry_index: Optional[proto_registry_utils.RegistryProtoIndex] = None
+
+    # Set when the registry cache is refreshed by a background thread instead of by readers.
+    _refresher: Optional[RegistryRefresher] = None
+
     def __new__(
         cls,
         project: str,
@@ -212,6 +226,14 @@ class Registry(BaseRegistry):
                 if registry_config.cache_ttl_seconds is not None
                 else 0
             )
+            if (
+                registry_config.cache_mode == "thread"
+                and self.cached_registry_proto_ttl.total_seconds() > 0
+            ):
+                self._refresher = RegistryRefresher(
+                    self, project, self.cached_registry_proto_ttl
+                )
+                self._refresher.start()
 
     def clone(self) -> "Registry":
         new_registry = Registry("project", None, None)
@@ -277,18 +299,18 @@ class Registry(BaseRegistry):
             self.commit()
 
     def list_entities(self, project: str, allow_cache: bool = False) -> List[Entity]:
-        registry_proto = self._get_registry_proto(
+        registry_index = self._get_registry_index(
             project=project, allow_cache=allow_cache
         )
-        return proto_registry_utils.list_entities(registry_proto, project)
+        return registry_index.list_entities(project)
 
     def list_data_sources(
         self, project: str, allow_cache: bool = False
     ) -> List[DataSource]:
-        registry_proto = self._get_registry_proto(
+        registry_index = self._get_registry_index(
             project=project, allow_cache=allow_cache
         )
-        return proto_registry_utils.list_data_sources(registry_proto, project)
+        return registry_index.list_data_sources(project)
 
     def apply_data_source(
         self, data_source: DataSource, project: str, commit: bool = True
@@ -350,24 +372,24 @@ class Registry(BaseRegistry):
     def list_feature_services(
         self, project: str, allow_cache: bool = False
     ) -> List[FeatureService]:
-        registry_proto = self._get_registry_proto(
+        registry_index = self._get_registry_index(
             project=project, allow_cache=allow_cache
         )
-        return proto_registry_utils.list_feature_services(registry_proto, project)
+        return registry_index.list_feature_services(project)
 
     def get_feature_service(
         self, name: str, project: str, allow_cache: bool = False
     ) -> FeatureService:
-        registry_proto = self._get_registry_proto(
+        registry_index = self._get_registry_index(
             project=project, allow_cache=allow_cache
         )
-        return proto_registry_utils.get_feature_service(registry_proto, name, project)
+        return registry_index.get_feature_service(name, project)
 
     def get_entity(self, name: str, project: str, allow_cache: bool = False) -> Entity:
-        registry_proto = self._get_registry_proto(
+        registry_index = self._get_registry_index(
             project=project, allow_cache=allow_cache
         )
-        return proto_registry_utils.get_entity(registry_proto, name, project)
+        return registry_index.get_entity(name, project)
 
     def apply_feature_view(
         self, feature_view: BaseFeatureView, project: str, commit: bool = True
@@ -428,38 +450,34 @@ class Registry(BaseRegistry):
     def list_stream_feature_views(
         self, project: str, allow_cache: bool = False
     ) -> List[StreamFeatureView]:
-        registry_proto = self._get_registry_proto(
+        registry_index = self._get_registry_index(
             project=project, allow_cache=allow_cache
         )
-        return proto_registry_utils.list_stream_feature_views(registry_proto, project)
+        return registry_index.list_stream_feature_views(project)
 
     def list_on_demand_feature_views(
         self, project: str, allow_cache: bool = False
     ) -> List[OnDemandFeatureView]:
-        registry_proto = self._get_registry_proto(
+        registry_index = self._get_registry_index(
             project=project, allow_cache=allow_cache
         )
-        return proto_registry_utils.list_on_demand_feature_views(
-            registry_proto, project
-        )
+        return registry_index.list_on_demand_feature_views(project)
 
     def get_on_demand_feature_view(
         self, name: str, project: str, allow_cache: bool = False
     ) -> OnDemandFeatureView:
-        registry_proto = self._get_registry_proto(
+        registry_index = self._get_registry_index(
             project=project, allow_cache=allow_cache
         )
-        return proto_registry_utils.get_on_demand_feature_view(
-            registry_proto, name, project
-        )
+        return registry_index.get_on_demand_feature_view(name, project)
 
     def get_data_source(
         self, name: str, project: str, allow_cache: bool = False
     ) -> DataSource:
-        registry_proto = self._get_registry_proto(
+        registry_index = self._get_registry_index(
             project=project, allow_cache=allow_cache
         )
-        return proto_registry_utils.get_data_source(registry_proto, name, project)
+        return registry_index.get_data_source(name, project)
 
     def apply_materialization(
         self,
@@ -523,10 +541,10 @@ class Registry(BaseRegistry):
     def list_feature_views(
         self, project: str, allow_cache: bool = False
     ) -> List[FeatureView]:
-        registry_proto = self._get_registry_proto(
+        registry_index = self._get_registry_index(
             project=project, allow_cache=allow_cache
         )
-        return proto_registry_utils.list_feature_views(registry_proto, project)
+        return registry_index.list_feature_views(project)
 
     def get_request_feature_view(self, name: str, project: str):
         registry_proto = self._get_registry_proto(project=project, allow_cache=False)
@@ -537,28 +555,26 @@ class Registry(BaseRegistry):
     def list_request_feature_views(
         self, project: str, allow_cache: bool = False
     ) -> List[RequestFeatureView]:
-        registry_proto = self._get_registry_proto(
+        registry_index = self._get_registry_index(
             project=project, allow_cache=allow_cache
         )
-        return proto_registry_utils.list_request_feature_views(registry_proto, project)
+        return registry_index.list_request_feature_views(project)
 
     def get_feature_view(
         self, name: str, project: str, allow_cache: bool = False
     ) -> FeatureView:
-        registry_proto = self._get_registry_proto(
+        registry_index = self._get_registry_index(
             project=project, allow_cache=allow_cache
         )
-        return proto_registry_utils.get_feature_view(registry_proto, name, project)
+        return registry_index.get_feature_view(name, project)
 
     def get_stream_feature_view(
         self, name: str, project: str, allow_cache: bool = False
     ) -> StreamFeatureView:
-        registry_proto = self._get_registry_proto(
+        registry_index = self._get_registry_index(
             project=project, allow_cache=allow_cache
         )
-        return proto_registry_utils.get_stream_feature_view(
-            registry_proto, name, project
-        )
+        return registry_index.get_stream_feature_view(name, project)
 
     def delete_feature_service(self, name: str, project: str, commit: bool = True):
         self._prepare_registry_for_changes(project)
@@ -769,8 +785,15 @@ class Registry(BaseRegistry):
         """Refreshes the state of the registry cache by fetching the registry state from the remote registry store."""
         self._get_registry_proto(project=project, allow_cache=False)
 
+    def get_refresh_metrics(self) -> Optional[RegistryRefreshMetrics]:
+        if not self._refresher:
+            return None
+        return self._refresher.metrics(self.cached_registry_proto_created)
+
     def teardown(self):
         """Tears down (removes) the registry."""
+        if self._refresher:
+            self._refresher.stop()
         self._registry_store.teardown()
 
     def proto(self) -> RegistryProto:
@@ -807,8 +830,38 @@ class Registry(BaseRegistry):
             )
             self.commit()
 
+        # The cached proto is about to be modified in place.
+        self._cache_version += 1
+        self._registry_index = None
         return self.cached_registry_proto
 
+    def get_cache_version(self, project: str) -> Optional[Hashable]:
+        self._get_registry_proto(project=project, allow_cache=True)
+        return self._cache_version
+
+    def _get_registry_index(
+        self, project: Optional[str], allow_cache: bool = False
+    ) -> proto_registry_utils.RegistryProtoIndex:
+        """Returns an index over the cached or remote registry state
+
+        Args:
+            project: Name of the Feast project (optional)
+            allow_cache: Whether to allow the use of the registry cache when fetching the RegistryProto
+
+        Returns: Returns a RegistryProtoIndex over the RegistryProto returned by _get_registry_proto
+        """
+        registry_proto = self._get_registry_proto(
+            project=project, allow_cache=allow_cache
+        )
+        registry_index = self._registry_index
+        if (
+            registry_index is None
+            or registry_index.registry_proto is not registry_proto
+        ):
+            registry_index = proto_registry_utils.RegistryProtoIndex(registry_proto)
+            self._registry_index = registry_index
+        return registry_index
+
     def _get_registry_proto(
         self, project: Optional[str], allow_cache: bool = False
     ) -> RegistryProto:
@@ -820,6 +873,17 @@ class Registry(BaseRegistry):
 
         Returns: Returns a RegistryProto object which represents the state of the registry
         """
+        if allow_cache and self._refresher:
+            # The cache is kept up to date by the refresher, so the last loaded state is served
+            # without waiting for the lock, however old it is.
+            registry_proto = self.cached_registry_proto
+            if registry_proto is not None and (
+                not project
+                or proto_registry_utils.get_project_metadata(registry_proto, project)
+                is not None
+            ):
+                return registry_proto
+
         with self._refresh_lock:
             expired = (
                 self.cached_registry_proto is None
@@ -852,6 +916,7 @@ class Registry(BaseRegistry):
             registry_proto = self._registry_store.get_registry_proto()
             self.cached_registry_proto = registry_proto
             self.cached_registry_proto_created = datetime.utcnow()
+            self._cache_version += 1
 
             if not project:
                 return registry_proto
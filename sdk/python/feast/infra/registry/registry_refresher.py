@@ -0,0 +1,100 @@
+import logging
+import time
+import weakref
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from threading import Event, Lock, Thread
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from feast.infra.registry.base_registry import BaseRegistry
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class RegistryRefreshMetrics:
+    """
+    A point-in-time view of the background refreshes of a registry cache.
+
+    Attributes:
+        refresh_count: The number of refreshes that succeeded.
+        refresh_failure_count: The number of refreshes that raised an exception.
+        last_refresh_duration_seconds: How long the last refresh took, whether it succeeded or not.
+        snapshot_age_seconds: How long ago the registry state currently being served was loaded.
+    """
+
+    refresh_count: int
+    refresh_failure_count: int
+    last_refresh_duration_seconds: Optional[float]
+    snapshot_age_seconds: Optional[float]
+
+
+class RegistryRefresher:
+    """
+    Refreshes the cache of a registry from a daemon thread, so that readers never wait for the
+    registry store while the cache is being reloaded.
+
+    The refresher only holds a weak reference to its registry, and stops once the registry has been
+    garbage collected.
+    """
+
+    def __init__(
+        self, registry: "BaseRegistry", project: Optional[str], interval: timedelta
+    ):
+        self._registry_ref = weakref.ref(registry)
+        self._project = project
+        self._interval_seconds = interval.total_seconds()
+        self._stop_event = Event()
+        self._metrics_lock = Lock()
+        self._refresh_count = 0
+        self._refresh_failure_count = 0
+        self._last_refresh_duration_seconds: Optional[float] = None
+        self._thread = Thread(
+            target=self._run, name="feast-registry-refresher", daemon=True
+        )
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop_event.set()
+
+    def metrics(self, snapshot_created: Optional[datetime]) -> RegistryRefreshMetrics:
+        with self._metrics_lock:
+            return RegistryRefreshMetrics(
+                refresh_count=self._refresh_count,
+                refresh_failure_count=self._refresh_failure_count,
+                last_refresh_duration_seconds=self._last_refresh_duration_seconds,
+                snapshot_age_seconds=(
+                    datetime.utcnow() - snapshot_created
+                ).total_seconds()
+                if snapshot_created
+                else None,
+            )
+
+    def _run(self):
+        while not self._stop_event.wait(self._interval_seconds):
+            registry = self._registry_ref()
+            if registry is None:
+                return
+            self._refresh(registry)
+            # Drop the strong reference while waiting, so that the registry can be collected.
+            del registry
+
+    def _refresh(self, registry: "BaseRegistry"):
+        start = time.monotonic()
+        failed = False
+        try:
+            registry.refresh(self._project)
+        except Exception:
+            failed = True
+            logger.exception(
+                "Failed to refresh the registry cache, continuing to serve the cached registry state"
+            )
+        with self._metrics_lock:
+            self._last_refresh_duration_seconds = time.monotonic() - start
+            if failed:
+                self._refresh_failure_count += 1
+            else:
+                self._refresh_count += 1
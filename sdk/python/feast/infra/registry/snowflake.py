@@ -5,7 +5,7 @@ from binascii import hexlify
 from datetime import datetime, timedelta
 from enum import Enum
 from threading import Lock
-from typing import Any, Callable, List, Optional, Set, Union
+from typing import Any, Callable, Hashable, List, Optional, Set, Union
 
 from pydantic import Field, StrictStr
 from pydantic.schema import Literal
@@ -28,6 +28,10 @@ from feast.feature_view import FeatureView
 from feast.infra.infra_object import Infra
 from feast.infra.registry import proto_registry_utils
 from feast.infra.registry.base_registry import BaseRegistry
+from feast.infra.registry.registry_refresher import (
+    RegistryRefresher,
+    RegistryRefreshMetrics,
+)
 from feast.infra.utils.snowflake.snowflake_utils import (
     GetSnowflakeConnection,
     execute_snowflake_statement,
@@ -136,14 +140,27 @@ class SnowflakeRegistry(BaseRegistry):
 
         self.cached_registry_proto = self.proto()
         proto_registry_utils.init_project_metadata(self.cached_registry_proto, project)
+        self._registry_index = proto_registry_utils.RegistryProtoIndex(
+            self.cached_registry_proto
+        )
         self.cached_registry_proto_created = datetime.utcnow()
         self._refresh_lock = Lock()
+        self._cache_version = 0
         self.cached_registry_proto_ttl = timedelta(
             seconds=registry_config.cache_ttl_seconds
             if registry_config.cache_ttl_seconds is not None
             else 0
         )
         self.project = project
+        self._refresher: Optional[RegistryRefresher] = None
+        if (
+            registry_config.cache_mode == "thread"
+            and self.cached_registry_proto_ttl.total_seconds() > 0
+        ):
+            self._refresher = RegistryRefresher(
+                self, project, self.cached_registry_proto_ttl
+            )
+            self._refresher.start()
 
     def refresh(self, project: Optional[str] = None):
         if project:
@@ -156,10 +173,27 @@ class SnowflakeRegistry(BaseRegistry):
                 proto_registry_utils.init_project_metadata(
                     self.cached_registry_proto, project
                 )
-        self.cached_registry_proto = self.proto()
+        registry_proto = self.proto()
+        self._registry_index = proto_registry_utils.RegistryProtoIndex(registry_proto)
+        self.cached_registry_proto = registry_proto
         self.cached_registry_proto_created = datetime.utcnow()
+        self._cache_version += 1
+
+    def get_cache_version(self, project: str) -> Optional[Hashable]:
+        self._refresh_cached_registry_if_necessary()
+        return self._cache_version
+
+    def get_refresh_metrics(self) -> Optional[RegistryRefreshMetrics]:
+        if not self._refresher:
+            return None
+        return self._refresher.metrics(self.cached_registry_proto_created)
 
     def _refresh_cached_registry_if_necessary(self):
+        if self._refresher:
+            # The cache is kept up to date by the refresher, so the last loaded state is served
+            # without waiting for the lock, however old it is.
+            return
+
         with self._refresh_lock:
             expired = (
                 self.cached_registry_proto is None
@@ -181,6 +215,8 @@ class SnowflakeRegistry(BaseRegistry):
                 self.refresh()
 
     def teardown(self):
+        if self._refresher:
+            self._refresher.stop()
         with GetSnowflakeConnection(self.registry_config) as conn:
             sql_function_file = f"{os.path.dirname(feast.__file__)}/infra/utils/snowflake/registry/snowflake_table_deletion.sql"
             with open(sql_function_file, "r") as file:
@@ -430,9 +466,7 @@ class SnowflakeRegistry(BaseRegistry):
     ) -> DataSource:
         if allow_cache:
             self._refresh_cached_registry_if_necessary()
-            return proto_registry_utils.get_data_source(
-                self.cached_registry_proto, name, project
-            )
+            return self._registry_index.get_data_source(name, project)
         return self._get_object(
             "DATA_SOURCES",
             name,
@@ -447,9 +481,7 @@ class SnowflakeRegistry(BaseRegistry):
     def get_entity(self, name: str, project: str, allow_cache: bool = False) -> Entity:
         if allow_cache:
             self._refresh_cached_registry_if_necessary()
-            return proto_registry_utils.get_entity(
-                self.cached_registry_proto, name, project
-            )
+            return self._registry_index.get_entity(name, project)
         return self._get_object(
             "ENTITIES",
             name,
@@ -466,9 +498,7 @@ class SnowflakeRegistry(BaseRegistry):
     ) -> FeatureService:
         if allow_cache:
             self._refresh_cached_registry_if_necessary()
-            return proto_registry_utils.get_feature_service(
-                self.cached_registry_proto, name, project
-            )
+            return self._registry_index.get_feature_service(name, project)
         return self._get_object(
             "FEATURE_SERVICES",
             name,
@@ -485,9 +515,7 @@ class SnowflakeRegistry(BaseRegistry):
     ) -> FeatureView:
         if allow_cache:
             self._refresh_cached_registry_if_necessary()
-            return proto_registry_utils.get_feature_view(
-                self.cached_registry_proto, name, project
-            )
+            return self._registry_index.get_feature_view(name, project)
         return self._get_object(
             "FEATURE_VIEWS",
             name,
@@ -518,9 +546,7 @@ class SnowflakeRegistry(BaseRegistry):
     ) -> OnDemandFeatureView:
         if allow_cache:
             self._refresh_cached_registry_if_necessary()
-            return proto_registry_utils.get_on_demand_feature_view(
-                self.cached_registry_proto, name, project
-            )
+            return self._registry_index.get_on_demand_feature_view(name, project)
         return self._get_object(
             "ON_DEMAND_FEATURE_VIEWS",
             name,
@@ -575,9 +601,7 @@ class SnowflakeRegistry(BaseRegistry):
     ):
         if allow_cache:
             self._refresh_cached_registry_if_necessary()
-            return proto_registry_utils.get_stream_feature_view(
-                self.cached_registry_proto, name, project
-            )
+            return self._registry_index.get_stream_feature_view(name, project)
         return self._get_object(
             "STREAM_FEATURE_VIEWS",
             name,
@@ -647,9 +671,7 @@ class SnowflakeRegistry(BaseRegistry):
     ) -> List[DataSource]:
         if allow_cache:
             self._refresh_cached_registry_if_necessary()
-            return proto_registry_utils.list_data_sources(
-                self.cached_registry_proto, project
-            )
+            return self._registry_index.list_data_sources(project)
         return self._list_objects(
             "DATA_SOURCES", project, DataSourceProto, DataSource, "DATA_SOURCE_PROTO"
         )
@@ -657,9 +679,7 @@ class SnowflakeRegistry(BaseRegistry):
     def list_entities(self, project: str, allow_cache: bool = False) -> List[Entity]:
         if allow_cache:
             self._refresh_cached_registry_if_necessary()
-            return proto_registry_utils.list_entities(
-                self.cached_registry_proto, project
-            )
+            return self._registry_index.list_entities(project)
         return self._list_objects(
             "ENTITIES", project, EntityProto, Entity, "ENTITY_PROTO"
         )
@@ -669,9 +689,7 @@ class SnowflakeRegistry(BaseRegistry):
     ) -> List[FeatureService]:
         if allow_cache:
             self._refresh_cached_registry_if_necessary()
-            return proto_registry_utils.list_feature_services(
-                self.cached_registry_proto, project
-            )
+            return self._registry_index.list_feature_services(project)
         return self._list_objects(
             "FEATURE_SERVICES",
             project,
@@ -685,9 +703,7 @@ class SnowflakeRegistry(BaseRegistry):
     ) -> List[FeatureView]:
         if allow_cache:
             self._refresh_cached_registry_if_necessary()
-            return proto_registry_utils.list_feature_views(
-                self.cached_registry_proto, project
-            )
+            return self._registry_index.list_feature_views(project)
         return self._list_objects(
             "FEATURE_VIEWS",
             project,
@@ -701,9 +717,7 @@ class SnowflakeRegistry(BaseRegistry):
     ) -> List[OnDemandFeatureView]:
         if allow_cache:
             self._refresh_cached_registry_if_necessary()
-            return proto_registry_utils.list_on_demand_feature_views(
-                self.cached_registry_proto, project
-            )
+            return self._registry_index.list_on_demand_feature_views(project)
         return self._list_objects(
             "ON_DEMAND_FEATURE_VIEWS",
             project,
@@ -717,9 +731,7 @@ class SnowflakeRegistry(BaseRegistry):
     ) -> List[RequestFeatureView]:
         if allow_cache:
             self._refresh_cached_registry_if_necessary()
-            return proto_registry_utils.list_request_feature_views(
-                self.cached_registry_proto, project
-            )
+            return self._registry_index.list_request_feature_views(project)
         return self._list_objects(
             "REQUEST_FEATURE_VIEWS",
             project,
@@ -749,9 +761,7 @@ class SnowflakeRegistry(BaseRegistry):
     ) -> List[StreamFeatureView]:
         if allow_cache:
             self._refresh_cached_registry_if_necessary()
-            return proto_registry_utils.list_stream_feature_views(
-                self.cached_registry_proto, project
-            )
+            return self._registry_index.list_stream_feature_views(project)
         return self._list_objects(
             "STREAM_FEATURE_VIEWS",
             project,
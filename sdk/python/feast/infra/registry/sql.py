@@ -4,7 +4,7 @@ from datetime import datetime, timedelta
 from enum import Enum
 from pathlib import Path
 from threading import Lock
-from typing import Any, Callable, List, Optional, Set, Union
+from typing import Any, Callable, Hashable, List, Optional, Set, Union
 
 from pydantic import StrictStr
 from sqlalchemy import (  # type: ignore
@@ -39,6 +39,10 @@ from feast.feature_view import FeatureView
 from feast.infra.infra_object import Infra
 from feast.infra.registry import proto_registry_utils
 from feast.infra.registry.base_registry import BaseRegistry
+from feast.infra.registry.registry_refresher import (
+    RegistryRefresher,
+    RegistryRefreshMetrics,
+)
 from feast.on_demand_feature_view import OnDemandFeatureView
 from feast.project_metadata import ProjectMetadata
 from feast.protos.feast.core.DataSource_pb2 import DataSource as DataSourceProto
@@ -203,16 +207,31 @@ class SqlRegistry(BaseRegistry):
         metadata.create_all(self.engine)
         self.cached_registry_proto = self.proto()
         proto_registry_utils.init_project_metadata(self.cached_registry_proto, project)
+        self._registry_index = proto_registry_utils.RegistryProtoIndex(
+            self.cached_registry_proto
+        )
         self.cached_registry_proto_created = datetime.utcnow()
         self._refresh_lock = Lock()
+        self._cache_version = 0
         self.cached_registry_proto_ttl = timedelta(
             seconds=registry_config.cache_ttl_seconds
             if registry_config.cache_ttl_seconds is not None
             else 0
         )
         self.project = project
+        self._refresher: Optional[RegistryRefresher] = None
+        if (
+            registry_config.cache_mode == "thread"
+            and self.cached_registry_proto_ttl.total_seconds() > 0
+        ):
+            self._refresher = RegistryRefresher(
+                self, project, self.cached_registry_proto_ttl
+            )
+            self._refresher.start()
 
     def teardown(self):
+        if self._refresher:
+            self._refresher.stop()
         for t in {
             entities,
             data_sources,
@@ -238,10 +257,27 @@ class SqlRegistry(BaseRegistry):
                 proto_registry_utils.init_project_metadata(
                     self.cached_registry_proto, project
                 )
-        self.cached_registry_proto = self.proto()
+        registry_proto = self.proto()
+        self._registry_index = proto_registry_utils.RegistryProtoIndex(registry_proto)
+        self.cached_registry_proto = registry_proto
         self.cached_registry_proto_created = datetime.utcnow()
+        self._cache_version += 1
+
+    def get_cache_version(self, project: str) -> Optional[Hashable]:
+        self._refresh_cached_registry_if_necessary()
+        return self._cache_version
+
+    def get_refresh_metrics(self) -> Optional[RegistryRefreshMetrics]:
+        if not self._refresher:
+            return None
+        return self._refresher.metrics(self.cached_registry_proto_created)
 
     def _refresh_cached_registry_if_necessary(self):
+        if self._refresher:
+            # The cache is kept up to date by the refresher, so the last loaded state is served
+            # without waiting for the lock, however old it is.
+            return
+
         with self._refresh_lock:
             expired = (
                 self.cached_registry_proto is None
@@ -267,9 +303,7 @@ class SqlRegistry(BaseRegistry):
     ):
         if allow_cache:
             self._refresh_cached_registry_if_necessary()
-            return proto_registry_utils.get_stream_feature_view(
-                self.cached_registry_proto, name, project
-            )
+            return self._registry_index.get_stream_feature_view(name, project)
         return self._get_object(
             table=stream_feature_views,
             name=name,
@@ -286,9 +320,7 @@ class SqlRegistry(BaseRegistry):
     ) -> List[StreamFeatureView]:
         if allow_cache:
             self._refresh_cached_registry_if_necessary()
-            return proto_registry_utils.list_stream_feature_views(
-                self.cached_registry_proto, project
-            )
+            return self._registry_index.list_stream_feature_views(project)
         return self._list_objects(
             stream_feature_views,
             project,
@@ -309,9 +341,7 @@ class SqlRegistry(BaseRegistry):
     def get_entity(self, name: str, project: str, allow_cache: bool = False) -> Entity:
         if allow_cache:
             self._refresh_cached_registry_if_necessary()
-            return proto_registry_utils.get_entity(
-                self.cached_registry_proto, name, project
-            )
+            return self._registry_index.get_entity(name, project)
         return self._get_object(
             table=entities,
             name=name,
@@ -328,9 +358,7 @@ class SqlRegistry(BaseRegistry):
     ) -> FeatureView:
         if allow_cache:
             self._refresh_cached_registry_if_necessary()
-            return proto_registry_utils.get_feature_view(
-                self.cached_registry_proto, name, project
-            )
+            return self._registry_index.get_feature_view(name, project)
         return self._get_object(
             table=feature_views,
             name=name,
@@ -347,9 +375,7 @@ class SqlRegistry(BaseRegistry):
     ) -> OnDemandFeatureView:
         if allow_cache:
             self._refresh_cached_registry_if_necessary()
-            return proto_registry_utils.get_on_demand_feature_view(
-                self.cached_registry_proto, name, project
-            )
+            return self._registry_index.get_on_demand_feature_view(name, project)
         return self._get_object(
             table=on_demand_feature_views,
             name=name,
@@ -385,9 +411,7 @@ class SqlRegistry(BaseRegistry):
     ) -> FeatureService:
         if allow_cache:
             self._refresh_cached_registry_if_necessary()
-            return proto_registry_utils.get_feature_service(
-                self.cached_registry_proto, name, project
-            )
+            return self._registry_index.get_feature_service(name, project)
         return self._get_object(
             table=feature_services,
             name=name,
@@ -456,9 +480,7 @@ class SqlRegistry(BaseRegistry):
     def list_entities(self, project: str, allow_cache: bool = False) -> List[Entity]:
         if allow_cache:
             self._refresh_cached_registry_if_necessary()
-            return proto_registry_utils.list_entities(
-                self.cached_registry_proto, project
-            )
+            return self._registry_index.list_entities(project)
         return self._list_objects(
             entities, project, EntityProto, Entity, "entity_proto"
         )
@@ -496,9 +518,7 @@ class SqlRegistry(BaseRegistry):
     ) -> DataSource:
         if allow_cache:
             self._refresh_cached_registry_if_necessary()
-            return proto_registry_utils.get_data_source(
-                self.cached_registry_proto, name, project
-            )
+            return self._registry_index.get_data_source(name, project)
         return self._get_object(
             table=data_sources,
             name=name,
@@ -515,9 +535,7 @@ class SqlRegistry(BaseRegistry):
     ) -> List[DataSource]:
         if allow_cache:
             self._refresh_cached_registry_if_necessary()
-            return proto_registry_utils.list_data_sources(
-                self.cached_registry_proto, project
-            )
+            return self._registry_index.list_data_sources(project)
         return self._list_objects(
             data_sources, project, DataSourceProto, DataSource, "data_source_proto"
         )
@@ -564,9 +582,7 @@ class SqlRegistry(BaseRegistry):
     ) -> List[FeatureService]:
         if allow_cache:
             self._refresh_cached_registry_if_necessary()
-            return proto_registry_utils.list_feature_services(
-                self.cached_registry_proto, project
-            )
+            return self._registry_index.list_feature_services(project)
         return self._list_objects(
             feature_services,
             project,
@@ -580,9 +596,7 @@ class SqlRegistry(BaseRegistry):
     ) -> List[FeatureView]:
         if allow_cache:
             self._refresh_cached_registry_if_necessary()
-            return proto_registry_utils.list_feature_views(
-                self.cached_registry_proto, project
-            )
+            return self._registry_index.list_feature_views(project)
         return self._list_objects(
             feature_views, project, FeatureViewProto, FeatureView, "feature_view_proto"
         )
@@ -608,9 +622,7 @@ class SqlRegistry(BaseRegistry):
     ) -> List[RequestFeatureView]:
         if allow_cache:
             self._refresh_cached_registry_if_necessary()
-            return proto_registry_utils.list_request_feature_views(
-                self.cached_registry_proto, project
-            )
+            return self._registry_index.list_request_feature_views(project)
         return self._list_objects(
             request_feature_views,
             project,
@@ -624,9 +636,7 @@ class SqlRegistry(BaseRegistry):
     ) -> List[OnDemandFeatureView]:
         if allow_cache:
             self._refresh_cached_registry_if_necessary()
-            return proto_registry_utils.list_on_demand_feature_views(
-                self.cached_registry_proto, project
-            )
+            return self._registry_index.list_on_demand_feature_views(project)
         return self._list_objects(
             on_demand_feature_views,
             project,
@@ -8,6 +8,7 @@ from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 import pandas as pd
 import pyarrow
 import pyarrow as pa
+import pyarrow.dataset
 import pyarrow.parquet as pq
 from tenacity import (
     retry,
@@ -569,6 +570,45 @@ def unload_redshift_query_to_pa(
         return pq.read_table(temp_dir)
 
 
+def unload_redshift_query_to_pa_batches(
+    redshift_data_client,
+    cluster_id: str,
+    workgroup: str,
+    database: str,
+    user: str,
+    s3_resource,
+    s3_path: str,
+    iam_role: str,
+    query: str,
+    batch_size: Optional[int] = None,
+) -> Iterator[pa.RecordBatch]:
+    """
+    Unload Redshift Query results to S3 and get the results as PyArrow RecordBatches, which are read
+    from the downloaded Parquet files one at a time
+    """
+    bucket, key = get_bucket_and_key(s3_path)
+
+    execute_redshift_query_and_unload_to_s3(
+        redshift_data_client,
+        cluster_id,
+        workgroup,
+        database,
+        user,
+        s3_path,
+        iam_role,
+        query,
+    )
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        download_s3_directory(s3_resource, bucket, key, temp_dir)
+        delete_s3_directory(s3_resource, bucket, key)
+        dataset = pyarrow.dataset.dataset(temp_dir, format="parquet")
+        if batch_size:
+            yield from dataset.to_batches(batch_size=batch_size)
+        else:
+            yield from dataset.to_batches()
+
+
 def unload_redshift_query_to_df(
     redshift_data_client,
     cluster_id: str,
@@ -5,14 +5,15 @@ import pandas as pd
 import psycopg2
 import psycopg2.extras
 import pyarrow as pa
-from psycopg2.pool import SimpleConnectionPool
+from psycopg2.pool import ThreadedConnectionPool
 
 from feast.infra.utils.postgres.postgres_config import PostgreSQLConfig
 from feast.type_map import arrow_to_pg_type
 
 
-def _get_conn(config: PostgreSQLConfig):
+def _get_conn(config: PostgreSQLConfig, connection_factory=None):
     conn = psycopg2.connect(
+        connection_factory=connection_factory,
         dbname=config.database,
         host=config.host,
         port=int(config.port),
@@ -28,10 +29,63 @@ def _get_conn(config: PostgreSQLConfig):
     return conn
 
 
-def _get_connection_pool(config: PostgreSQLConfig):
-    return SimpleConnectionPool(
+def _get_connection_pool(config: PostgreSQLConfig, connection_factory=None):
+    """
+    Opens a pool of connections which can be shared by several threads. Note that the pool raises an error
+    rather than waiting when all its connections are in use.
+    """
+    return ThreadedConnectionPool(
         config.min_conn,
         config.max_conn,
+        connection_factory=connection_factory,
+        dbname=config.database,
+        host=config.host,
+        port=int(config.port),
+        user=config.user,
+        password=config.password,
+        sslmode=config.sslmode,
+        sslkey=config.sslkey_path,
+        sslcert=config.sslcert_path,
+        sslrootcert=config.sslrootcert_path,
+        options="-c search_path={}".format(config.db_schema or config.user),
+    )
+
+
+async def _get_conn_async(config: PostgreSQLConfig):
+    """Opens an asynchronous psycopg 3 connection, for online stores that read asynchronously."""
+    try:
+        import psycopg
+    except ImportError as e:
+        from feast.errors import FeastExtrasDependencyImportError
+
+        raise FeastExtrasDependencyImportError("postgres", str(e))
+
+    return await psycopg.AsyncConnection.connect(
+        autocommit=True, **_get_conn_async_kwargs(config)
+    )
+
+
+async def _get_connection_pool_async(config: PostgreSQLConfig):
+    """Opens an asynchronous psycopg 3 connection pool, for online stores that read asynchronously."""
+    try:
+        from psycopg_pool import AsyncConnectionPool
+    except ImportError as e:
+        from feast.errors import FeastExtrasDependencyImportError
+
+        raise FeastExtrasDependencyImportError("postgres", str(e))
+
+    pool = AsyncConnectionPool(
+        min_size=config.min_conn,
+        max_size=config.max_conn,
+        kwargs=dict(autocommit=True, **_get_conn_async_kwargs(config)),
+        open=False,
+    )
+    await pool.open()
+    return pool
+
+
+def _get_conn_async_kwargs(config: PostgreSQLConfig) -> Dict:
+    return dict(
         dbname=config.database,
         host=config.host,
         port=int(config.port),
@@ -42,6 +96,7 @@ def _get_connection_pool(config: PostgreSQLConfig):
         sslcert=config.sslcert_path,
         sslrootcert=config.sslrootcert_path,
         options="-c search_path={}".format(config.db_schema or config.user),
+        keepalives_idle=config.keepalives_idle,
     )
 
 
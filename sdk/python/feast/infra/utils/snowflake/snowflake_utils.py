@@ -121,8 +121,10 @@ def assert_snowflake_feature_names(feature_view: FeatureView) -> None:
     return None
 
 
-def execute_snowflake_statement(conn: SnowflakeConnection, query) -> SnowflakeCursor:
-    cursor = conn.cursor().execute(query)
+def execute_snowflake_statement(
+    conn: SnowflakeConnection, query, timeout: Optional[int] = None
+) -> SnowflakeCursor:
+    cursor = conn.cursor().execute(query, timeout=timeout)
     if cursor is None:
         raise SnowflakeQueryUnknownError(query)
     return cursor
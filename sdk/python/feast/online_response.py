@@ -12,13 +12,24 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Sequence
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+from google.protobuf.timestamp_pb2 import Timestamp
 
 from feast.feature_view import DUMMY_ENTITY_ID
 from feast.protos.feast.serving.ServingService_pb2 import GetOnlineFeaturesResponse
-from feast.type_map import feast_value_type_to_python_type
+from feast.protos.feast.types.Value_pb2 import Value
+from feast.type_map import (
+    feast_value_type_to_pa,
+    feast_value_type_to_python_type,
+    pa_to_feast_value_type,
+    python_values_to_proto_values,
+)
+from feast.value_type import ValueType
 
 TIMESTAMP_POSTFIX: str = "__ts"
 
@@ -77,3 +88,209 @@ class OnlineResponse:
         """
 
         return pd.DataFrame(self.to_dict(include_event_timestamps))
+
+
+EVENT_TIMESTAMP_TYPE = pa.timestamp("us", tz="UTC")
+
+
+class ArrowOnlineResponse:
+    """
+    Defines an online response in feast, backed by Arrow columns instead of Protobuf values.
+
+    The values, statuses and event timestamps of the response are held in three record batches with
+    the same columns. Statuses are the integer values of `FieldStatus`, and event timestamps are null
+    for entities that were not found and for entity and request data columns.
+    """
+
+    def __init__(
+        self,
+        values: pa.RecordBatch,
+        statuses: pa.RecordBatch,
+        event_timestamps: pa.RecordBatch,
+    ):
+        """
+        Construct an online response from its Arrow columns.
+
+        Args:
+        values: The value of each feature for each entity row.
+        statuses: The FieldStatus of each value.
+        event_timestamps: The event timestamp of each value.
+        """
+        self.values = values
+        self.statuses = statuses
+        self.event_timestamps = event_timestamps
+        self._proto: Optional[GetOnlineFeaturesResponse] = None
+
+    @classmethod
+    def from_proto(
+        cls, online_response_proto: GetOnlineFeaturesResponse
+    ) -> "ArrowOnlineResponse":
+        """
+        Construct an online response from its protobuf version.
+
+        Args:
+        online_response_proto: GetOnlineResponse proto object to construct from.
+        """
+        names = []
+        values, statuses, event_timestamps = [], [], []
+        for name, feature_vector in zip(
+            online_response_proto.metadata.feature_names.val,
+            online_response_proto.results,
+        ):
+            if name == DUMMY_ENTITY_ID:
+                continue
+            names.append(name)
+            values.append(proto_values_to_arrow(feature_vector.values))
+            statuses.append(pa.array(feature_vector.statuses, type=pa.int32()))
+            event_timestamps.append(
+                pa.array(
+                    [
+                        ts.ToDatetime() if ts.seconds or ts.nanos else None
+                        for ts in feature_vector.event_timestamps
+                    ],
+                    type=EVENT_TIMESTAMP_TYPE,
+                )
+            )
+        response = cls(
+            pa.RecordBatch.from_arrays(values, names=names),
+            pa.RecordBatch.from_arrays(statuses, names=names),
+            pa.RecordBatch.from_arrays(event_timestamps, names=names),
+        )
+        response._proto = online_response_proto
+        return response
+
+    @property
+    def proto(self) -> GetOnlineFeaturesResponse:
+        """The protobuf version of this response, which is only built when it is first needed."""
+        if self._proto is None:
+            self._proto = self._to_proto()
+        return self._proto
+
+    def _to_proto(self) -> GetOnlineFeaturesResponse:
+        response = GetOnlineFeaturesResponse(results=[])
+        for name, values, statuses, event_timestamps in zip(
+            self.values.schema.names,
+            self.values.columns,
+            self.statuses.columns,
+            self.event_timestamps.columns,
+        ):
+            response.metadata.feature_names.val.append(name)
+            timestamps = []
+            for micros in event_timestamps.cast(pa.int64()).to_pylist():
+                timestamp = Timestamp()
+                if micros is not None:
+                    timestamp.FromMicroseconds(micros)
+                timestamps.append(timestamp)
+            response.results.append(
+                GetOnlineFeaturesResponse.FeatureVector(
+                    values=arrow_to_proto_values(values),
+                    statuses=statuses.to_pylist(),
+                    event_timestamps=timestamps,
+                )
+            )
+        return response
+
+    def to_arrow(self, include_event_timestamps: bool = False) -> pa.RecordBatch:
+        """
+        Returns the feature values as an Arrow record batch.
+
+        Args:
+        include_event_timestamps: bool Optionally include feature timestamps as additional columns
+        """
+        if not include_event_timestamps:
+            return self.values
+
+        arrays, names = [], []
+        for name, values, event_timestamps in zip(
+            self.values.schema.names, self.values.columns, self.event_timestamps.columns
+        ):
+            arrays.extend([values, event_timestamps])
+            names.extend([name, name + TIMESTAMP_POSTFIX])
+        return pa.RecordBatch.from_arrays(arrays, names=names)
+
+    def to_numpy(self) -> Dict[str, np.ndarray]:
+        """
+        Converts the feature values into NumPy arrays, without copying them where Arrow allows it.
+        """
+        return {
+            name: values.to_numpy(zero_copy_only=False)
+            for name, values in zip(self.values.schema.names, self.values.columns)
+        }
+
+    def to_dict(self, include_event_timestamps: bool = False) -> Dict[str, Any]:
+        """
+        Converts the features into a dictionary form, in the same format as `OnlineResponse.to_dict`.
+
+        Args:
+        include_event_timestamps: bool Optionally include feature timestamps in the dictionary
+        """
+        response: Dict[str, List[Any]] = {}
+
+        for name, values, event_timestamps in zip(
+            self.values.schema.names, self.values.columns, self.event_timestamps.columns
+        ):
+            response[name] = values.to_pylist()
+
+            if include_event_timestamps:
+                seconds = pc.divide(event_timestamps.cast(pa.int64()), 1_000_000)
+                response[name + TIMESTAMP_POSTFIX] = pc.fill_null(
+                    seconds, 0
+                ).to_pylist()
+
+        return response
+
+    def to_df(self, include_event_timestamps: bool = False) -> pd.DataFrame:
+        """
+        Converts the features into Panda dataframe form.
+
+        Args:
+        include_event_timestamps: bool Optionally include feature timestamps in the dataframe
+        """
+        return self.to_arrow(include_event_timestamps).to_pandas()
+
+
+def proto_values_to_arrow(
+    values: Sequence[Optional[Value]], value_type: ValueType = ValueType.UNKNOWN
+) -> pa.Array:
+    """
+    Converts Protobuf values, or None for missing values, into an Arrow array.
+
+    The type of the array follows the type of the stored values, and only falls back to `value_type`
+    if all of them are missing.
+    """
+    python_values: List[Any] = []
+    stored_type = None
+    for value in values:
+        if value is None:
+            python_values.append(None)
+            continue
+        if stored_type is None:
+            val_attr = value.WhichOneof("val")
+            if val_attr is not None:
+                stored_type = ValueType[val_attr[: -len("_val")].upper()]
+        python_values.append(feast_value_type_to_python_type(value))
+    if stored_type is not None:
+        value_type = stored_type
+
+    if value_type == ValueType.UNIX_TIMESTAMP:
+        pa_type = EVENT_TIMESTAMP_TYPE
+    elif value_type == ValueType.UNIX_TIMESTAMP_LIST:
+        pa_type = pa.list_(EVENT_TIMESTAMP_TYPE)
+    else:
+        try:
+            pa_type = feast_value_type_to_pa(value_type)
+        except KeyError:
+            pa_type = None
+    return pa.array(python_values, type=pa_type)
+
+
+def arrow_to_proto_values(values: pa.Array) -> List[Value]:
+    """Converts an Arrow array into Protobuf values, with an empty value for each null."""
+    if values.null_count == len(values):
+        return [Value() for _ in range(len(values))]
+
+    try:
+        value_type = pa_to_feast_value_type(str(values.type))
+    except KeyError:
+        value_type = ValueType.UNKNOWN
+    return python_values_to_proto_values(values.to_pylist(), value_type)
@@ -1,6 +1,7 @@
 import logging
 import os
 import warnings
+from datetime import timedelta
 from pathlib import Path
 from typing import Any
 
@@ -15,7 +16,7 @@ from pydantic import (
     validator,
 )
 from pydantic.error_wrappers import ErrorWrapper
-from pydantic.typing import Dict, Optional
+from pydantic.typing import Dict, Literal, Optional
 
 from feast.errors import (
     FeastFeatureServerTypeInvalidError,
@@ -126,6 +127,12 @@ class RegistryConfig(FeastBaseModel):
      set to infinity by setting TTL to 0 seconds, which means the cache will only be loaded once and will never
      expire. Users can manually refresh the cache by calling feature_store.refresh_registry() """
 
+    cache_mode: Literal["sync", "thread"] = "sync"
+    """ str: How the registry cache is refreshed once cache_ttl_seconds has passed. With "sync", the first request
+     after expiry refreshes the cache while other requests wait for it. With "thread", a background thread refreshes
+     the cache every cache_ttl_seconds and requests keep being served from the last successfully loaded registry
+     state, without waiting for refreshes or failing when they fail. """
+
     s3_additional_kwargs: Optional[Dict[str, str]]
     """ Dict[str, str]: Extra arguments to pass to boto3 when writing the registry file to S3. """
 
@@ -178,9 +185,38 @@ class RepoConfig(FeastBaseModel):
     feature values for entities that have already been written into the online store.
     """
 
+    entity_key_cache_size: StrictInt = 0
+    """ int: Maximum number of serialized entity keys memoized in the LRU cache kept by each online store instance
+    reading entity keys with an `EntityKeyCache` (SQLite, Redis, PostgreSQL and MySQL). Worth enabling when a small
+    set of hot entities is read over and over. The default of 0 disables the cache. """
+
     coerce_tz_aware: Optional[bool] = True
     """ If True, coerces entity_df timestamp columns to be timezone aware (to UTC by default). """
 
+    online_retrieval_plan_cache_size: StrictInt = 128
+    """ int: Maximum number of compiled online retrieval plans kept in memory. A plan is compiled once per distinct
+    feature list (or feature service) and `full_feature_names` flag, and is discarded whenever the registry cache is
+    refreshed. Setting this to 0 disables plan caching, so every online retrieval re-reads the registry. """
+
+    online_read_concurrency: StrictInt = 1
+    """ int: Maximum number of feature views read concurrently from the online store by `get_online_features`, using
+    a thread pool owned by the FeatureStore. Results are merged in the order of the requested features, so latency
+    tracks the slowest feature view rather than the sum of all of them. The default of 1 hands all the feature views
+    to the online store at once, which reads them in a single round trip when it supports it (e.g. Redis) and
+    sequentially otherwise; only raise it with online stores whose clients are thread-safe.
+    `get_online_features_async` always reads feature views concurrently. """
+
+    materialization_chunk_size: Optional[timedelta] = None
+    """ timedelta: If set, `materialize_incremental` splits the interval materialized for each feature view into
+    consecutive chunks of at most this duration (e.g. `86400` or `P1D` for one day), and records each chunk in the
+    registry once it has been written. An interrupted run then resumes from the last chunk recorded rather than from
+    the start of the interval. By default the whole interval is materialized at once. """
+
+    materialization_chunk_concurrency: StrictInt = 1
+    """ int: Maximum number of chunks of `materialization_chunk_size` materialized concurrently. Chunks are still
+    recorded in the registry in order. Since a chunk may then be written before an earlier one, only raise it with
+    online stores that keep the most recent value of a feature regardless of the order of the writes. """
+
     def __init__(self, **data: Any):
         super().__init__(**data)
 
@@ -438,6 +474,18 @@ class RepoConfig(FeastBaseModel):
             )
         return v
 
+    @validator("materialization_chunk_size")
+    def _validate_materialization_chunk_size(cls, v):
+        if v is not None and v <= timedelta(0):
+            raise ValueError("materialization_chunk_size must be a positive duration.")
+        return v
+
+    @validator("materialization_chunk_concurrency")
+    def _validate_materialization_chunk_concurrency(cls, v):
+        if v < 1:
+            raise ValueError("materialization_chunk_concurrency must be at least 1.")
+        return v
+
     @validator("flags")
     def _validate_flags(cls, v):
         if not isinstance(v, Dict):
@@ -308,7 +308,7 @@ def _python_datetime_to_int_timestamp(
     values: Sequence[Any],
 ) -> Sequence[Union[int, np.int_]]:
     # Fast path for Numpy array.
-    if isinstance(values, np.ndarray) and isinstance(values.dtype, np.datetime64):
+    if isinstance(values, np.ndarray) and np.issubdtype(values.dtype, np.datetime64):
         if values.ndim != 1:
             raise ValueError("Only 1 dimensional arrays are supported.")
         return cast(Sequence[np.int_], values.astype("datetime64[s]").astype(np.int_))
@@ -387,6 +387,11 @@ def _python_value_to_proto_value(
 
     # Handle scalar types below
     else:
+        if isinstance(values, np.ndarray):
+            proto_values = _numpy_values_to_proto_values(feast_value_type, values)
+            if proto_values is not None:
+                return proto_values
+
         if sample is None:
             # all input values are None
             return [ProtoValue()] * len(values)
@@ -438,6 +443,63 @@ def _python_value_to_proto_value(
     raise Exception(f"Unsupported data type: ${str(type(values[0]))}")
 
 
+# Kinds of the NumPy dtypes converted in bulk to each scalar type: (b)ool, (i)nt, (u)nsigned int and (f)loat.
+_NUMPY_KINDS_FOR_SCALAR_VALUE_TYPE: Dict[ValueType, Tuple[str, str]] = {
+    ValueType.INT32: ("int32_val", "biuf"),
+    ValueType.INT64: ("int64_val", "biuf"),
+    ValueType.FLOAT: ("float_val", "biuf"),
+    ValueType.DOUBLE: ("double_val", "f"),
+    ValueType.BOOL: ("bool_val", "b"),
+}
+
+
+def _numpy_values_to_proto_values(
+    feast_value_type: ValueType, values: np.ndarray
+) -> Optional[List[ProtoValue]]:
+    """
+    Converts a one-dimensional numeric NumPy array to Feast Proto Values in bulk, with an empty value for each NaN.
+
+    Returns None if the array must be converted value by value instead, e.g. for object arrays, or for the
+    dtypes rejected by the type checks of `_python_value_to_proto_value`.
+    """
+    if values.ndim != 1 or len(values) == 0:
+        return None
+
+    if feast_value_type == ValueType.UNIX_TIMESTAMP:
+        if not np.issubdtype(values.dtype, np.datetime64):
+            return None
+        return [
+            ProtoValue(unix_timestamp_val=ts)
+            for ts in _python_datetime_to_int_timestamp(values).tolist()  # type: ignore
+        ]
+
+    if feast_value_type not in _NUMPY_KINDS_FOR_SCALAR_VALUE_TYPE:
+        return None
+    field_name, kinds = _NUMPY_KINDS_FOR_SCALAR_VALUE_TYPE[feast_value_type]
+    if values.dtype.kind not in kinds or (
+        feast_value_type == ValueType.DOUBLE and values.dtype != np.float64
+    ):
+        return None
+
+    is_null = None
+    if values.dtype.kind == "f":
+        is_null = np.isnan(values)
+        if feast_value_type in (ValueType.INT32, ValueType.INT64):
+            if not np.isfinite(values[~is_null]).all():
+                return None
+            values = np.where(is_null, 0, values).astype(np.int64)
+    elif values.dtype.kind == "u" and values.dtype.itemsize == 8:
+        # Values above the int64 range are rejected value by value.
+        return None
+
+    # Converting to Python scalars first is much faster than passing NumPy scalars to the constructor.
+    proto_values = [ProtoValue(**{field_name: value}) for value in values.tolist()]
+    if is_null is not None:
+        for idx in np.flatnonzero(is_null).tolist():
+            proto_values[idx] = ProtoValue()
+    return proto_values
+
+
 def python_values_to_proto_values(
     values: List[Any], feature_type: ValueType = ValueType.UNKNOWN
 ) -> List[ProtoValue]:
@@ -459,6 +521,147 @@ def python_values_to_proto_values(
     return _python_value_to_proto_value(value_type, values)
 
 
+def arrow_to_serialized_proto_values(
+    array: "pyarrow.Array", feature_type: ValueType
+) -> List[bytes]:
+    """
+    Converts an Arrow array to serialized Feast Proto Values, byte-identical to serializing the
+    result of `python_values_to_proto_values` for the array.
+
+    Scalar values are encoded straight from the Arrow buffers, in bulk. Other types are converted
+    through `python_values_to_proto_values`.
+    """
+    import pyarrow as pa
+
+    if isinstance(array, pa.ChunkedArray):
+        array = array.combine_chunks()
+
+    serialized = _arrow_scalars_to_serialized_proto_values(array, feature_type)
+    if serialized is None:
+        return [
+            value.SerializeToString()
+            for value in python_values_to_proto_values(
+                array.to_numpy(zero_copy_only=False), feature_type
+            )
+        ]
+    return serialized
+
+
+# Tags of the fields of the `val` oneof of Value, combining the field number and the wire type.
+_BYTES_VAL_TAG = 0x0A
+_STRING_VAL_TAG = 0x12
+_INT32_VAL_TAG = 0x18
+_INT64_VAL_TAG = 0x20
+_DOUBLE_VAL_TAG = 0x29
+_FLOAT_VAL_TAG = 0x35
+_BOOL_VAL_TAG = 0x38
+_UNIX_TIMESTAMP_VAL_TAG = 0x40
+
+_INT32_MIN = np.iinfo(np.int32).min
+_INT32_MAX = np.iinfo(np.int32).max
+
+
+def _arrow_scalars_to_serialized_proto_values(
+    array: "pyarrow.Array", feature_type: ValueType
+) -> Optional[List[bytes]]:
+    """Returns None if the array can't be encoded in bulk as values of the given type."""
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    if len(array) == 0:
+        return []
+
+    arrow_type = array.type
+    is_null = array.is_null().to_numpy(zero_copy_only=False)
+    serialized: List[bytes]
+    if feature_type in (ValueType.INT32, ValueType.INT64) and pa.types.is_integer(
+        arrow_type
+    ):
+        if pa.types.is_uint64(arrow_type):
+            return None
+        values = array.fill_null(0).to_numpy().astype(np.int64)
+        if feature_type == ValueType.INT32:
+            if values.min() < _INT32_MIN or values.max() > _INT32_MAX:
+                return None
+            serialized = _serialize_varints(_INT32_VAL_TAG, values)
+        else:
+            serialized = _serialize_varints(_INT64_VAL_TAG, values)
+    elif feature_type == ValueType.DOUBLE and pa.types.is_float64(arrow_type):
+        values = array.fill_null(0).to_numpy()
+        is_null |= np.isnan(values)
+        serialized = _serialize_fixed(_DOUBLE_VAL_TAG, values.astype("<f8"))
+    elif feature_type == ValueType.FLOAT and pa.types.is_floating(arrow_type):
+        values = array.fill_null(0).to_numpy()
+        is_null |= np.isnan(values)
+        serialized = _serialize_fixed(_FLOAT_VAL_TAG, values.astype("<f4"))
+    elif feature_type == ValueType.BOOL and pa.types.is_boolean(arrow_type):
+        bool_values = (bytes([_BOOL_VAL_TAG, 0]), bytes([_BOOL_VAL_TAG, 1]))
+        serialized = [
+            bool_values[value]
+            for value in array.fill_null(False).to_numpy(zero_copy_only=False).tolist()
+        ]
+    elif (
+        feature_type == ValueType.STRING
+        and (pa.types.is_string(arrow_type) or pa.types.is_large_string(arrow_type))
+    ) or (
+        feature_type == ValueType.BYTES
+        and (pa.types.is_binary(arrow_type) or pa.types.is_large_binary(arrow_type))
+    ):
+        tag = _STRING_VAL_TAG if feature_type == ValueType.STRING else _BYTES_VAL_TAG
+        values = array.cast(pa.large_binary()).fill_null(b"")
+        headers = _serialize_varints(
+            tag, pc.binary_length(values).to_numpy().astype(np.int64)
+        )
+        serialized = [
+            header + value for header, value in zip(headers, values.to_pylist())
+        ]
+    elif feature_type == ValueType.UNIX_TIMESTAMP and pa.types.is_timestamp(arrow_type):
+        if is_null.any():
+            return None
+        units_per_second = {"s": 1, "ms": 10**3, "us": 10**6, "ns": 10**9}[
+            arrow_type.unit
+        ]
+        seconds = np.floor_divide(array.cast(pa.int64()).to_numpy(), units_per_second)
+        serialized = _serialize_varints(_UNIX_TIMESTAMP_VAL_TAG, seconds)
+    else:
+        return None
+
+    # Null values are serialized as an empty Value.
+    for idx in np.flatnonzero(is_null).tolist():
+        serialized[idx] = b""
+    return serialized
+
+
+def _serialize_varints(tag: int, values: np.ndarray) -> List[bytes]:
+    """Serializes int64 values as a tag followed by their varint encoding."""
+    remaining = values.astype(np.int64).view(np.uint64)
+    # A tag byte followed by up to 10 varint bytes for each value.
+    encoded = np.zeros((len(values), 11), dtype=np.uint8)
+    encoded[:, 0] = tag
+    lengths = np.full(len(values), 2, dtype=np.int64)
+    for i in range(1, 11):
+        encoded[:, i] = (remaining & np.uint64(0x7F)).astype(np.uint8)
+        remaining = remaining >> np.uint64(7)
+        has_more = remaining != 0
+        encoded[has_more, i] |= 0x80
+        lengths += has_more
+    data = encoded[np.arange(11) < lengths[:, None]].tobytes()
+    offsets = np.concatenate(([0], np.cumsum(lengths))).tolist()
+    return [data[start:end] for start, end in zip(offsets[:-1], offsets[1:])]
+
+
+def _serialize_fixed(tag: int, values: np.ndarray) -> List[bytes]:
+    """Serializes fixed-width values as a tag followed by their little-endian encoding."""
+    encoded = np.empty(
+        len(values), dtype=np.dtype([("tag", np.uint8), ("value", values.dtype)])
+    )
+    encoded["tag"] = tag
+    encoded["value"] = values
+    data = encoded.tobytes()
+    width = encoded.dtype.itemsize
+    return [data[start : start + width] for start in range(0, len(data), width)]
+
+
 def _proto_value_to_value_type(proto_value: ProtoValue) -> ValueType:
     """
     Returns Feast ValueType given Feast ValueType string.
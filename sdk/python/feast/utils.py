@@ -1,10 +1,12 @@
+import itertools
 import os
 import typing
 from collections import defaultdict
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Dict, List, Optional, Tuple, TypeVar, Union, cast
 
+import numpy as np
 import pandas as pd
 import pyarrow
 from dask import dataframe as dd
@@ -13,9 +15,17 @@ from pytz import utc
 
 from feast.constants import FEAST_FS_YAML_FILE_PATH_ENV_NAME
 from feast.entity import Entity
+from feast.infra.key_encoding_utils import (
+    deserialize_entity_key,
+    serialize_entity_key,
+    serialize_entity_keys_bulk,
+)
 from feast.protos.feast.types.EntityKey_pb2 import EntityKey as EntityKeyProto
 from feast.protos.feast.types.Value_pb2 import Value as ValueProto
-from feast.type_map import python_values_to_proto_values
+from feast.type_map import (
+    arrow_to_serialized_proto_values,
+    python_values_to_proto_values,
+)
 from feast.value_type import ValueType
 
 if typing.TYPE_CHECKING:
@@ -23,6 +33,9 @@ if typing.TYPE_CHECKING:
     from feast.on_demand_feature_view import OnDemandFeatureView
 
 
+ArrowTableOrBatch = TypeVar("ArrowTableOrBatch", pyarrow.Table, pyarrow.RecordBatch)
+
+
 def make_tzaware(t: datetime) -> datetime:
     """We assume tz-naive datetimes are UTC"""
     if t.tzinfo is None:
@@ -162,16 +175,17 @@ def _get_column_names(
 
 
 def _run_pyarrow_field_mapping(
-    table: pyarrow.Table,
+    table: ArrowTableOrBatch,
     field_mapping: Dict[str, str],
-) -> pyarrow.Table:
+) -> ArrowTableOrBatch:
     # run field mapping in the forward direction
-    cols = table.column_names
+    cols = table.schema.names
     mapped_cols = [
         field_mapping[col] if col in field_mapping.keys() else col for col in cols
     ]
-    table = table.rename_columns(mapped_cols)
-    return table
+    if isinstance(table, pyarrow.RecordBatch):
+        return pyarrow.RecordBatch.from_arrays(table.columns, names=mapped_cols)
+    return table.rename_columns(mapped_cols)
 
 
 def _run_dask_field_mapping(
@@ -210,53 +224,239 @@ def _convert_arrow_to_proto(
     if isinstance(table, pyarrow.Table):
         table = table.to_batches()[0]
 
-    columns = [
-        (field.name, field.dtype.to_value_type()) for field in feature_view.features
-    ] + list(join_keys.items())
-
     proto_values_by_column = {
-        column: python_values_to_proto_values(
-            table.column(column).to_numpy(zero_copy_only=False), value_type
+        feature.name: python_values_to_proto_values(
+            table.column(feature.name).to_numpy(zero_copy_only=False),
+            feature.dtype.to_value_type(),
         )
-        for column, value_type in columns
+        for feature in feature_view.features
     }
 
-    entity_keys = [
-        EntityKeyProto(
-            join_keys=join_keys,
-            entity_values=[proto_values_by_column[k][idx] for k in join_keys],
+    # Serialize the features per row
+    features = [
+        dict(zip(proto_values_by_column, vars))
+        for vars in zip(*proto_values_by_column.values())
+    ]
+
+    return list(
+        zip(
+            _convert_arrow_to_entity_keys(table, join_keys),
+            features,
+            *_convert_arrow_to_timestamps(table, feature_view),
         )
-        for idx in range(table.num_rows)
+    )
+
+
+# Schema of the record batches written by `OnlineStore.online_write_batch_serialized`.
+SERIALIZED_ROWS_SCHEMA = pyarrow.schema(
+    [
+        ("entity_key", pyarrow.binary()),
+        ("feature_name", pyarrow.string()),
+        ("value", pyarrow.binary()),
+        ("event_ts", pyarrow.timestamp("us")),
+        ("created_ts", pyarrow.timestamp("us")),
     ]
+)
 
-    # Serialize the features per row
-    feature_dict = {
-        feature.name: proto_values_by_column[feature.name]
+
+def _convert_arrow_to_serialized_rows(
+    table: Union[pyarrow.Table, pyarrow.RecordBatch],
+    feature_view: "FeatureView",
+    join_keys: Dict[str, ValueType],
+    entity_key_serialization_version: int,
+) -> pyarrow.RecordBatch:
+    """
+    Converts a batch of feature rows to the record batch of serialized feature values expected by
+    `OnlineStore.online_write_batch_serialized`, with one row per entity key and feature.
+    """
+    if isinstance(table, pyarrow.Table):
+        # All the chunks of the table are converted, as a single record batch.
+        batches = table.combine_chunks().to_batches()
+        table = (
+            batches[0] if batches else pyarrow.RecordBatch.from_pylist([], table.schema)
+        )
+
+    entity_key_bins = _convert_arrow_to_serialized_entity_keys(
+        table, join_keys, entity_key_serialization_version
+    )
+    feature_names = [feature.name for feature in feature_view.features]
+    serialized_values_by_column = [
+        arrow_to_serialized_proto_values(
+            table.column(feature.name), feature.dtype.to_value_type()
+        )
         for feature in feature_view.features
-    }
-    features = [dict(zip(feature_dict, vars)) for vars in zip(*feature_dict.values())]
+    ]
 
-    # Convert event_timestamps
-    event_timestamps = [
-        _coerce_datetime(val)
-        for val in pd.to_datetime(
-            table.column(feature_view.batch_source.timestamp_field).to_numpy(
-                zero_copy_only=False
+    # The features of each entity row are laid out next to each other.
+    row_indices = pyarrow.array(
+        np.repeat(np.arange(table.num_rows), len(feature_names))
+    )
+    event_timestamps = _arrow_to_utc_timestamps(
+        table.column(feature_view.batch_source.timestamp_field)
+    )
+    if feature_view.batch_source.created_timestamp_column:
+        created_timestamps = _arrow_to_utc_timestamps(
+            table.column(feature_view.batch_source.created_timestamp_column)
+        )
+    else:
+        created_timestamps = pyarrow.nulls(table.num_rows, pyarrow.timestamp("us"))
+
+    return pyarrow.RecordBatch.from_arrays(
+        [
+            pyarrow.array(entity_key_bins, pyarrow.binary()).take(row_indices),
+            pyarrow.array(feature_names * table.num_rows, pyarrow.string()),
+            pyarrow.array(
+                list(itertools.chain.from_iterable(zip(*serialized_values_by_column))),
+                pyarrow.binary(),
+            ),
+            event_timestamps.take(row_indices),
+            created_timestamps.take(row_indices),
+        ],
+        schema=SERIALIZED_ROWS_SCHEMA,
+    )
+
+
+def _convert_serialized_rows_to_proto(
+    data: pyarrow.RecordBatch, feature_view: "FeatureView"
+) -> List[Tuple[EntityKeyProto, Dict[str, ValueProto], datetime, Optional[datetime]]]:
+    """
+    Converts a record batch of serialized feature values, built by `_convert_arrow_to_serialized_rows`,
+    back to the feature rows written by `OnlineStore.online_write_batch`. The consecutive values of the
+    same entity key and timestamps make up a row.
+    """
+    join_keys = [entity.name for entity in feature_view.entity_columns]
+    rows = []
+    for (entity_key_bin, event_ts, created_ts), values in itertools.groupby(
+        zip(
+            data.column("entity_key").to_pylist(),
+            data.column("event_ts").to_pylist(),
+            data.column("created_ts").to_pylist(),
+            data.column("feature_name").to_pylist(),
+            data.column("value").to_pylist(),
+        ),
+        key=lambda row: row[:3],
+    ):
+        rows.append(
+            (
+                deserialize_entity_key(entity_key_bin, join_keys),
+                {
+                    feature_name: ValueProto.FromString(value)
+                    for _, _, _, feature_name, value in values
+                },
+                event_ts,
+                created_ts,
             )
         )
+    return rows
+
+
+def _convert_arrow_to_serialized_entity_keys(
+    table: pyarrow.RecordBatch,
+    join_keys: Dict[str, ValueType],
+    entity_key_serialization_version: int,
+) -> List[bytes]:
+    columns = [
+        _arrow_to_entity_key_column(table.column(join_key), value_type)
+        for join_key, value_type in join_keys.items()
+    ]
+    if all(column is not None for column in columns):
+        return serialize_entity_keys_bulk(
+            list(join_keys),
+            cast(List[np.ndarray], columns),
+            entity_key_serialization_version=entity_key_serialization_version,
+        )
+    return [
+        serialize_entity_key(
+            entity_key,
+            entity_key_serialization_version=entity_key_serialization_version,
+        )
+        for entity_key in _convert_arrow_to_entity_keys(table, join_keys)
+    ]
+
+
+def _arrow_to_entity_key_column(
+    column: pyarrow.Array, value_type: ValueType
+) -> Optional[np.ndarray]:
+    """
+    Returns the values of a join key column in the form expected by `serialize_entity_keys_bulk`, or None
+    if they must be converted to Value protos first.
+    """
+    if column.null_count:
+        return None
+    arrow_type = column.type
+    if value_type in (ValueType.INT32, ValueType.INT64) and pyarrow.types.is_integer(
+        arrow_type
+    ):
+        # Arrow casts are checked, so values out of range raise like they do in proto conversion.
+        return column.cast(
+            pyarrow.int32() if value_type == ValueType.INT32 else pyarrow.int64()
+        ).to_numpy()
+    if (
+        value_type == ValueType.STRING
+        and (
+            pyarrow.types.is_string(arrow_type)
+            or pyarrow.types.is_large_string(arrow_type)
+        )
+    ) or (
+        value_type == ValueType.BYTES
+        and (
+            pyarrow.types.is_binary(arrow_type)
+            or pyarrow.types.is_large_binary(arrow_type)
+        )
+    ):
+        return column.to_numpy(zero_copy_only=False)
+    return None
+
+
+def _convert_arrow_to_entity_keys(
+    table: pyarrow.RecordBatch, join_keys: Dict[str, ValueType]
+) -> List[EntityKeyProto]:
+    proto_values_by_join_key = [
+        python_values_to_proto_values(
+            table.column(join_key).to_numpy(zero_copy_only=False), value_type
+        )
+        for join_key, value_type in join_keys.items()
     ]
+    join_key_names = list(join_keys)
+    return [
+        EntityKeyProto(join_keys=join_key_names, entity_values=entity_values)
+        for entity_values in zip(*proto_values_by_join_key)
+    ]
+
 
-    # Convert created_timestamps if they exist
+def _convert_arrow_to_timestamps(
+    table: pyarrow.RecordBatch, feature_view: "FeatureView"
+) -> Tuple[List[datetime], List[Optional[datetime]]]:
+    """Returns the event and created timestamps of the rows, as naive UTC datetimes."""
+    event_timestamps = _arrow_to_datetimes(
+        table.column(feature_view.batch_source.timestamp_field)
+    )
+    created_timestamps: List[Optional[datetime]] = [None] * table.num_rows
     if feature_view.batch_source.created_timestamp_column:
-        created_timestamps = [
-            _coerce_datetime(val)
-            for val in pd.to_datetime(
-                table.column(
-                    feature_view.batch_source.created_timestamp_column
-                ).to_numpy(zero_copy_only=False)
+        created_timestamps = list(
+            _arrow_to_datetimes(
+                table.column(feature_view.batch_source.created_timestamp_column)
             )
-        ]
-    else:
-        created_timestamps = [None] * table.num_rows
+        )
+    return event_timestamps, created_timestamps
+
+
+def _arrow_to_utc_timestamps(array: pyarrow.Array) -> pyarrow.Array:
+    """Returns the timestamps as a tz-naive UTC array with a microsecond resolution."""
+    if pyarrow.types.is_timestamp(array.type):
+        return array.cast(pyarrow.timestamp("us"), safe=False)
+    return pyarrow.array(_arrow_to_datetimes(array), pyarrow.timestamp("us"))
 
-    return list(zip(entity_keys, features, event_timestamps, created_timestamps))
+
+def _arrow_to_datetimes(array: pyarrow.Array) -> List[datetime]:
+    if pyarrow.types.is_timestamp(array.type) and array.null_count == 0:
+        # Casting to microseconds without a time zone keeps the UTC instants, and truncates
+        # nanoseconds like `pd.Timestamp.to_pydatetime` does.
+        return array.cast(pyarrow.timestamp("us"), safe=False).to_pylist()
+    # Time zone aware values are converted to UTC, so both paths return naive UTC datetimes.
+    return [
+        _coerce_datetime(val)
+        for val in pd.to_datetime(
+            array.to_numpy(zero_copy_only=False), utc=True
+        ).tz_convert(None)
+    ]
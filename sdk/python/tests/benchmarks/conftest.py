@@ -0,0 +1,30 @@
+from typing import Dict, List, Tuple
+
+import pytest
+
+stage_breakdowns_key = pytest.StashKey[List[Tuple[str, Dict[str, float]]]]()
+
+
+@pytest.fixture
+def stage_breakdowns(request) -> List[Tuple[str, Dict[str, float]]]:
+    """Collects the mean time per stage of benchmarks, to be summarized at the end of the run."""
+    return request.config.stash.setdefault(stage_breakdowns_key, [])
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    breakdowns = config.stash.get(stage_breakdowns_key, [])
+    if not breakdowns:
+        return
+
+    terminalreporter.section("stage breakdown (mean ms per call)")
+    stages = list(breakdowns[0][1])
+    name_width = max(len(name) for name, _ in breakdowns)
+    terminalreporter.write_line(
+        " ".join([f"{'benchmark':<{name_width}}", *(f"{s:>18}" for s in stages)])
+    )
+    for name, stages_ms in breakdowns:
+        terminalreporter.write_line(
+            " ".join(
+                [f"{name:<{name_width}}", *(f"{stages_ms[s]:>18.3f}" for s in stages)]
+            )
+        )
@@ -0,0 +1,210 @@
+"""
+Offline benchmarks of online feature retrieval, with a breakdown of the time spent in each stage.
+
+These benchmarks run against a local SQLite online store and an in-memory fake of Redis, so they need no
+external infrastructure:
+
+    FEAST_USAGE=False IS_TEST=True python -m pytest --benchmark sdk/python/tests/benchmarks/test_benchmark_online_retrieval_stages.py
+
+The mean time per request spent in each stage is stored in the `extra_info` of every benchmark, and is
+summarized at the end of the run by the conftest of this directory.
+"""
+import functools
+import inspect
+import itertools
+import time
+from collections import defaultdict
+from datetime import datetime
+from typing import Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import feast.feature_store
+from feast import FeatureStore, Field
+from feast.on_demand_feature_view import on_demand_feature_view
+from feast.types import Float64
+from tests.utils.local_feature_store import LocalFeatureView, build_local_feature_store
+
+ONLINE_STORES = ["sqlite", "redis"]
+ENTITY_COUNTS = [1, 100, 1000]
+FEATURE_VIEW_COUNTS = [1, 8]
+FEATURE_COUNTS = [10, 100]
+
+STAGES = [
+    "planning",
+    "entity preparation",
+    "proto conversion",
+    "store read",
+    "response assembly",
+    "odfv transforms",
+]
+
+
+class StageTimer:
+    """
+    Accumulates the exclusive time spent in instrumented functions, by stage. Time spent in a
+    nested instrumented function is only attributed to the innermost stage.
+    """
+
+    def __init__(self):
+        self.totals: Dict[str, float] = defaultdict(float)
+        self._stack: List[List[float]] = []
+
+    def wrap(self, stage: str, func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            # Each frame holds its start time and the time spent in nested stages.
+            frame = [time.perf_counter(), 0.0]
+            self._stack.append(frame)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self._stack.pop()
+                elapsed = time.perf_counter() - frame[0]
+                self.totals[stage] += elapsed - frame[1]
+                if self._stack:
+                    self._stack[-1][1] += elapsed
+
+        return wrapper
+
+
+def _instrument(monkeypatch, store: FeatureStore, timer: StageTimer):
+    for stage, owner, name in [
+        ("planning", FeatureStore, "_get_online_retrieval_plan"),
+        ("entity preparation", FeatureStore, "_prepare_online_request"),
+        ("proto conversion", FeatureStore, "_read_rows_to_protos"),
+        ("proto conversion", feast.feature_store, "python_values_to_proto_values"),
+        ("response assembly", FeatureStore, "_complete_online_request"),
+        (
+            "odfv transforms",
+            FeatureStore,
+            "_augment_response_with_on_demand_transforms",
+        ),
+    ]:
+        wrapper = timer.wrap(stage, getattr(owner, name))
+        if isinstance(inspect.getattr_static(owner, name), staticmethod):
+            wrapper = staticmethod(wrapper)
+        monkeypatch.setattr(owner, name, wrapper)
+
+    provider = store._get_provider()
+    for name in ("online_read", "online_read_many"):
+        monkeypatch.setattr(
+            provider, name, timer.wrap("store read", getattr(provider, name))
+        )
+
+
+def _build_store(
+    tmp_path,
+    online_store: str,
+    feature_view_count: int,
+    feature_count: int,
+    odfv: bool,
+) -> Tuple[FeatureStore, List[str]]:
+    num_entities = max(ENTITY_COUNTS)
+    rng = np.random.default_rng(0)
+    feature_views = []
+    for i in range(feature_view_count):
+        df = pd.DataFrame(
+            {f"f_{i}_{j}": rng.random(num_entities) for j in range(feature_count)}
+        )
+        df["driver_id"] = np.arange(num_entities)
+        df["event_timestamp"] = datetime.utcnow()
+        feature_views.append(
+            LocalFeatureView(
+                name=f"fv_{i}",
+                data=df,
+                schema=[
+                    Field(name=f"f_{i}_{j}", dtype=Float64)
+                    for j in range(feature_count)
+                ],
+            )
+        )
+    store = build_local_feature_store(
+        tmp_path, "benchmark", feature_views, online_store=online_store
+    )
+    feature_refs = [
+        f"{feature_view.name}:{field.name}"
+        for feature_view in feature_views
+        for field in feature_view.schema
+    ]
+
+    if odfv:
+        columns = [field.name for field in feature_views[0].schema]
+
+        @on_demand_feature_view(
+            sources=[store.get_feature_view("fv_0")],
+            schema=[Field(name="f_0_sum", dtype=Float64)],
+        )
+        def odfv_sum(inputs: pd.DataFrame) -> pd.DataFrame:
+            df = pd.DataFrame()
+            df["f_0_sum"] = inputs[columns].sum(axis=1)
+            return df
+
+        store.apply([odfv_sum])
+        feature_refs.append("odfv_sum:f_0_sum")
+
+    for feature_view in feature_views:
+        store.write_to_online_store(feature_view.name, feature_view.data)
+    return store, feature_refs
+
+
+@pytest.fixture(scope="module")
+def stores(tmp_path_factory):
+    cache = {}
+
+    def get(online_store, feature_view_count, feature_count, odfv):
+        key = (online_store, feature_view_count, feature_count, odfv)
+        if key not in cache:
+            cache[key] = _build_store(tmp_path_factory.mktemp("benchmark"), *key)
+        return cache[key]
+
+    return get
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("full_feature_names", [False, True])
+@pytest.mark.parametrize("odfv", [False, True])
+@pytest.mark.parametrize("feature_count", FEATURE_COUNTS)
+@pytest.mark.parametrize("feature_view_count", FEATURE_VIEW_COUNTS)
+@pytest.mark.parametrize("entity_count", ENTITY_COUNTS)
+@pytest.mark.parametrize("online_store", ONLINE_STORES)
+def test_online_retrieval_stages(
+    benchmark,
+    monkeypatch,
+    stage_breakdowns,
+    stores,
+    online_store,
+    entity_count,
+    feature_view_count,
+    feature_count,
+    odfv,
+    full_feature_names,
+):
+    """
+    Benchmarks online retrieval over a sweep of request shapes, recording the time spent in each stage.
+    """
+    store, feature_refs = stores(online_store, feature_view_count, feature_count, odfv)
+    entity_rows = [{"driver_id": i} for i in range(entity_count)]
+
+    timer = StageTimer()
+    _instrument(monkeypatch, store, timer)
+
+    request_count = itertools.count(1)
+
+    def get_online_features():
+        next(request_count)
+        return store.get_online_features(
+            features=feature_refs,
+            entity_rows=entity_rows,
+            full_feature_names=full_feature_names,
+        )
+
+    response = benchmark(get_online_features)
+    assert len(response.proto.results) == len(feature_refs) + 1
+
+    requests = next(request_count) - 1
+    stages_ms = {stage: timer.totals[stage] / requests * 1000 for stage in STAGES}
+    benchmark.extra_info["stages_ms"] = stages_ms
+    stage_breakdowns.append((benchmark.name, stages_ms))
@@ -0,0 +1,226 @@
+import io
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pandas as pd
+import pytest
+from tqdm import tqdm
+
+from feast import Field
+from feast.infra.materialization.batch_materialization_engine import (
+    MaterializationJobStatus,
+    MaterializationTask,
+)
+from feast.types import Float64, Int64
+from tests.utils.local_feature_store import LocalFeatureView, build_local_feature_store
+
+NUM_ENTITIES = 250
+
+
+def _feature_views():
+    return [
+        LocalFeatureView(
+            name=f"driver_stats_{i}",
+            data=pd.DataFrame(
+                {
+                    "driver_id": np.arange(NUM_ENTITIES),
+                    "rating": np.arange(NUM_ENTITIES) * 0.5 + i,
+                    "trips": np.arange(NUM_ENTITIES) + i,
+                    "event_timestamp": datetime(2022, 1, 1),
+                }
+            ),
+            schema=[
+                Field(name="rating", dtype=Float64),
+                Field(name="trips", dtype=Int64),
+            ],
+        )
+        for i in range(2)
+    ]
+
+
+@pytest.mark.parametrize(
+    "batch_engine",
+    [
+        {"type": "local", "batch_size": 100},
+        {
+            "type": "local",
+            "batch_size": 100,
+            "write_threads": 2,
+            "feature_view_threads": 2,
+            "max_pending_batches": 1,
+        },
+        {
+            "type": "local",
+            "batch_size": 100,
+            "conversion_processes": 2,
+            "write_threads": 2,
+            "feature_view_threads": 2,
+        },
+    ],
+)
+def test_materialize(tmp_path, batch_engine):
+    store = build_local_feature_store(
+        tmp_path, "test_local_engine", _feature_views(), batch_engine=batch_engine
+    )
+    provider = store._get_provider()
+
+    progress = {}
+
+    def tqdm_builder(feature_view_name):
+        def build(length):
+            progress[feature_view_name] = tqdm(total=length, file=io.StringIO())
+            return progress[feature_view_name]
+
+        return build
+
+    tasks = [
+        MaterializationTask(
+            project=store.project,
+            feature_view=feature_view,
+            start_time=datetime(2021, 12, 31, tzinfo=timezone.utc),
+            end_time=datetime(2022, 1, 2, tzinfo=timezone.utc),
+            tqdm_builder=tqdm_builder(feature_view.name),
+        )
+        for feature_view in store.list_feature_views()
+    ]
+    jobs = provider.batch_engine.materialize(store._registry, tasks)
+
+    assert [job.status() for job in jobs] == [MaterializationJobStatus.SUCCEEDED] * 2
+    assert {name: pbar.n for name, pbar in progress.items()} == {
+        "driver_stats_0": NUM_ENTITIES,
+        "driver_stats_1": NUM_ENTITIES,
+    }
+
+    response = store.get_online_features(
+        features=["driver_stats_0:rating", "driver_stats_1:trips"],
+        entity_rows=[{"driver_id": driver_id} for driver_id in (0, 7, 249)],
+    ).to_dict()
+    assert response["rating"] == [0.0, 3.5, 124.5]
+    assert response["trips"] == [1, 8, 250]
+    store.close()
+
+
+def test_feature_store_materialize(tmp_path, monkeypatch):
+    store = build_local_feature_store(
+        tmp_path,
+        "test_local_engine",
+        _feature_views(),
+        batch_engine={
+            "type": "local",
+            "batch_size": 100,
+            "conversion_processes": 1,
+            "feature_view_threads": 2,
+        },
+    )
+    engine = store._get_provider().batch_engine
+    materialize = engine.materialize
+    calls = []
+
+    def spy_materialize(registry, tasks):
+        calls.append([task.feature_view.name for task in tasks])
+        return materialize(registry, tasks)
+
+    monkeypatch.setattr(engine, "materialize", spy_materialize)
+
+    store.materialize(datetime(2021, 12, 31), datetime(2022, 1, 1, 12))
+    pipeline = engine._pipeline
+    store.materialize_incremental(datetime(2022, 1, 2))
+
+    # Both feature views are materialized by a single call to the engine, whose pipeline is kept across calls.
+    assert calls == [["driver_stats_0", "driver_stats_1"]] * 2
+    assert engine._pipeline is pipeline
+    for feature_view in store.list_feature_views():
+        assert feature_view.most_recent_end_time == datetime(
+            2022, 1, 2, tzinfo=timezone.utc
+        )
+    response = store.get_online_features(
+        features=["driver_stats_0:rating", "driver_stats_1:trips"],
+        entity_rows=[{"driver_id": 7}],
+    ).to_dict()
+    assert response["rating"] == [3.5]
+    assert response["trips"] == [8]
+
+    store.close()
+    assert engine._pipeline is None
+
+
+def test_materialize_write_error(tmp_path, monkeypatch):
+    store = build_local_feature_store(
+        tmp_path,
+        "test_local_engine",
+        _feature_views(),
+        batch_engine={"type": "local", "batch_size": 10, "write_threads": 2},
+    )
+    online_store = store._get_provider().online_store
+
+    def online_write_batch_serialized(config, table, data):
+        raise ValueError("write failed")
+
+    monkeypatch.setattr(
+        online_store, "online_write_batch_serialized", online_write_batch_serialized
+    )
+
+    with pytest.raises(ValueError, match="write failed"):
+        store.materialize(datetime(2021, 12, 31), datetime(2022, 1, 2))
+
+
+@pytest.mark.parametrize("concurrency", [1, 2])
+def test_materialize_incremental_in_chunks(tmp_path, monkeypatch, concurrency):
+    store = build_local_feature_store(
+        tmp_path,
+        "test_local_engine",
+        _feature_views(),
+        batch_engine={"type": "local"},
+        materialization_chunk_size=timedelta(hours=12),
+        materialization_chunk_concurrency=concurrency,
+    )
+    store.materialize(
+        datetime(2021, 12, 31, tzinfo=timezone.utc),
+        datetime(2021, 12, 31, 1, tzinfo=timezone.utc),
+        feature_views=["driver_stats_0"],
+    )
+
+    provider = store._get_provider()
+    materialize_single_feature_view = provider.materialize_single_feature_view
+    failing_chunk_start = datetime(2022, 1, 1, 1, tzinfo=timezone.utc)
+
+    def failing_materialize_single_feature_view(**kwargs):
+        if kwargs["start_date"] == failing_chunk_start:
+            raise ValueError("materialization failed")
+        materialize_single_feature_view(**kwargs)
+
+    monkeypatch.setattr(
+        provider,
+        "materialize_single_feature_view",
+        failing_materialize_single_feature_view,
+    )
+    with pytest.raises(ValueError, match="materialization failed"):
+        store.materialize_incremental(
+            datetime(2022, 1, 2, tzinfo=timezone.utc),
+            feature_views=["driver_stats_0"],
+        )
+
+    # The chunks written before the failure are recorded, and the data they hold is online.
+    feature_view = store.get_feature_view("driver_stats_0")
+    assert feature_view.most_recent_end_time == failing_chunk_start
+    assert len(feature_view.materialization_intervals) == 3
+    response = store.get_online_features(
+        features=["driver_stats_0:rating"], entity_rows=[{"driver_id": 7}]
+    ).to_dict()
+    assert response["rating"] == [3.5]
+
+    # A new run resumes from the last chunk recorded.
+    monkeypatch.setattr(
+        provider, "materialize_single_feature_view", materialize_single_feature_view
+    )
+    store.materialize_incremental(
+        datetime(2022, 1, 2, tzinfo=timezone.utc), feature_views=["driver_stats_0"]
+    )
+    feature_view = store.get_feature_view("driver_stats_0")
+    assert feature_view.materialization_intervals[3:] == [
+        (failing_chunk_start, datetime(2022, 1, 1, 13, tzinfo=timezone.utc)),
+        (
+            datetime(2022, 1, 1, 13, tzinfo=timezone.utc),
+            datetime(2022, 1, 2, tzinfo=timezone.utc),
+        ),
+    ]
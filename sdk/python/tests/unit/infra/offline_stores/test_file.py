@@ -0,0 +1,220 @@
+from datetime import datetime, timedelta, timezone
+
+import pandas as pd
+import pytest
+
+from feast import Field, FileSource, RepoConfig
+from feast.infra.offline_stores import file
+from feast.infra.offline_stores.file import FileOfflineStoreConfig
+from feast.types import Float64, Int64
+from tests.utils.local_feature_store import LocalFeatureView, build_local_feature_store
+
+
+def _feature_views():
+    driver_stats = pd.DataFrame(
+        {
+            "driver": [1, 1, 1, 2, 2, 3],
+            "conv_rate": [0.1, 0.2, 0.3, 0.4, 0.5, 0.6],
+            "event_timestamp": pd.to_datetime(
+                [
+                    "2022-01-01 10:00",
+                    "2022-01-01 12:00",
+                    "2022-01-01 12:00",
+                    "2022-01-01 09:00",
+                    "2022-01-03 09:00",
+                    "2022-01-01 11:00",
+                ]
+            ),
+            "created": pd.to_datetime(
+                [
+                    "2022-01-01",
+                    "2022-01-02",
+                    "2022-01-03",
+                    "2022-01-01",
+                    "2022-01-03",
+                    "2022-01-01",
+                ]
+            ),
+        }
+    )
+    driver_trips = pd.DataFrame(
+        {
+            "driver_id": [1, 2, 3],
+            "trips": [10, 20, 30],
+            "ts": pd.to_datetime(
+                ["2021-06-01", "2022-01-01 10:00", "2022-01-02"], utc=True
+            ),
+        }
+    )
+    return [
+        LocalFeatureView(
+            name="driver_stats",
+            data=driver_stats,
+            schema=[
+                Field(name="driver_id", dtype=Int64),
+                Field(name="conv_rate", dtype=Float64),
+            ],
+            ttl=timedelta(hours=6),
+            source_options={
+                "created_timestamp_column": "created",
+                "field_mapping": {"driver": "driver_id"},
+            },
+        ),
+        LocalFeatureView(
+            name="driver_trips",
+            data=driver_trips,
+            schema=[
+                Field(name="driver_id", dtype=Int64),
+                Field(name="trips", dtype=Int64),
+            ],
+            ttl=timedelta(0),
+            source_options={"timestamp_field": "ts"},
+        ),
+    ]
+
+
+@pytest.mark.parametrize("full_feature_names", [False, True])
+def test_arrow_engine_point_in_time_join(tmp_path, full_feature_names):
+    entity_df = pd.DataFrame(
+        {
+            "driver_id": [1, 1, 2, 2, 3, 4],
+            "event_timestamp": pd.to_datetime(
+                [
+                    "2022-01-01 12:00",
+                    "2022-01-01 19:00",
+                    "2022-01-01 11:00",
+                    "2022-01-03 10:00",
+                    "2022-01-01 12:00",
+                    "2022-01-01 12:00",
+                ]
+            ),
+            "label": [True, False, True, False, True, False],
+        }
+    )
+    features = ["driver_stats:conv_rate", "driver_trips:trips"]
+
+    results = {}
+    for engine in ("dask", "arrow"):
+        store = build_local_feature_store(
+            tmp_path / engine,
+            "test_file",
+            _feature_views(),
+            offline_store={"engine": engine},
+        )
+        results[engine] = (
+            store.get_historical_features(
+                entity_df=entity_df,
+                features=features,
+                full_feature_names=full_feature_names,
+            )
+            .to_df()
+            .sort_values(["driver_id", "event_timestamp"])
+            .reset_index(drop=True)
+        )
+
+    conv_rate, trips = (
+        ("driver_stats__conv_rate", "driver_trips__trips")
+        if full_feature_names
+        else ("conv_rate", "trips")
+    )
+    nan = float("nan")
+    expected = entity_df.sort_values(["driver_id", "event_timestamp"]).assign(
+        event_timestamp=lambda df: df["event_timestamp"].dt.tz_localize("UTC"),
+        **{
+            # Ties on the event timestamp are broken by the created timestamp.
+            conv_rate: [0.3, nan, 0.4, 0.5, 0.6, nan],
+            trips: [10.0, 10.0, 20.0, 20.0, nan, nan],
+        },
+    )
+    pd.testing.assert_frame_equal(results["arrow"], expected.reset_index(drop=True))
+
+    # The dask engine drops the entity rows having feature rows, but none in the ttl window.
+    pd.testing.assert_frame_equal(
+        results["arrow"]
+        .dropna(subset=[conv_rate, trips], how="any")
+        .reset_index(drop=True),
+        results["dask"]
+        .dropna(subset=[conv_rate, trips], how="any")
+        .reset_index(drop=True),
+    )
+
+
+@pytest.mark.parametrize("join_processes", [0, 2])
+def test_arrow_engine_partitioned_point_in_time_join(tmp_path, join_processes):
+    entity_df = pd.DataFrame(
+        {
+            "driver_id": [1, 2, 3, 4] * 25,
+            "event_timestamp": pd.date_range(
+                "2022-01-01", "2022-01-03", periods=100, tz="UTC"
+            ),
+        }
+    )
+    features = ["driver_stats:conv_rate", "driver_trips:trips"]
+
+    results = []
+    for offline_store in (
+        {},
+        {"partitions": 3, "join_processes": join_processes},
+    ):
+        store = build_local_feature_store(
+            tmp_path / str(len(results)),
+            "test_file",
+            _feature_views(),
+            offline_store={"engine": "arrow", **offline_store},
+        )
+        results.append(
+            store.get_historical_features(
+                entity_df=entity_df, features=features
+            ).to_df()
+        )
+
+    pd.testing.assert_frame_equal(results[1], results[0])
+    assert results[0]["conv_rate"].notna().any()
+    assert results[0]["trips"].notna().any()
+
+
+def test_pull_latest_pushes_down_columns_and_time_range(tmp_path, monkeypatch):
+    days = pd.date_range("2021-01-01", "2022-12-31", freq="D")
+    pd.DataFrame(
+        {
+            "driver_id": range(len(days)),
+            "conv_rate": 0.5,
+            "unused": "x",
+            "event_timestamp": days,
+        }
+    ).to_parquet(tmp_path / "source.parquet", row_group_size=31)
+    source = FileSource(
+        path=str(tmp_path / "source.parquet"), timestamp_field="event_timestamp"
+    )
+
+    reads = []
+    _read_datasource = file._read_datasource
+
+    def read_datasource(data_source, columns=None, filters=None):
+        df = _read_datasource(data_source, columns, filters)
+        reads.append(df.compute())
+        return df
+
+    monkeypatch.setattr(file, "_read_datasource", read_datasource)
+    job = file.FileOfflineStore.pull_latest_from_table_or_query(
+        config=RepoConfig(
+            registry=str(tmp_path / "registry.db"),
+            project="test_file",
+            provider="local",
+            offline_store=FileOfflineStoreConfig(),
+        ),
+        data_source=source,
+        join_key_columns=["driver_id"],
+        feature_name_columns=["conv_rate"],
+        timestamp_field="event_timestamp",
+        created_timestamp_column=None,
+        start_date=datetime(2022, 3, 1, tzinfo=timezone.utc),
+        end_date=datetime(2022, 3, 2, tzinfo=timezone.utc),
+    )
+
+    df = job.to_df()
+    assert df["event_timestamp"].tolist() == [pd.Timestamp("2022-03-01", tz="UTC")]
+    # Only the needed columns of the row group holding the day are read.
+    (read,) = reads
+    assert sorted(read.columns) == ["conv_rate", "driver_id", "event_timestamp"]
+    assert len(read) <= 31
@@ -1,9 +1,11 @@
+from types import SimpleNamespace
 from typing import List, Optional
 from unittest.mock import MagicMock, patch
 
 import pandas as pd
 import pyarrow
 import pytest
+from dask import dataframe as dd
 
 from feast.infra.offline_stores.contrib.athena_offline_store.athena import (
     AthenaOfflineStoreConfig,
@@ -223,3 +225,48 @@ def test_to_arrow_timeout(retrieval_job, timeout: Optional[int]):
     with patch.object(retrieval_job, "_to_arrow_internal") as mock_to_arrow_internal:
         retrieval_job.to_arrow(timeout=timeout)
         mock_to_arrow_internal.assert_called_once_with(timeout=timeout)
+
+
+@pytest.mark.parametrize("timeout", (None, 30))
+def test_to_arrow_batches_timeout(retrieval_job, timeout: Optional[int]):
+    with patch.object(
+        retrieval_job, "_to_arrow_batches_internal"
+    ) as mock_to_arrow_batches_internal:
+        retrieval_job.to_arrow_batches(batch_size=10, timeout=timeout)
+        mock_to_arrow_batches_internal.assert_called_once_with(
+            batch_size=10, timeout=timeout
+        )
+
+
+def test_file_retrieval_job_to_arrow_batches():
+    df = pd.DataFrame({"driver_id": range(10), "rating": [i / 2 for i in range(10)]})
+    retrieval_job = FileRetrievalJob(
+        lambda: dd.from_pandas(df, npartitions=3), full_feature_names=False
+    )
+
+    batches = list(retrieval_job.to_arrow_batches(batch_size=2))
+
+    assert max(batch.num_rows for batch in batches) == 2
+    pd.testing.assert_frame_equal(pyarrow.Table.from_batches(batches).to_pandas(), df)
+
+
+def test_snowflake_retrieval_job_to_arrow_batches():
+    snowflake_conn = MagicMock()
+    cursor = snowflake_conn.cursor().execute.return_value
+    cursor.fetch_arrow_batches.return_value = iter(
+        [pyarrow.table({"driver_id": range(3)}), pyarrow.table({"driver_id": [3]})]
+    )
+    retrieval_job = SnowflakeRetrievalJob(
+        query="query",
+        snowflake_conn=snowflake_conn,
+        config=SimpleNamespace(
+            project="project",
+            offline_store=SimpleNamespace(blob_export_location=None),
+        ),
+        full_feature_names=False,
+    )
+
+    batches = list(retrieval_job.to_arrow_batches(batch_size=2, timeout=30))
+
+    assert [batch.num_rows for batch in batches] == [2, 1, 1]
+    snowflake_conn.cursor().execute.assert_called_with("query", timeout=30)
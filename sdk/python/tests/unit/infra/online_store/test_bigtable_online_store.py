@@ -0,0 +1,133 @@
+import threading
+import time
+from dataclasses import dataclass
+from types import SimpleNamespace
+from typing import List
+
+import pytest
+from pydantic import ValidationError
+
+from feast.infra.offline_stores.file import FileOfflineStoreConfig
+from feast.infra.online_stores.bigtable import (
+    BigtableOnlineStore,
+    BigtableOnlineStoreConfig,
+)
+from feast.protos.feast.types.EntityKey_pb2 import EntityKey as EntityKeyProto
+from feast.protos.feast.types.Value_pb2 import Value as ValueProto
+from feast.repo_config import RepoConfig
+
+
+@dataclass
+class MockFeatureView:
+    name: str
+    entities: List[str]
+
+
+class FakeTable:
+    def __init__(self, rows):
+        self.rows = rows
+        self.reads = []
+        self.active_reads = 0
+        self.max_active_reads = 0
+        self.lock = threading.Lock()
+
+    def read_rows(self, row_set, filter_, retry):
+        with self.lock:
+            self.reads.append((row_set.row_keys, filter_, retry))
+            self.active_reads += 1
+            self.max_active_reads = max(self.max_active_reads, self.active_reads)
+        time.sleep(0.05)
+        with self.lock:
+            self.active_reads -= 1
+        return [self.rows[key] for key in row_set.row_keys if key in self.rows]
+
+
+def _row(row_key: bytes, driver_id: int):
+    cell = SimpleNamespace
+    return SimpleNamespace(
+        row_key=row_key,
+        cells={
+            "features": {
+                b"rating": [
+                    cell(
+                        value=ValueProto(double_val=driver_id / 10).SerializeToString()
+                    )
+                ],
+                b"event_ts": [cell(value=b"2022-01-01T00:00:00+00:00")],
+            }
+        },
+    )
+
+
+def _entity_key(driver_id: int) -> EntityKeyProto:
+    return EntityKeyProto(
+        join_keys=["driver_id"], entity_values=[ValueProto(int64_val=driver_id)]
+    )
+
+
+@pytest.fixture
+def store_and_table():
+    config = RepoConfig(
+        registry="registry.db",
+        project="test_bigtable",
+        provider="gcp",
+        online_store=BigtableOnlineStoreConfig(
+            instance="feast", read_batch_size=2, read_timeout=5
+        ),
+        offline_store=FileOfflineStoreConfig(),
+        entity_key_serialization_version=2,
+    )
+    store = BigtableOnlineStore()
+    table = MockFeatureView(name="driver_stats", entities=["driver"])
+    row_keys = {
+        driver_id: store._compute_row_key(_entity_key(driver_id), table.name, config)
+        for driver_id in (1, 2, 3, 4, 5)
+    }
+    fake_table = FakeTable(
+        {
+            row_keys[driver_id]: _row(row_keys[driver_id], driver_id)
+            for driver_id in (1, 2, 3, 5)
+        }
+    )
+    store._client = SimpleNamespace(
+        instance=lambda instance_id: SimpleNamespace(table=lambda name: fake_table)
+    )
+    return config, store, table, fake_table
+
+
+def test_online_read_shards_row_keys(store_and_table):
+    config, store, table, fake_table = store_and_table
+    results = store.online_read(
+        config,
+        table,
+        [_entity_key(driver_id) for driver_id in (5, 1, 6, 2, 5, 3, 4)],
+        requested_features=["rating"],
+    )
+    assert [res and res["rating"].double_val for _, res in results] == [
+        0.5,
+        0.1,
+        None,
+        0.2,
+        0.5,
+        0.3,
+        None,
+    ]
+
+    # The 6 distinct row keys are read by 3 concurrent calls with a deadline.
+    assert sorted(len(row_keys) for row_keys, _, _ in fake_table.reads) == [2, 2, 2]
+    assert fake_table.max_active_reads == 3
+    _, row_filter, retry = fake_table.reads[0]
+    assert retry._deadline == 5
+    # Only the latest version of the requested features is read.
+    assert row_filter.to_pb().chain.filters[0].column_qualifier_regex_filter == (
+        b"^(rating|event_ts)$"
+    )
+    assert row_filter.to_pb().chain.filters[1].cells_per_column_limit_filter == 1
+
+
+@pytest.mark.parametrize(
+    "option", ({"read_concurrency": 0}, {"read_batch_size": 0}, {"read_timeout": -1})
+)
+def test_config_rejects_non_positive_read_options(option):
+    with pytest.raises(ValidationError):
+        BigtableOnlineStoreConfig(instance="feast", **option)
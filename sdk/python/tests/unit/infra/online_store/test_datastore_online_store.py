@@ -0,0 +1,112 @@
+import threading
+import time
+from datetime import datetime
+from typing import List
+
+import pytest
+from google.cloud import datastore
+
+from feast.infra.offline_stores.file import FileOfflineStoreConfig
+from feast.infra.online_stores.datastore import (
+    DatastoreOnlineStore,
+    DatastoreOnlineStoreConfig,
+)
+from feast.protos.feast.types.EntityKey_pb2 import EntityKey as EntityKeyProto
+from feast.protos.feast.types.Value_pb2 import Value as ValueProto
+from feast.repo_config import RepoConfig
+
+
+class MockFeatureView:
+    name = "driver_stats"
+
+
+class FakeClient:
+    def __init__(self):
+        self.entities = {}
+        self.lookups = []
+        self.active_lookups = 0
+        self.max_active_lookups = 0
+        self.lock = threading.Lock()
+
+    def key(self, *path):
+        return datastore.Key(*path, project="test")
+
+    def get_multi(self, keys: List[datastore.Key], timeout=None):
+        with self.lock:
+            self.lookups.append((keys, timeout))
+            self.active_lookups += 1
+            self.max_active_lookups = max(self.max_active_lookups, self.active_lookups)
+        time.sleep(0.05)
+        with self.lock:
+            self.active_lookups -= 1
+        return [self.entities[key] for key in keys if key in self.entities]
+
+
+def _entity_key(driver_id: int) -> EntityKeyProto:
+    return EntityKeyProto(
+        join_keys=["driver_id"], entity_values=[ValueProto(int64_val=driver_id)]
+    )
+
+
+@pytest.fixture
+def store():
+    store = DatastoreOnlineStore()
+    store._client = FakeClient()
+    return store
+
+
+def test_online_read_looks_up_minibatches_concurrently(store):
+    config = RepoConfig(
+        registry="registry.db",
+        project="test_datastore",
+        provider="gcp",
+        online_store=DatastoreOnlineStoreConfig(read_batch_size=2, read_timeout=5),
+        offline_store=FileOfflineStoreConfig(),
+        entity_key_serialization_version=2,
+    )
+    table = MockFeatureView()
+    # Rows are written with the write path, and a fake transaction.
+    store._client.transaction = lambda: threading.Lock()
+    store._client.put_multi = lambda entities: store._client.entities.update(
+        {entity.key: entity for entity in entities}
+    )
+    store.online_write_batch(
+        config,
+        table,
+        [
+            (
+                _entity_key(driver_id),
+                {
+                    "rating": ValueProto(double_val=driver_id / 10),
+                    "trips": ValueProto(int64_val=driver_id),
+                },
+                datetime(2022, 1, driver_id),
+                None,
+            )
+            for driver_id in (1, 2, 3, 5)
+        ],
+        progress=None,
+    )
+
+    results = store.online_read(
+        config,
+        table,
+        [_entity_key(driver_id) for driver_id in (5, 1, 6, 2, 5, 3, 4)],
+        requested_features=["rating"],
+    )
+    assert [res and res["rating"].double_val for _, res in results] == [
+        0.5,
+        0.1,
+        None,
+        0.2,
+        0.5,
+        0.3,
+        None,
+    ]
+    # Features which weren't requested are not deserialized.
+    assert all(res is None or list(res) == ["rating"] for _, res in results)
+
+    # The 6 distinct keys are looked up by 3 concurrent calls with a deadline.
+    assert sorted(len(keys) for keys, _ in store._client.lookups) == [2, 2, 2]
+    assert {timeout for _, timeout in store._client.lookups} == {5}
+    assert store._client.max_active_lookups == 3
@@ -1,3 +1,5 @@
+import asyncio
+import functools
 from copy import deepcopy
 from dataclasses import dataclass
 
@@ -5,7 +7,9 @@ import boto3
 import pytest
 from moto import mock_dynamodb
 
+from feast.errors import DynamoDBUnprocessedKeysError
 from feast.infra.offline_stores.file import FileOfflineStoreConfig
+from feast.infra.online_stores import dynamodb
 from feast.infra.online_stores.dynamodb import (
     DynamoDBOnlineStore,
     DynamoDBOnlineStoreConfig,
@@ -32,6 +36,31 @@ class MockFeatureView:
     name: str
 
 
+class FakeAioDynamoDBClient:
+    """
+    Stands in for an aiobotocore DynamoDB client, making its calls with a boto3 client, which moto
+    mocks. Like the real client, it can only be used from the event loop which opened it.
+    """
+
+    def __init__(self, region, endpoint_url=None):
+        self.client = boto3.client(
+            "dynamodb", region_name=region, endpoint_url=endpoint_url
+        )
+        self.loop = None
+        self.closed = False
+
+    async def __aenter__(self):
+        self.loop = asyncio.get_running_loop()
+        return self
+
+    async def batch_get_item(self, **kwargs):
+        assert not self.closed and self.loop is asyncio.get_running_loop()
+        return self.client.batch_get_item(**kwargs)
+
+    async def close(self):
+        self.closed = True
+
+
 @pytest.fixture
 def repo_config():
     return RepoConfig(
@@ -358,3 +387,125 @@ def test_dynamodb_online_store_online_read_unknown_entity_end_of_batch(
     # ensure the entity is not dropped
     assert len(returned_items) == len(entity_keys)
     assert returned_items[-1] == (None, None)
+
+
+@mock_dynamodb
+def test_dynamodb_online_store_online_read_requested_features(
+    repo_config, dynamodb_online_store
+):
+    """Test DynamoDBOnlineStore online_read method with requested features and duplicate entities."""
+    db_table_name = f"{TABLE_NAME}_requested_features"
+    create_test_table(PROJECT, db_table_name, REGION)
+    data = create_n_customer_test_samples(n=50)
+    insert_data_test_table(data, PROJECT, db_table_name, REGION)
+
+    entity_keys, features, *rest = zip(*data)
+    returned_items = dynamodb_online_store.online_read(
+        config=repo_config,
+        table=MockFeatureView(name=db_table_name),
+        entity_keys=list(entity_keys) * 2,
+        requested_features=["name", "age"],
+    )
+    assert [item[1] for item in returned_items] == [
+        {"name": feature["name"], "age": feature["age"]} for feature in features
+    ] * 2
+
+
+@mock_dynamodb
+@pytest.mark.parametrize("max_unprocessed_keys_retries", [0, 2])
+def test_dynamodb_online_store_online_read_unprocessed_keys(
+    repo_config, dynamodb_online_store, monkeypatch, max_unprocessed_keys_retries
+):
+    """Test that DynamoDBOnlineStore online_read retries unprocessed keys."""
+    monkeypatch.setattr(dynamodb, "UNPROCESSED_KEYS_BACKOFF_SECONDS", 0)
+    repo_config.online_store.max_unprocessed_keys_retries = max_unprocessed_keys_retries
+    db_table_name = f"{TABLE_NAME}_unprocessed_keys"
+    create_test_table(PROJECT, db_table_name, REGION)
+    data = create_n_customer_test_samples(n=100)
+    insert_data_test_table(data, PROJECT, db_table_name, REGION)
+
+    # The last 10 keys of each batch are left unprocessed once, as if they were throttled.
+    client = dynamodb_online_store._get_dynamodb_client(REGION)
+    batch_get_item = client.batch_get_item
+    throttled = set()
+
+    def throttled_batch_get_item(RequestItems):
+        ((table_name, request),) = RequestItems.items()
+        keys = request["Keys"]
+        unprocessed_keys = [
+            key for key in keys[-10:] if key["entity_id"]["S"] not in throttled
+        ]
+        throttled.update(key["entity_id"]["S"] for key in unprocessed_keys)
+        response = batch_get_item(
+            RequestItems={
+                table_name: {
+                    **request,
+                    "Keys": [key for key in keys if key not in unprocessed_keys],
+                }
+            }
+        )
+        if unprocessed_keys:
+            response["UnprocessedKeys"] = {
+                table_name: {**request, "Keys": unprocessed_keys}
+            }
+        return response
+
+    monkeypatch.setattr(client, "batch_get_item", throttled_batch_get_item)
+
+    entity_keys, features, *rest = zip(*data)
+    read = functools.partial(
+        dynamodb_online_store.online_read,
+        config=repo_config,
+        table=MockFeatureView(name=db_table_name),
+        entity_keys=entity_keys,
+    )
+    if max_unprocessed_keys_retries == 0:
+        with pytest.raises(DynamoDBUnprocessedKeysError):
+            read()
+    else:
+        assert [item[1] for item in read()] == list(features)
+
+
+@mock_dynamodb
+def test_dynamodb_online_store_online_read_async(
+    repo_config, dynamodb_online_store, monkeypatch
+):
+    """Test that DynamoDBOnlineStore online_read_async reads with a client per event loop."""
+    clients = []
+
+    def initialize_aiodynamodb_client(region, endpoint_url=None):
+        clients.append(FakeAioDynamoDBClient(region, endpoint_url))
+        return clients[-1]
+
+    monkeypatch.setattr(
+        dynamodb, "_initialize_aiodynamodb_client", initialize_aiodynamodb_client
+    )
+    db_table_name = f"{TABLE_NAME}_online_read_async"
+    create_test_table(PROJECT, db_table_name, REGION)
+    data = create_n_customer_test_samples(n=50)
+    insert_data_test_table(data, PROJECT, db_table_name, REGION)
+
+    entity_keys, features, *rest = zip(*data)
+    read = functools.partial(
+        dynamodb_online_store.online_read_async,
+        config=repo_config,
+        table=MockFeatureView(name=db_table_name),
+        entity_keys=list(entity_keys) + [entity_keys[0]],
+        requested_features=["name", "age"],
+    )
+    expected = [
+        {"name": feature["name"], "age": feature["age"]} for feature in features
+    ]
+    expected.append(expected[0])
+
+    async def read_and_close(close: bool):
+        returned_items = await read()
+        if close:
+            await dynamodb_online_store.close_async()
+        return [item[1] for item in returned_items]
+
+    assert asyncio.run(read_and_close(close=True)) == expected
+    # Every event loop opens its own client, even if the client of a previous loop wasn't closed.
+    assert asyncio.run(read_and_close(close=False)) == expected
+    assert asyncio.run(read_and_close(close=True)) == expected
+    assert [client.closed for client in clients] == [True, False, True]
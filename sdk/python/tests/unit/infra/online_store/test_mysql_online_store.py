@@ -0,0 +1,171 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+
+import pytest
+from pydantic import ValidationError
+
+from feast.infra.offline_stores.file import FileOfflineStoreConfig
+from feast.infra.online_stores.contrib.mysql_online_store import mysql
+from feast.infra.online_stores.contrib.mysql_online_store.mysql import (
+    MySQLOnlineStore,
+    MySQLOnlineStoreConfig,
+)
+from feast.protos.feast.types.EntityKey_pb2 import EntityKey as EntityKeyProto
+from feast.protos.feast.types.Value_pb2 import Value as ValueProto
+from feast.repo_config import RepoConfig
+
+
+@dataclass
+class MockFeatureView:
+    name: str
+
+
+class FakeCursor:
+    def __init__(self, conn):
+        self.conn = conn
+        self._rows = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        pass
+
+    def execute(self, query, args):
+        self.conn.queries.append(query)
+        time.sleep(0.01)
+        self._rows = [
+            (entity_key, feature_name, value, event_ts)
+            for (entity_key, feature_name), (value, event_ts, _) in sorted(
+                self.conn.rows.items()
+            )
+            if entity_key in args
+        ]
+
+    def executemany(self, query, args):
+        self.conn.queries.append(query)
+        for entity_key, feature_name, value, event_ts, created_ts in args:
+            self.conn.rows[(entity_key, feature_name)] = (value, event_ts, created_ts)
+
+    def fetchall(self):
+        return self._rows
+
+
+class FakeConnection:
+    def __init__(self, rows):
+        self.rows = rows
+        self.queries = []
+        self.transactions = []
+        self.closed = False
+
+    def cursor(self):
+        return FakeCursor(self)
+
+    def begin(self):
+        self.transactions.append("begin")
+
+    def commit(self):
+        self.transactions.append("commit")
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def connections(monkeypatch):
+    rows = {}
+    connections = []
+
+    def connect(**kwargs):
+        connections.append(FakeConnection(rows))
+        return connections[-1]
+
+    monkeypatch.setattr(mysql.pymysql, "connect", connect)
+    return connections
+
+
+def _repo_config(**online_store):
+    return RepoConfig(
+        registry="registry.db",
+        project="test_mysql",
+        provider="local",
+        online_store=MySQLOnlineStoreConfig(**online_store),
+        offline_store=FileOfflineStoreConfig(),
+        entity_key_serialization_version=2,
+    )
+
+
+def _entity_key(driver_id: int) -> EntityKeyProto:
+    return EntityKeyProto(
+        join_keys=["driver_id"], entity_values=[ValueProto(int64_val=driver_id)]
+    )
+
+
+def test_online_read_batches_entity_keys(connections):
+    config = _repo_config(read_batch_size=2, write_batch_size=2)
+    store = MySQLOnlineStore()
+    table = MockFeatureView(name="driver_stats")
+    progress = []
+    store.online_write_batch(
+        config,
+        table,
+        [
+            (
+                _entity_key(driver_id),
+                {"rating": ValueProto(double_val=driver_id / 10)},
+                datetime(2022, 1, driver_id),
+                None,
+            )
+            for driver_id in (1, 2, 3)
+        ],
+        progress=progress.append,
+    )
+    # Entity rows are upserted by batches, with a single statement and transaction each.
+    assert progress == [2, 1]
+    assert len(connections[0].queries) == 2
+    assert connections[0].transactions == ["begin", "commit"] * 2
+
+    connections[0].queries.clear()
+    results = store.online_read(
+        config, table, [_entity_key(driver_id) for driver_id in (3, 4, 1, 3, 2)]
+    )
+    # The 4 distinct entity keys are read with 2 queries.
+    assert len(connections[0].queries) == 2
+    assert [res and res["rating"].double_val for _, res in results] == [
+        0.3,
+        None,
+        0.1,
+        0.3,
+        0.2,
+    ]
+    assert results[0][0] == datetime(2022, 1, 3)
+
+
+def test_connection_pool_is_bounded(connections):
+    config = _repo_config(pool_size=2)
+    store = MySQLOnlineStore()
+    table = MockFeatureView(name="driver_stats")
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = executor.map(
+            lambda _: store.online_read(config, table, [_entity_key(1)]), range(16)
+        )
+        assert list(results) == [[(None, None)]] * 16
+    # The 8 threads share 2 connections.
+    assert len(connections) == 2
+
+    # A connection in use when an error is raised is closed and replaced.
+    with pytest.raises(ValueError):
+        with store._get_conn(config):
+            raise ValueError()
+    assert sum(conn.closed for conn in connections) == 1
+    with store._get_conn(config) as conn, store._get_conn(config) as other_conn:
+        assert not conn.closed and not other_conn.closed
+    assert len(connections) == 3
+
+
+def test_pool_size_must_be_positive():
+    with pytest.raises(ValidationError):
+        MySQLOnlineStoreConfig(pool_size=0)
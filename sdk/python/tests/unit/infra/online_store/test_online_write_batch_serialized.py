@@ -0,0 +1,221 @@
+from datetime import datetime, timedelta, timezone
+
+import pyarrow as pa
+import pytest
+from moto import mock_dynamodb
+
+from feast import Entity, FeatureView, Field, FileSource
+from feast.infra.offline_stores.file import FileOfflineStoreConfig
+from feast.infra.online_stores.dynamodb import (
+    DynamoDBOnlineStore,
+    DynamoDBOnlineStoreConfig,
+)
+from feast.infra.online_stores.online_store import OnlineStore
+from feast.infra.online_stores.redis import RedisOnlineStore, RedisOnlineStoreConfig
+from feast.infra.online_stores.sqlite import SqliteOnlineStore, SqliteOnlineStoreConfig
+from feast.protos.feast.types.EntityKey_pb2 import EntityKey as EntityKeyProto
+from feast.protos.feast.types.Value_pb2 import Value as ValueProto
+from feast.repo_config import RepoConfig
+from feast.types import Float64, Int64, String
+from feast.utils import _convert_arrow_to_proto, _convert_arrow_to_serialized_rows
+from feast.value_type import ValueType
+from tests.utils.fake_redis import FakeRedis
+
+FEATURE_VIEW = FeatureView(
+    name="driver_stats",
+    entities=[Entity(name="driver", join_keys=["driver_id"])],
+    schema=[
+        Field(name="driver_id", dtype=Int64),
+        Field(name="rating", dtype=Float64),
+        Field(name="trips", dtype=Int64),
+        Field(name="city", dtype=String),
+    ],
+    source=FileSource(
+        path="driver_stats.parquet",
+        timestamp_field="event_timestamp",
+        created_timestamp_column="created",
+    ),
+    ttl=timedelta(days=1),
+)
+
+TABLE = pa.table(
+    {
+        "driver_id": [1, 2, 3],
+        "rating": [4.5, None, 3.25],
+        "trips": [10, 20, None],
+        "city": ["Paris", "Oslo", None],
+        "event_timestamp": pa.array(
+            [datetime(2022, 1, 1, 10), datetime(2022, 1, 2), datetime(2022, 1, 3)],
+            pa.timestamp("ns", tz="UTC"),
+        ),
+        "created": [datetime(2022, 1, 4)] * 3,
+    }
+)
+
+
+def _online_store(online_store_type, tmp_path):
+    if online_store_type == "sqlite":
+        # The rows are written in several transactions.
+        online_store_config = SqliteOnlineStoreConfig(
+            path=str(tmp_path / "online.db"), write_batch_size=2
+        )
+        store = SqliteOnlineStore()
+    elif online_store_type == "dynamodb":
+        online_store_config = DynamoDBOnlineStoreConfig(region="us-west-2")
+        store = DynamoDBOnlineStore()
+    else:
+        online_store_config = RedisOnlineStoreConfig()
+        store = RedisOnlineStore()
+        store._client = FakeRedis()
+    config = RepoConfig(
+        registry=str(tmp_path / "registry.db"),
+        project="test_serialized",
+        provider="local",
+        online_store=online_store_config,
+        offline_store=FileOfflineStoreConfig(),
+        entity_key_serialization_version=2,
+    )
+    store.update(config, [], [FEATURE_VIEW], [], [], partial=False)
+    return config, store
+
+
+@mock_dynamodb
+@pytest.mark.parametrize("online_store_type", ["sqlite", "redis", "dynamodb"])
+def test_online_write_batch_serialized(online_store_type, tmp_path):
+    join_keys = {"driver_id": ValueType.INT64}
+    entity_keys = [
+        EntityKeyProto(
+            join_keys=["driver_id"], entity_values=[ValueProto(int64_val=driver_id)]
+        )
+        for driver_id in (1, 2, 3, 4)
+    ]
+
+    config, store = _online_store(online_store_type, tmp_path / "protos")
+    store.online_write_batch(
+        config,
+        FEATURE_VIEW,
+        _convert_arrow_to_proto(TABLE, FEATURE_VIEW, join_keys),
+        progress=None,
+    )
+    expected = store.online_read(config, FEATURE_VIEW, entity_keys)
+
+    config, store = _online_store(online_store_type, tmp_path / "serialized")
+    assert store.supports_serialized_writes()
+    data = _convert_arrow_to_serialized_rows(
+        TABLE, FEATURE_VIEW, join_keys, config.entity_key_serialization_version
+    )
+    assert data.num_rows == 9
+    # Every chunk of a table is converted.
+    assert _convert_arrow_to_serialized_rows(
+        pa.concat_tables([TABLE.slice(0, 1), TABLE.slice(1)]),
+        FEATURE_VIEW,
+        join_keys,
+        config.entity_key_serialization_version,
+    ).equals(data)
+    store.online_write_batch_serialized(config, FEATURE_VIEW, data)
+
+    assert store.online_read(config, FEATURE_VIEW, entity_keys) == expected
+    assert expected[0][1]["city"] == ValueProto(string_val="Paris")
+    assert expected[1][1]["rating"] == ValueProto()
+
+
+def test_online_write_batch_serialized_default(tmp_path):
+    class RowsOnlineStore(SqliteOnlineStore):
+        """Keeps the rows written, without writing serialized feature values natively."""
+
+        def online_write_batch(self, config, table, data, progress):
+            self.rows = data
+
+        def supports_serialized_writes(self):
+            return False
+
+    config, _ = _online_store("sqlite", tmp_path)
+    store = RowsOnlineStore()
+    join_keys = {"driver_id": ValueType.INT64}
+    data = _convert_arrow_to_serialized_rows(
+        TABLE, FEATURE_VIEW, join_keys, config.entity_key_serialization_version
+    )
+    OnlineStore.online_write_batch_serialized(store, config, FEATURE_VIEW, data)
+
+    assert store.rows == _convert_arrow_to_proto(TABLE, FEATURE_VIEW, join_keys)
+
+
+@mock_dynamodb
+@pytest.mark.parametrize("online_store_type", ["redis", "dynamodb"])
+def test_online_write_batch_serialized_keeps_the_latest_rows(
+    online_store_type, tmp_path
+):
+    # The latest row of driver 1 is neither its first nor its last one.
+    table = pa.table(
+        {
+            "driver_id": [1, 2, 1, 1],
+            "rating": [1.0, 3.0, 4.5, None],
+            "trips": [10, 20, 30, 40],
+            "city": ["Rome", "Oslo", "Paris", "Lima"],
+            "event_timestamp": pa.array(
+                [
+                    datetime(2022, 1, 1),
+                    datetime(2022, 1, 1),
+                    datetime(2022, 1, 2),
+                    datetime(2022, 1, 1),
+                ],
+                pa.timestamp("us"),
+            ),
+            "created": [datetime(2022, 1, 4)] * 4,
+        }
+    )
+    config, store = _online_store(online_store_type, tmp_path)
+    store.online_write_batch_serialized(
+        config,
+        FEATURE_VIEW,
+        _convert_arrow_to_serialized_rows(
+            table,
+            FEATURE_VIEW,
+            {"driver_id": ValueType.INT64},
+            config.entity_key_serialization_version,
+        ),
+    )
+
+    [(event_ts, values)] = store.online_read(
+        config,
+        FEATURE_VIEW,
+        [
+            EntityKeyProto(
+                join_keys=["driver_id"], entity_values=[ValueProto(int64_val=1)]
+            )
+        ],
+    )
+    assert event_ts.replace(tzinfo=None) == datetime(2022, 1, 2)
+    assert values == {
+        "rating": ValueProto(double_val=4.5),
+        "trips": ValueProto(int64_val=30),
+        "city": ValueProto(string_val="Paris"),
+    }
+
+
+@pytest.mark.parametrize(
+    "event_timestamps",
+    (
+        pa.array(
+            [datetime(2022, 1, 1, 11, tzinfo=timezone(timedelta(hours=1))), None],
+            pa.timestamp("ns", tz="+01:00"),
+        ),
+        pa.array(["2022-01-01T11:00:00+01:00", None]),
+        pa.array([datetime(2022, 1, 1, 10), None]),
+    ),
+)
+def test_convert_arrow_to_proto_returns_naive_utc_timestamps(event_timestamps):
+    table = TABLE.slice(0, 2).set_column(
+        TABLE.schema.get_field_index("event_timestamp"),
+        "event_timestamp",
+        event_timestamps,
+    )
+    rows = _convert_arrow_to_proto(table, FEATURE_VIEW, {"driver_id": ValueType.INT64})
+    # Columns with nulls are converted with pandas, and the others with Arrow.
+    rows_without_nulls = _convert_arrow_to_proto(
+        table.slice(0, 1), FEATURE_VIEW, {"driver_id": ValueType.INT64}
+    )
+
+    assert rows[0][2] == rows_without_nulls[0][2] == datetime(2022, 1, 1, 10)
+    assert rows[0][2].tzinfo is None
+    assert rows[0][3] == datetime(2022, 1, 4)
@@ -0,0 +1,202 @@
+import struct
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from types import SimpleNamespace
+
+import psycopg2
+import pytest
+from psycopg2.extensions import TRANSACTION_STATUS_IDLE
+
+from feast.infra.offline_stores.file import FileOfflineStoreConfig
+from feast.infra.online_stores.contrib.postgres import (
+    PostgreSQLOnlineStore,
+    PostgreSQLOnlineStoreConfig,
+    _Connection,
+    _to_copy_binary,
+    _values_to_record_batch,
+)
+from feast.protos.feast.types.EntityKey_pb2 import EntityKey as EntityKeyProto
+from feast.protos.feast.types.Value_pb2 import Value as ValueProto
+from feast.repo_config import RepoConfig
+
+ROWS = [
+    (
+        b"\x01\x02",
+        "rating",
+        b"\x11\x00\x00\x00\x00\x00\x00\x12@",
+        datetime(2022, 1, 1),
+        None,
+    ),
+    (
+        b"\x01\x02",
+        "city",
+        b"",
+        datetime(1999, 12, 31, 23, 59, 59, 999999),
+        datetime(2022, 1, 2),
+    ),
+    (b"", "trips", b"\x20\x0a", datetime(2022, 1, 3, 10), datetime(2000, 1, 1)),
+]
+
+
+def _copy_binary(rows) -> bytes:
+    """Encodes rows in the binary format of COPY, one field at a time."""
+    out = b"PGCOPY\n\xff\r\n\x00" + struct.pack("!ii", 0, 0)
+    for row in rows:
+        out += struct.pack("!h", len(row))
+        for value in row:
+            if value is None:
+                out += struct.pack("!i", -1)
+                continue
+            if isinstance(value, datetime):
+                delta = value - datetime(2000, 1, 1)
+                value = struct.pack(
+                    "!q",
+                    (delta.days * 86400 + delta.seconds) * 10**6 + delta.microseconds,
+                )
+            elif isinstance(value, str):
+                value = value.encode()
+            out += struct.pack("!i", len(value)) + value
+    return out + struct.pack("!h", -1)
+
+
+def test_to_copy_binary():
+    rows = _values_to_record_batch(ROWS)
+    assert _to_copy_binary(rows) == _copy_binary(ROWS)
+    # Slices of a batch are encoded from the offset of their columns.
+    assert _to_copy_binary(rows.slice(1, 2)) == _copy_binary(ROWS[1:])
+    assert _to_copy_binary(_values_to_record_batch([])) == _copy_binary([])
+
+
+class FakeCursor:
+    def __init__(self, conn):
+        self.conn = conn
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        pass
+
+    def execute(self, query, params=None):
+        if self.conn.dropped:
+            raise psycopg2.OperationalError("server closed the connection unexpectedly")
+        self.conn.queries.append(repr(query))
+        time.sleep(0.01)
+
+    def fetchall(self):
+        return []
+
+
+class FakeConnection:
+    def __init__(self, connection_factory=None, **kwargs):
+        assert connection_factory is _Connection
+        self.prepared_statements = set()
+        self.released_at = None
+        self.queries = []
+        self.closed = 0
+        self.dropped = False
+        self.info = SimpleNamespace(transaction_status=TRANSACTION_STATUS_IDLE)
+
+    def cursor(self):
+        return FakeCursor(self)
+
+    def rollback(self):
+        pass
+
+    def close(self):
+        self.closed = 1
+
+
+@pytest.fixture
+def connections(monkeypatch):
+    connections = []
+
+    def connect(**kwargs):
+        connections.append(FakeConnection(**kwargs))
+        return connections[-1]
+
+    monkeypatch.setattr(psycopg2, "connect", connect)
+    return connections
+
+
+def _repo_config(**online_store):
+    return RepoConfig(
+        registry="registry.db",
+        project="test_postgres",
+        provider="local",
+        online_store=PostgreSQLOnlineStoreConfig(
+            host="localhost",
+            database="feast",
+            user="feast",
+            password="feast",
+            conn_type="pool",
+            **{"min_conn": 2, "max_conn": 2, **online_store},
+        ),
+        offline_store=FileOfflineStoreConfig(),
+        entity_key_serialization_version=2,
+    )
+
+
+def _entity_key(driver_id: int) -> EntityKeyProto:
+    return EntityKeyProto(
+        join_keys=["driver_id"], entity_values=[ValueProto(int64_val=driver_id)]
+    )
+
+
+@pytest.mark.parametrize("prepared_statements", [True, False])
+def test_online_read_prepares_statements_once(connections, prepared_statements):
+    config = _repo_config(
+        min_conn=1, max_conn=1, prepared_statements=prepared_statements
+    )
+    store = PostgreSQLOnlineStore()
+    table = SimpleNamespace(name="driver_stats")
+    for requested_features in (None, ["rating"], None, ["rating", "trips"]):
+        assert store.online_read(
+            config, table, [_entity_key(1)], requested_features
+        ) == [(None, None)]
+
+    (conn,) = connections
+    if prepared_statements:
+        # A statement is prepared for reads of all the features, and one for reads of some of them.
+        assert sum("PREPARE" in query for query in conn.queries) == 2
+        assert sum("EXECUTE" in query for query in conn.queries) == 4
+        assert len(conn.prepared_statements) == 2
+    else:
+        assert not any(
+            "PREPARE" in query or "EXECUTE" in query for query in conn.queries
+        )
+
+
+def test_connection_pool_is_shared_by_threads(connections):
+    config = _repo_config()
+    store = PostgreSQLOnlineStore()
+    table = SimpleNamespace(name="driver_stats")
+
+    # More threads than connections wait for one to be returned to the pool.
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = executor.map(
+            lambda _: store.online_read(config, table, [_entity_key(1)]), range(16)
+        )
+        assert list(results) == [[(None, None)]] * 16
+    assert len(connections) == 2
+
+    # A connection which raised a connection error is closed and replaced.
+    with pytest.raises(psycopg2.OperationalError):
+        with store._get_conn(config):
+            raise psycopg2.OperationalError()
+    assert sum(conn.closed for conn in connections) == 1
+    # An idle connection closed by the server is replaced as well.
+    next(conn for conn in connections if not conn.closed).closed = 1
+    with store._get_conn(config) as conn, store._get_conn(config) as other_conn:
+        assert not conn.closed and not other_conn.closed
+    assert len(connections) == 4
+
+    # Connections idle for a while are checked before they are used, and replaced if the server dropped them.
+    dropped_conn, idle_conn = [conn for conn in connections if not conn.closed]
+    dropped_conn.dropped = True
+    dropped_conn.released_at = idle_conn.released_at = time.monotonic() - 60
+    with store._get_conn(config) as conn, store._get_conn(config) as other_conn:
+        assert {conn, other_conn} == {idle_conn, connections[-1]}
+    assert dropped_conn.closed
+    assert idle_conn.queries[-1] == repr("SELECT 1")
@@ -0,0 +1,126 @@
+import asyncio
+from dataclasses import dataclass
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+
+from feast.infra.offline_stores.file import FileOfflineStoreConfig
+from feast.infra.online_stores import redis
+from feast.infra.online_stores.redis import RedisOnlineStore, RedisOnlineStoreConfig
+from feast.protos.feast.types.EntityKey_pb2 import EntityKey as EntityKeyProto
+from feast.protos.feast.types.Value_pb2 import Value as ValueProto
+from feast.repo_config import RepoConfig
+from tests.utils.fake_redis import FakeAsyncRedis, FakeRedis
+
+
+@dataclass
+class MockFeatureView:
+    name: str
+
+
+@pytest.fixture
+def repo_config():
+    return RepoConfig(
+        registry="registry.db",
+        project="test_redis",
+        provider="local",
+        online_store=RedisOnlineStoreConfig(),
+        offline_store=FileOfflineStoreConfig(),
+        entity_key_serialization_version=2,
+    )
+
+
+def _entity_key(driver_id: int) -> EntityKeyProto:
+    return EntityKeyProto(
+        join_keys=["driver_id"], entity_values=[ValueProto(int64_val=driver_id)]
+    )
+
+
+def test_online_read_many_uses_one_hmget_per_entity(repo_config):
+    store = RedisOnlineStore()
+    client = FakeRedis()
+    store._client = client
+
+    stats = MockFeatureView(name="driver_stats")
+    locations = MockFeatureView(name="driver_locations")
+    for table, feature_name in ((stats, "rating"), (locations, "lat")):
+        store.online_write_batch(
+            repo_config,
+            table,
+            [
+                (
+                    _entity_key(driver_id),
+                    {feature_name: ValueProto(double_val=driver_id / 10)},
+                    datetime(2022, 1, driver_id),
+                    None,
+                )
+                for driver_id in (1, 2)
+            ],
+            progress=None,
+        )
+
+    entity_keys = [_entity_key(driver_id) for driver_id in (2, 3, 1)]
+    client.hmget_count = 0
+    results = store.online_read_many(
+        repo_config,
+        [(stats, entity_keys, ["rating"]), (locations, entity_keys, ["lat"])],
+    )
+    # Both feature views are read with a single HMGET per entity key.
+    assert client.hmget_count == len(entity_keys)
+
+    assert results == [
+        store.online_read(repo_config, stats, entity_keys, ["rating"]),
+        store.online_read(repo_config, locations, entity_keys, ["lat"]),
+    ]
+    assert [row[1]["lat"].double_val for row in results[1]] == [0.2, 0.0, 0.1]
+
+
+def test_online_read_async_opens_a_client_per_event_loop(repo_config, monkeypatch):
+    store = RedisOnlineStore()
+    store._client = FakeRedis()
+    clients = []
+
+    def connect(**kwargs):
+        clients.append(FakeAsyncRedis(store._client))
+        return clients[-1]
+
+    monkeypatch.setattr(redis, "redis_asyncio", SimpleNamespace(Redis=connect))
+
+    stats = MockFeatureView(name="driver_stats")
+    store.online_write_batch(
+        repo_config,
+        stats,
+        [
+            (
+                _entity_key(driver_id),
+                {"rating": ValueProto(double_val=driver_id / 10)},
+                datetime(2022, 1, driver_id),
+                None,
+            )
+            for driver_id in (1, 2)
+        ],
+        progress=None,
+    )
+    entity_keys = [_entity_key(driver_id) for driver_id in (2, 3, 1)]
+    expected = store.online_read(repo_config, stats, entity_keys, ["rating"])
+
+    async def read(close: bool):
+        results = await asyncio.gather(
+            *[
+                store.online_read_async(repo_config, stats, entity_keys, ["rating"])
+                for _ in range(3)
+            ]
+        )
+        if close:
+            await store.close_async()
+        return results
+
+    # Concurrent reads share the client of their event loop, which is closed with it.
+    assert asyncio.run(read(close=True)) == [expected] * 3
+    assert [client.closed for client in clients] == [True]
+
+    # Every event loop opens its own client, even if the client of a previous loop wasn't closed.
+    assert asyncio.run(read(close=False)) == [expected] * 3
+    assert asyncio.run(read(close=True)) == [expected] * 3
+    assert [client.closed for client in clients] == [True, False, True]
@@ -0,0 +1,92 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import List
+
+from feast.infra.offline_stores.file import FileOfflineStoreConfig
+from feast.infra.online_stores.sqlite import SqliteOnlineStore, SqliteOnlineStoreConfig
+from feast.protos.feast.types.EntityKey_pb2 import EntityKey as EntityKeyProto
+from feast.protos.feast.types.Value_pb2 import Value as ValueProto
+from feast.repo_config import RepoConfig
+
+
+@dataclass
+class MockFeatureView:
+    name: str
+
+
+def _entity_key(driver_id: int) -> EntityKeyProto:
+    return EntityKeyProto(
+        join_keys=["driver_id"], entity_values=[ValueProto(int64_val=driver_id)]
+    )
+
+
+def test_online_write_batch_upserts_in_batches(tmp_path):
+    config = RepoConfig(
+        registry=str(tmp_path / "registry.db"),
+        project="test_sqlite",
+        provider="local",
+        online_store=SqliteOnlineStoreConfig(
+            path=str(tmp_path / "online.db"), write_batch_size=2
+        ),
+        offline_store=FileOfflineStoreConfig(),
+        entity_key_serialization_version=2,
+    )
+    table = MockFeatureView(name="driver_stats")
+    store = SqliteOnlineStore()
+    store.update(config, [], [table], [], [], partial=False)
+    # The journal mode of the db is left as is by default.
+    assert store._get_conn(config).execute("PRAGMA journal_mode").fetchone() == (
+        "delete",
+    )
+
+    def write(rating: float, driver_ids):
+        progress: List[int] = []
+        store.online_write_batch(
+            config,
+            table,
+            [
+                (
+                    _entity_key(driver_id),
+                    {"rating": ValueProto(double_val=rating)},
+                    datetime(2022, 1, 1),
+                    None,
+                )
+                for driver_id in driver_ids
+            ],
+            progress=progress.append,
+        )
+        return progress
+
+    assert write(1.0, [1, 2, 3]) == [2, 1]
+    # Existing rows are updated in place, and new ones are inserted.
+    assert write(2.0, [2, 3, 4, 5, 6]) == [2, 2, 1]
+
+    result = store.online_read(
+        config, table, [_entity_key(driver_id) for driver_id in (1, 3, 6, 7)]
+    )
+    assert [row[1]["rating"].double_val if row[1] else None for row in result] == [
+        1.0,
+        2.0,
+        2.0,
+        None,
+    ]
+
+    store.teardown(config, [table], [])
+    assert list(tmp_path.glob("online.db*")) == []
+
+
+def test_journal_mode_and_synchronous(tmp_path):
+    config = RepoConfig(
+        registry=str(tmp_path / "registry.db"),
+        project="test_sqlite",
+        provider="local",
+        online_store=SqliteOnlineStoreConfig(
+            path=str(tmp_path / "online.db"), journal_mode="WAL", synchronous="NORMAL"
+        ),
+        offline_store=FileOfflineStoreConfig(),
+        entity_key_serialization_version=2,
+    )
+    conn = SqliteOnlineStore()._get_conn(config)
+    assert conn.execute("PRAGMA journal_mode").fetchone() == ("wal",)
+    # NORMAL is level 1.
+    assert conn.execute("PRAGMA synchronous").fetchone() == (1,)
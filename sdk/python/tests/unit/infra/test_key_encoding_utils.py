@@ -1,6 +1,13 @@
+import numpy as np
 import pytest
 
-from feast.infra.key_encoding_utils import serialize_entity_key
+from feast.infra.key_encoding_utils import (
+    EntityKeyCache,
+    deserialize_entity_key,
+    serialize_entity_key,
+    serialize_entity_keys,
+    serialize_entity_keys_bulk,
+)
 from feast.protos.feast.types.EntityKey_pb2 import EntityKey as EntityKeyProto
 from feast.protos.feast.types.Value_pb2 import Value as ValueProto
 
@@ -28,3 +35,114 @@ def test_serialize_entity_key():
                 join_keys=["user"], entity_values=[ValueProto(int64_val=int(2**31))]
             ),
         )
+
+
+ENTITY_KEYS = [
+    EntityKeyProto(
+        join_keys=["user", "city", "device"],
+        entity_values=[
+            ValueProto(int64_val=user),
+            ValueProto(string_val=city),
+            ValueProto(bytes_val=device),
+        ],
+    )
+    for user, city, device in [
+        (1, "Paris", b"\x00"),
+        (-2, "Zürich", b""),
+        (2**31 - 1, "", b"phone"),
+    ]
+]
+
+
+@pytest.mark.parametrize("entity_key_serialization_version", [1, 2])
+def test_serialize_entity_keys(entity_key_serialization_version):
+    expected = [
+        serialize_entity_key(entity_key, entity_key_serialization_version)
+        for entity_key in ENTITY_KEYS
+    ]
+    assert serialize_entity_keys(ENTITY_KEYS, entity_key_serialization_version) == (
+        expected
+    )
+
+    # Keys with different join keys are serialized one by one.
+    mixed_entity_keys = [
+        *ENTITY_KEYS,
+        EntityKeyProto(join_keys=["user"], entity_values=[ValueProto(int32_val=3)]),
+    ]
+    assert serialize_entity_keys(
+        mixed_entity_keys, entity_key_serialization_version
+    ) == [
+        serialize_entity_key(entity_key, entity_key_serialization_version)
+        for entity_key in mixed_entity_keys
+    ]
+
+
+@pytest.mark.parametrize("maxsize", [0, 2])
+def test_entity_key_cache(maxsize):
+    cache = EntityKeyCache()
+    for entity_key_serialization_version in (1, 2, 1):
+        expected = [
+            serialize_entity_key(entity_key, entity_key_serialization_version)
+            for entity_key in ENTITY_KEYS
+        ]
+        for _ in range(2):
+            assert (
+                cache.serialize(ENTITY_KEYS, entity_key_serialization_version, maxsize)
+                == expected
+            )
+        # The least recently used keys are evicted, and keys serialized with another version aren't reused.
+        assert len(cache._serialized_keys) == maxsize
+        assert set(cache._serialized_keys.values()) <= set(expected)
+
+
+@pytest.mark.parametrize("entity_key_serialization_version", [1, 2])
+def test_serialize_entity_keys_bulk_numpy_columns(entity_key_serialization_version):
+    columns = [
+        np.array([1, -2, 2**31 - 1]),
+        np.array(["Paris", "Zürich", ""], dtype=object),
+        np.array([b"\x00", b"", b"phone"], dtype=object),
+    ]
+    assert serialize_entity_keys_bulk(
+        ["user", "city", "device"], columns, entity_key_serialization_version
+    ) == [
+        serialize_entity_key(entity_key, entity_key_serialization_version)
+        for entity_key in ENTITY_KEYS
+    ]
+
+    # Fixed-width keys are laid out in a single buffer.
+    assert serialize_entity_keys_bulk(
+        ["user"], [np.array([7, 8], dtype=np.int32)], entity_key_serialization_version
+    ) == [
+        serialize_entity_key(
+            EntityKeyProto(join_keys=["user"], entity_values=[ValueProto(int32_val=i)]),
+            entity_key_serialization_version,
+        )
+        for i in (7, 8)
+    ]
+
+
+def test_serialize_entity_keys_bulk_out_of_range():
+    # The old serialization scheme can't represent int64 values beyond the int32 range.
+    with pytest.raises(BaseException):
+        serialize_entity_keys_bulk(["user"], [np.array([2**31])])
+    assert len(serialize_entity_keys_bulk(["user"], [np.array([2**31])], 2)) == 1
+
+
+@pytest.mark.parametrize("entity_key_serialization_version", [1, 2])
+def test_deserialize_entity_key(entity_key_serialization_version):
+    for entity_key in ENTITY_KEYS:
+        deserialized = deserialize_entity_key(
+            serialize_entity_key(entity_key, entity_key_serialization_version),
+            ["user", "city", "device"],
+        )
+        # The join keys are sorted, like in the serialized key.
+        assert list(deserialized.join_keys) == ["city", "device", "user"]
+        assert dict(zip(deserialized.join_keys, deserialized.entity_values)) == dict(
+            zip(entity_key.join_keys, entity_key.entity_values)
+        )
+
+    with pytest.raises(ValueError):
+        deserialize_entity_key(
+            serialize_entity_key(ENTITY_KEYS[0], entity_key_serialization_version),
+            ["user"],
+        )
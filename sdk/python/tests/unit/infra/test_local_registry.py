@@ -11,6 +11,7 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import time
 from datetime import timedelta
 from tempfile import mkstemp
 
@@ -23,6 +24,7 @@ from feast.aggregation import Aggregation
 from feast.data_format import AvroFormat, ParquetFormat
 from feast.data_source import KafkaSource
 from feast.entity import Entity
+from feast.errors import EntityNotFoundException
 from feast.feature_view import FeatureView
 from feast.field import Field
 from feast.infra.registry.registry import Registry
@@ -524,6 +526,84 @@ def test_commit():
         test_registry._get_registry_proto(project=project)
 
 
+def test_cached_lookups_use_registry_index(local_registry):
+    project = "project"
+    entity = Entity(name="driver_car_id", description="Car driver id")
+    local_registry.apply_entity(entity, project)
+
+    # Cached lookups return the same deserialized objects until the registry changes
+    entities = local_registry.list_entities(project, allow_cache=True)
+    assert len(entities) == 1
+    assert local_registry.list_entities(project, allow_cache=True)[0] is entities[0]
+    assert (
+        local_registry.get_entity("driver_car_id", project, allow_cache=True)
+        is entities[0]
+    )
+    assert local_registry.list_entities("other_project", allow_cache=True) == []
+    with pytest.raises(EntityNotFoundException):
+        local_registry.get_entity("missing", project, allow_cache=True)
+
+    # Applying an object invalidates the index
+    local_registry.apply_entity(
+        Entity(name="driver_car_id", description="Updated"), project
+    )
+    entity = local_registry.get_entity("driver_car_id", project, allow_cache=True)
+    assert entity is not entities[0]
+    assert entity.description == "Updated"
+
+    # As does refreshing the cached registry proto
+    local_registry.refresh(project)
+    assert (
+        local_registry.get_entity("driver_car_id", project, allow_cache=True)
+        is not entity
+    )
+
+    local_registry.teardown()
+
+
+def test_background_registry_refresh(mocker):
+    fd, registry_path = mkstemp()
+    project = "project"
+    writer = Registry(
+        project, RegistryConfig(path=registry_path, cache_ttl_seconds=600), None
+    )
+    writer.apply_entity(Entity(name="driver_car_id"), project)
+    assert writer.get_refresh_metrics() is None
+
+    reader = Registry(
+        project,
+        RegistryConfig(path=registry_path, cache_ttl_seconds=1, cache_mode="thread"),
+        None,
+    )
+    assert len(reader.list_entities(project, allow_cache=True)) == 1
+
+    # The refresher picks up changes without readers having to refresh the cache
+    writer.apply_entity(Entity(name="driver_id"), project)
+    reader_proto_get = mocker.spy(reader._registry_store, "get_registry_proto")
+    deadline = time.monotonic() + 10
+    while len(reader.list_entities(project, allow_cache=True)) != 2:
+        assert time.monotonic() < deadline
+        time.sleep(0.1)
+    assert reader_proto_get.call_count >= 1
+    metrics = reader.get_refresh_metrics()
+    assert metrics.refresh_count >= 1
+    assert metrics.refresh_failure_count == 0
+    assert metrics.last_refresh_duration_seconds is not None
+    assert metrics.snapshot_age_seconds is not None
+
+    # Failed refreshes are counted, and the last loaded state keeps being served
+    mocker.patch.object(
+        reader._registry_store, "get_registry_proto", side_effect=IOError
+    )
+    deadline = time.monotonic() + 10
+    while reader.get_refresh_metrics().refresh_failure_count == 0:
+        assert time.monotonic() < deadline
+        time.sleep(0.1)
+    assert len(reader.list_entities(project, allow_cache=True)) == 2
+
+    reader.teardown()
+
+
 def validate_project_uuid(project_uuid, test_registry):
     assert len(test_registry.cached_registry_proto.project_metadata) == 1
     project_metadata = test_registry.cached_registry_proto.project_metadata[0]
@@ -1,3 +1,4 @@
+import asyncio
 import os
 import time
 from datetime import datetime
@@ -8,6 +9,7 @@ from pandas.testing import assert_frame_equal
 
 from feast import FeatureStore, RepoConfig
 from feast.errors import FeatureViewNotFoundException
+from feast.online_response import ArrowOnlineResponse
 from feast.protos.feast.types.EntityKey_pb2 import EntityKey as EntityKeyProto
 from feast.protos.feast.types.Value_pb2 import Value as ValueProto
 from feast.repo_config import RegistryConfig
@@ -404,3 +406,286 @@ def test_online_to_df():
         ]
         expected_df = pd.DataFrame({k: reversed(v) for (k, v) in df_dict.items()})
         assert_frame_equal(result_df[ordered_column], expected_df)
+
+
+def test_online_retrieval_plan_cache(mocker):
+    """
+    Test that online retrieval plans are reused across requests and recompiled
+    once the registry cache changes.
+    """
+    runner = CliRunner()
+    with runner.local_repo(
+        get_example_repo("example_feature_repo_1.py"), "file"
+    ) as store:
+        driver_locations_fv = store.get_feature_view(name="driver_locations")
+        provider = store._get_provider()
+        provider.online_write_batch(
+            config=store.config,
+            table=driver_locations_fv,
+            data=[
+                (
+                    EntityKeyProto(
+                        join_keys=["driver_id"],
+                        entity_values=[ValueProto(int64_val=1)],
+                    ),
+                    {
+                        "lat": ValueProto(double_val=0.1),
+                        "lon": ValueProto(string_val="1.0"),
+                    },
+                    datetime.utcnow(),
+                    datetime.utcnow(),
+                )
+            ],
+            progress=None,
+        )
+
+        compile_spy = mocker.spy(store, "_compile_online_retrieval_plan")
+
+        def get_lon(full_feature_names=False):
+            return store.get_online_features(
+                features=["driver_locations:lon"],
+                entity_rows=[{"driver_id": 1}, {"driver_id": 2}],
+                full_feature_names=full_feature_names,
+            ).to_dict()
+
+        assert get_lon()["lon"] == ["1.0", None]
+        assert get_lon()["lon"] == ["1.0", None]
+        assert compile_spy.call_count == 1
+
+        # A different set of requested features needs its own plan.
+        assert get_lon(full_feature_names=True)["driver_locations__lon"] == [
+            "1.0",
+            None,
+        ]
+        assert compile_spy.call_count == 2
+
+        # Modifying the registry invalidates all plans.
+        store.apply([driver_locations_fv])
+        assert get_lon()["lon"] == ["1.0", None]
+        assert compile_spy.call_count == 3
+
+        # So does refreshing it.
+        store.refresh_registry()
+        assert get_lon()["lon"] == ["1.0", None]
+        assert compile_spy.call_count == 4
+
+        # Plans are not cached at all when the cache size is 0.
+        store.config.online_retrieval_plan_cache_size = 0
+        get_lon()
+        get_lon()
+        assert compile_spy.call_count == 6
+
+
+def test_online_arrow_output():
+    """
+    Test that retrieving online features as Arrow columns gives the same results
+    as retrieving them as Protobuf values.
+    """
+    runner = CliRunner()
+    with runner.local_repo(
+        get_example_repo("example_feature_repo_1.py"), "file"
+    ) as store:
+        driver_locations_fv = store.get_feature_view(name="driver_locations")
+        customer_profile_fv = store.get_feature_view(name="customer_profile")
+        provider = store._get_provider()
+        provider.online_write_batch(
+            config=store.config,
+            table=driver_locations_fv,
+            data=[
+                (
+                    EntityKeyProto(
+                        join_keys=["driver_id"],
+                        entity_values=[ValueProto(int64_val=d)],
+                    ),
+                    {
+                        "lat": ValueProto(double_val=d * 0.1),
+                        "lon": ValueProto(string_val=str(d)),
+                    },
+                    datetime(2022, 1, d),
+                    datetime.utcnow(),
+                )
+                for d in (1, 2)
+            ],
+            progress=None,
+        )
+        provider.online_write_batch(
+            config=store.config,
+            table=customer_profile_fv,
+            data=[
+                (
+                    EntityKeyProto(
+                        join_keys=["customer_id"],
+                        entity_values=[ValueProto(string_val="5")],
+                    ),
+                    {
+                        "avg_orders_day": ValueProto(float_val=1.0),
+                        "name": ValueProto(string_val="John"),
+                    },
+                    datetime(2022, 1, 3),
+                    datetime.utcnow(),
+                )
+            ],
+            progress=None,
+        )
+
+        features = [
+            "driver_locations:lon",
+            "driver_locations:lat",
+            "customer_profile:avg_orders_day",
+            "customer_profile:name",
+            "customer_profile:age",
+        ]
+        entity_rows = [
+            {"driver_id": 2, "customer_id": "5"},
+            {"driver_id": 1, "customer_id": "6"},
+            {"driver_id": 3, "customer_id": "5"},
+            {"driver_id": 2, "customer_id": "5"},
+        ]
+        for full_feature_names in (False, True):
+            proto_response = store.get_online_features(
+                features=features,
+                entity_rows=entity_rows,
+                full_feature_names=full_feature_names,
+            )
+            arrow_response = store.get_online_features(
+                features=features,
+                entity_rows=entity_rows,
+                full_feature_names=full_feature_names,
+                output="arrow",
+            )
+
+            assert arrow_response.to_dict(
+                include_event_timestamps=True
+            ) == proto_response.to_dict(include_event_timestamps=True)
+            assert arrow_response.proto == proto_response.proto
+            assert ArrowOnlineResponse.from_proto(proto_response.proto).to_dict(
+                include_event_timestamps=True
+            ) == proto_response.to_dict(include_event_timestamps=True)
+
+        result = arrow_response.to_arrow()
+        assert result.schema.names == list(proto_response.to_dict())
+        assert result.column("driver_locations__lat").to_pylist() == [
+            0.2,
+            0.1,
+            None,
+            0.2,
+        ]
+        assert arrow_response.to_numpy()["driver_id"].tolist() == [2, 1, 3, 2]
+        assert arrow_response.to_df()["customer_profile__name"].tolist() == [
+            "John",
+            None,
+            "John",
+            "John",
+        ]
+
+        with pytest.raises(ValueError):
+            store.get_online_features(
+                features=features, entity_rows=entity_rows, output="json"
+            )
+
+
+def test_online_async():
+    """
+    Test that retrieving online features asynchronously gives the same results as
+    retrieving them synchronously.
+    """
+    runner = CliRunner()
+    with runner.local_repo(
+        get_example_repo("example_feature_repo_1.py"), "file"
+    ) as store:
+        driver_locations_fv = store.get_feature_view(name="driver_locations")
+        customer_profile_fv = store.get_feature_view(name="customer_profile")
+        provider = store._get_provider()
+        provider.online_write_batch(
+            config=store.config,
+            table=driver_locations_fv,
+            data=[
+                (
+                    EntityKeyProto(
+                        join_keys=["driver_id"],
+                        entity_values=[ValueProto(int64_val=d)],
+                    ),
+                    {
+                        "lat": ValueProto(double_val=d * 0.1),
+                        "lon": ValueProto(string_val=str(d)),
+                    },
+                    datetime(2022, 1, d),
+                    datetime.utcnow(),
+                )
+                for d in (1, 2)
+            ],
+            progress=None,
+        )
+        provider.online_write_batch(
+            config=store.config,
+            table=customer_profile_fv,
+            data=[
+                (
+                    EntityKeyProto(
+                        join_keys=["customer_id"],
+                        entity_values=[ValueProto(string_val="5")],
+                    ),
+                    {
+                        "avg_orders_day": ValueProto(float_val=1.0),
+                        "name": ValueProto(string_val="John"),
+                    },
+                    datetime(2022, 1, 3),
+                    datetime.utcnow(),
+                )
+            ],
+            progress=None,
+        )
+
+        features = [
+            "driver_locations:lon",
+            "customer_profile:avg_orders_day",
+            "customer_profile:name",
+        ]
+        entity_rows = [
+            {"driver_id": 2, "customer_id": "5"},
+            {"driver_id": 1, "customer_id": "6"},
+            {"driver_id": 3, "customer_id": "5"},
+        ]
+        for output in ("proto", "arrow"):
+            sync_response = store.get_online_features(
+                features=features, entity_rows=entity_rows, output=output
+            )
+            async_response = asyncio.run(
+                store.get_online_features_async(
+                    features=features, entity_rows=entity_rows, output=output
+                )
+            )
+            assert async_response.proto == sync_response.proto
+            assert async_response.to_dict() == {
+                "driver_id": [2, 1, 3],
+                "customer_id": ["5", "6", "5"],
+                "lon": ["2", "1", None],
+                "avg_orders_day": [1.0, None, 1.0],
+                "name": ["John", None, "John"],
+            }
+
+        # Reading the feature views concurrently gives the same results, in the same order.
+        sequential_response = store.get_online_features(
+            features=features, entity_rows=entity_rows
+        )
+        store.config.online_read_concurrency = 4
+        concurrent_response = store.get_online_features(
+            features=features, entity_rows=entity_rows
+        )
+        assert store._online_read_executor is not None
+        assert concurrent_response.proto == sequential_response.proto
+
+        # The pool follows later changes of the concurrency, and is shut down by `close`.
+        executor = store._online_read_executor
+        store.config.online_read_concurrency = 2
+        assert (
+            store.get_online_features(features=features, entity_rows=entity_rows).proto
+            == sequential_response.proto
+        )
+        assert store._online_read_executor is not executor
+        assert store._online_read_executor._max_workers == 2
+        executor = store._online_read_executor
+        store.close()
+        assert store._online_read_executor is None
+        with pytest.raises(RuntimeError):
+            executor.submit(print)
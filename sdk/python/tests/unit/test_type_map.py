@@ -1,7 +1,11 @@
+from datetime import datetime
+
 import numpy as np
+import pyarrow as pa
 import pytest
 
 from feast.type_map import (
+    arrow_to_serialized_proto_values,
     feast_value_type_to_python_type,
     python_values_to_proto_values,
 )
@@ -48,3 +52,62 @@ def test_python_values_to_proto_values_bool(values):
     converted = feast_value_type_to_python_type(protos[0])
 
     assert converted is bool(values[0])
+
+
+@pytest.mark.parametrize(
+    "array,value_type",
+    (
+        (pa.array([0, 1, -1, 300, None, 2**31 - 1, -(2**31)]), ValueType.INT32),
+        (pa.array([0, 1, -1, 2**63 - 1, -(2**63)], pa.int64()), ValueType.INT64),
+        (pa.array([0, 127, 128, -300, None], pa.int16()), ValueType.INT64),
+        (pa.array([0.0, -1.5, None, float("nan"), 1e300]), ValueType.DOUBLE),
+        (pa.array([0.0, 1.25, None, float("nan")], pa.float32()), ValueType.FLOAT),
+        (pa.array([True, False, None]), ValueType.BOOL),
+        (pa.array(["", "a", None, "\u00e9" * 200]), ValueType.STRING),
+        (pa.array([b"", b"\x00\xff", None, b"x" * 300]), ValueType.BYTES),
+        (
+            pa.array([datetime(2022, 1, 1, 1, 2, 3, 456), datetime(1960, 1, 1)]),
+            ValueType.UNIX_TIMESTAMP,
+        ),
+        (pa.array([[1, 2], [], None]), ValueType.INT64_LIST),
+        (pa.chunked_array([[1.0, 2.0], [None]]), ValueType.DOUBLE),
+        (pa.array([], pa.float64()), ValueType.DOUBLE),
+    ),
+)
+def test_arrow_to_serialized_proto_values(array, value_type):
+    serialized = arrow_to_serialized_proto_values(array, value_type)
+
+    if isinstance(array, pa.ChunkedArray):
+        array = array.combine_chunks()
+    assert serialized == [
+        proto.SerializeToString()
+        for proto in python_values_to_proto_values(
+            array.to_numpy(zero_copy_only=False), value_type
+        )
+    ]
+
+
+@pytest.mark.parametrize(
+    "values,value_type",
+    (
+        (np.array([0, 1, -1, 2**40], dtype=np.int64), ValueType.INT64),
+        (np.array([0, 1, -1], dtype=np.int32), ValueType.INT32),
+        (np.array([0, 1, 255], dtype=np.uint8), ValueType.INT64),
+        (np.array([1.0, np.nan, 2.5, -3.75]), ValueType.INT64),
+        (np.array([1.5, np.nan, -0.0, 1e300]), ValueType.DOUBLE),
+        (np.array([1.5, np.nan, 0.1], dtype=np.float32), ValueType.FLOAT),
+        (np.array([0.1, 7.0]), ValueType.FLOAT),
+        (np.array([1, 2, 3]), ValueType.FLOAT),
+        (np.array([True, False]), ValueType.BOOL),
+        (np.array([True, False]), ValueType.INT64),
+        (
+            np.array(["2022-01-01T10:00:01.5", "NaT"], dtype="datetime64[ns]"),
+            ValueType.UNIX_TIMESTAMP,
+        ),
+    ),
+)
+def test_numpy_values_to_proto_values(values, value_type):
+    # Lists are converted value by value.
+    assert python_values_to_proto_values(
+        values, value_type
+    ) == python_values_to_proto_values(list(values), value_type)
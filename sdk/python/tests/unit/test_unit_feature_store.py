@@ -1,7 +1,10 @@
 from dataclasses import dataclass
 from typing import Dict, List
 
+import numpy as np
+
 from feast import FeatureStore
+from feast.feature_store import apply_list_mapping
 from feast.protos.feast.types.Value_pb2 import Value
 
 
@@ -47,4 +50,68 @@ def test_get_unique_entities():
         {"entity_1": Value(int64_val=1), "entity_2": Value(string_val="1")},
         {"entity_1": Value(int64_val=2), "entity_2": Value(string_val="2")},
     )
-    assert indexes == ([0, 2], [1])
+    assert indexes.tolist() == [0, 1, 0]
+
+    # Deduplicating on native values gives the same result
+    native_entity_values = {
+        "entity_1": [1, 2, 1],
+        "entity_2": ["1", "2", "1"],
+        "entity_3": [8, 9, 10],
+    }
+    native_unique_entities, native_indexes = FeatureStore._get_unique_entities(
+        FeatureStore,
+        table=fv,
+        join_key_values=entity_values,
+        entity_name_to_join_key_map=entity_name_to_join_key_map,
+        join_key_native_values=native_entity_values,
+    )
+    assert native_unique_entities == unique_entities
+    assert native_indexes.tolist() == indexes.tolist()
+
+
+def test_get_unique_entities_with_missing_values():
+    entity_values = {
+        "entity_1": [Value(), Value(int64_val=1), Value(), Value(int64_val=1)],
+        "entity_2": [
+            Value(string_val="1"),
+            Value(),
+            Value(string_val="1"),
+            Value(string_val="2"),
+        ],
+    }
+    native_entity_values = {
+        "entity_1": [None, 1, None, 1],
+        "entity_2": ["1", None, "1", "2"],
+    }
+    fv = MockFeatureView(
+        name="fv_1",
+        entities=["entity_1", "entity_2"],
+        projection=MockFeatureViewProjection(join_key_map={}),
+    )
+
+    for join_key_native_values in (None, native_entity_values):
+        unique_entities, indexes = FeatureStore._get_unique_entities(
+            FeatureStore,
+            table=fv,
+            join_key_values=entity_values,
+            entity_name_to_join_key_map={
+                "entity_1": "entity_1",
+                "entity_2": "entity_2",
+            },
+            join_key_native_values=join_key_native_values,
+        )
+        assert unique_entities == (
+            {"entity_1": Value(), "entity_2": Value(string_val="1")},
+            {"entity_1": Value(int64_val=1), "entity_2": Value()},
+            {"entity_1": Value(int64_val=1), "entity_2": Value(string_val="2")},
+        )
+        assert indexes.tolist() == [0, 1, 0, 2]
+
+
+def test_apply_list_mapping():
+    values = [Value(int64_val=1), Value(int64_val=2)]
+    assert apply_list_mapping(values, np.array([1, 0, 1])) == [
+        values[1],
+        values[0],
+        values[1],
+    ]
@@ -0,0 +1,107 @@
+import asyncio
+from collections import defaultdict
+from typing import Callable, Dict, List, Optional
+
+
+class FakeRedisPipeline:
+    """An in-memory stand-in for a non-transactional redis-py pipeline."""
+
+    def __init__(self, client: "FakeRedis"):
+        self.client = client
+        self.commands: List[Callable] = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+    def hmget(self, name, keys):
+        self.client.hmget_count += 1
+        self.commands.append(
+            lambda: [self.client.hashes[name].get(_as_bytes(key)) for key in keys]
+        )
+
+    def hset(self, name, mapping):
+        self.commands.append(
+            lambda: self.client.hashes[name].update(
+                {_as_bytes(key): value for key, value in mapping.items()}
+            )
+        )
+
+    def expire(self, name, time):
+        self.commands.append(lambda: True)
+
+    def delete(self, name):
+        self.commands.append(lambda: self.client.hashes.pop(name, None) is not None)
+
+    def execute(self):
+        results = [command() for command in self.commands]
+        self.commands = []
+        return results
+
+
+class FakeRedis:
+    """
+    An in-memory stand-in for the redis-py client, implementing the hash commands used by
+    RedisOnlineStore. It counts HMGET commands so that tests can check how reads are batched.
+    """
+
+    def __init__(self):
+        self.hashes: Dict[bytes, Dict[bytes, bytes]] = defaultdict(dict)
+        self.hmget_count = 0
+
+    def pipeline(self, transaction=True):
+        return FakeRedisPipeline(self)
+
+    def scan_iter(self, match):
+        prefix, _, suffix = match.partition(b"*")
+        return [
+            key
+            for key in list(self.hashes)
+            if key.startswith(prefix) and key.endswith(suffix)
+        ]
+
+
+class FakeAsyncRedisPipeline:
+    """An asyncio stand-in for a non-transactional redis-py pipeline."""
+
+    def __init__(self, pipeline: FakeRedisPipeline):
+        self.pipeline = pipeline
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        pass
+
+    def hmget(self, name, keys):
+        self.pipeline.hmget(name, keys)
+
+    async def execute(self):
+        return self.pipeline.execute()
+
+
+class FakeAsyncRedis:
+    """
+    An asyncio stand-in for the redis-py client, sharing the hashes of a FakeRedis. Like the real
+    client, it can only be used from the event loop which first used it, and not once closed.
+    """
+
+    def __init__(self, client: FakeRedis):
+        self.client = client
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self.closed = False
+
+    def pipeline(self, transaction=True):
+        assert not self.closed
+        assert self.loop in (None, asyncio.get_running_loop())
+        self.loop = asyncio.get_running_loop()
+        return FakeAsyncRedisPipeline(FakeRedisPipeline(self.client))
+
+    async def close(self):
+        self.closed = True
+
+
+def _as_bytes(key):
+    return key.encode() if isinstance(key, str) else key
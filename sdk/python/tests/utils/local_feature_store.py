@@ -0,0 +1,91 @@
+from dataclasses import dataclass, field
+from datetime import timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+import pandas as pd
+
+from feast import Entity, FeatureStore, FeatureView, Field, FileSource, RepoConfig
+from feast.infra.offline_stores.file import FileOfflineStoreConfig
+from feast.infra.online_stores.redis import RedisOnlineStoreConfig
+from feast.infra.online_stores.sqlite import SqliteOnlineStoreConfig
+from tests.utils.fake_redis import FakeRedis
+
+
+@dataclass
+class LocalFeatureView:
+    """
+    A feature view of a store built by `build_local_feature_store`, whose data is written to a parquet
+    file named after it, under the directory of the feature store.
+    """
+
+    name: str
+    data: pd.DataFrame
+    schema: List[Field]
+    ttl: timedelta = timedelta(days=1)
+    source_options: Dict[str, Any] = field(default_factory=dict)
+    """Arguments of the FileSource, on top of its path and of its `event_timestamp` timestamp field."""
+
+
+def build_local_feature_store(
+    path: Path,
+    project: str,
+    feature_views: List[LocalFeatureView],
+    online_store: str = "sqlite",
+    offline_store: Optional[Dict[str, Any]] = None,
+    **repo_config,
+) -> FeatureStore:
+    """
+    Builds a feature store over local files in the `path` directory, with the given feature views of a
+    `driver` entity applied.
+
+    Args:
+        path: The directory of the feature store, created if needed.
+        project: The project of the feature store.
+        feature_views: The feature views to apply.
+        online_store: `sqlite`, or `redis` for an in-memory fake Redis.
+        offline_store: The options of the file offline store.
+        repo_config: Any other RepoConfig arguments.
+    """
+    path.mkdir(parents=True, exist_ok=True)
+    online_store_config: Union[SqliteOnlineStoreConfig, RedisOnlineStoreConfig]
+    if online_store == "sqlite":
+        online_store_config = SqliteOnlineStoreConfig(path=str(path / "online.db"))
+    else:
+        online_store_config = RedisOnlineStoreConfig()
+    store = FeatureStore(
+        config=RepoConfig(
+            registry=str(path / "registry.db"),
+            project=project,
+            provider="local",
+            online_store=online_store_config,
+            offline_store=FileOfflineStoreConfig(**(offline_store or {})),
+            entity_key_serialization_version=2,
+            **repo_config,
+        )
+    )
+    if online_store == "redis":
+        store._get_provider().online_store._client = FakeRedis()
+
+    driver = Entity(name="driver", join_keys=["driver_id"])
+    objects: List[Any] = [driver]
+    for feature_view in feature_views:
+        data_path = path / f"{feature_view.name}.parquet"
+        feature_view.data.to_parquet(data_path)
+        objects.append(
+            FeatureView(
+                name=feature_view.name,
+                entities=[driver],
+                schema=feature_view.schema,
+                source=FileSource(
+                    path=str(data_path),
+                    **{
+                        "timestamp_field": "event_timestamp",
+                        **feature_view.source_options,
+                    },
+                ),
+                ttl=feature_view.ttl,
+            )
+        )
+    store.apply(objects)
+    return store
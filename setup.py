@@ -94,6 +94,9 @@ REDIS_REQUIRED = [
 
 AWS_REQUIRED = ["boto3>=1.17.0,<2", "docker>=5.0.2"]
 
+# aiobotocore pins botocore, so it is kept out of the aws extra.
+AWS_ASYNC_REQUIRED = ["aiobotocore>=2,<3"]
+
 BYTEWAX_REQUIRED = ["bytewax==0.15.1", "docker>=5.0.2", "kubernetes<=20.13.0"]
 
 SNOWFLAKE_REQUIRED = [
@@ -108,6 +111,7 @@ TRINO_REQUIRED = ["trino>=0.305.0,<0.400.0", "regex"]
 
 POSTGRES_REQUIRED = [
     "psycopg2-binary>=2.8.3,<3",
+    "psycopg[binary,pool]>=3,<4",
 ]
 
 MYSQL_REQUIRED = ["mysqlclient", "pymysql", "types-PyMySQL"]
@@ -334,6 +338,7 @@ setup(
         "ci": CI_REQUIRED,
         "gcp": GCP_REQUIRED,
         "aws": AWS_REQUIRED,
+        "aws-async": AWS_ASYNC_REQUIRED,
         "bytewax": BYTEWAX_REQUIRED,
         "redis": REDIS_REQUIRED,
         "snowflake": SNOWFLAKE_REQUIRED,